@@ -0,0 +1,95 @@
+"""Load test: many concurrent clients against a fake Hevy API.
+
+    python benchmarks/load.py --users 500 --duration 60
+    python benchmarks/load.py --mix browse=0.5,sync=0.3,write=0.2 --server-error 0.01
+    python benchmarks/load.py --url http://127.0.0.1:8080   # an already running server
+
+By default the fake server runs in its own process, so the reported RSS and
+CPU are the client's alone.
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+from hevy_api.testing.load import LoadTest
+from hevy_api.testing.server import Faults
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    return {
+        name: float(weight)
+        for name, weight in (part.split("=") for part in value.split(","))
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="target server, else a fake one is started")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--ramp-up", type=float, default=5.0)
+    parser.add_argument("--think-time", type=float, default=0.0)
+    parser.add_argument(
+        "--mix", type=parse_mix, default="browse=0.6,sync=0.3,write=0.1"
+    )
+    parser.add_argument("--max-retries", type=int, default=3)
+    parser.add_argument("--rate-limit", type=float, help="client-side, per user")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="write the report as JSON")
+    server_options = parser.add_argument_group("fake server")
+    server_options.add_argument("--workouts", type=int, default=1_000)
+    server_options.add_argument("--latency", type=float, default=0.0)
+    server_options.add_argument("--server-rate-limit", type=int)
+    for name, field in Faults.model_fields.items():
+        server_options.add_argument(
+            f"--{name.replace('_', '-')}", type=float, default=field.default
+        )
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        command = [
+            sys.executable,
+            "-m",
+            "hevy_api.testing",
+            f"--workouts={args.workouts}",
+            f"--seed={args.seed}",
+            f"--latency={args.latency}",
+            *(
+                f"--{name.replace('_', '-')}={getattr(args, name)}"
+                for name in Faults.model_fields
+            ),
+        ]
+        if args.server_rate_limit is not None:
+            command.append(f"--rate-limit={args.server_rate_limit}")
+        server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+        url = server.stdout.readline().strip()
+
+    try:
+        report = LoadTest(
+            url,
+            users=args.users,
+            duration=args.duration,
+            mix=args.mix,
+            ramp_up=args.ramp_up,
+            think_time=args.think_time,
+            seed=args.seed,
+            max_retries=args.max_retries,
+            rate_limit=args.rate_limit,
+        ).run()
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(report.format())
+    if args.output:
+        args.output.write_text(report.model_dump_json(indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""Client benchmarks against a local fake Hevy API, plus memory footprints.
+
+    python benchmarks/run.py                  # run, print and compare
+    python benchmarks/run.py --save           # also store as results/<version>.json
+    python benchmarks/run.py --baseline FILE  # compare against a given run
+
+The comparison fails (exit code 1) when a result is worse than the baseline by
+more than --tolerance, so it can gate a release.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from hevy_api import __version__
+from hevy_api.client import HevyClient
+from hevy_api.export import iter_workouts
+from hevy_api.models.response import WorkoutsResponse
+from hevy_api.testing import FakeHevyServer, SyntheticData
+from hevy_api.testing.memory import footprints
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def best_of(repeats: int, func: Callable[[], Any]) -> float:
+    # Fastest run, the one least disturbed by the rest of the machine
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def result(value: float, unit: str, higher_is_better: bool) -> dict[str, Any]:
+    return {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+
+
+def run(args: argparse.Namespace) -> dict[str, dict[str, Any]]:
+    data = SyntheticData(args.seed)
+    workouts = list(data.workouts(args.workouts))
+    ids = [workout["id"] for workout in workouts]
+    results = {}
+
+    with FakeHevyServer(workouts=workouts, latency=args.latency) as server:
+
+        def client() -> HevyClient:
+            return HevyClient(api_key="benchmark", base_url=server.url)
+
+        # Every call misses the cache: HTTP, JSON decode and validation
+        requests = min(args.requests, len(ids))
+
+        def fetch_all() -> None:
+            fresh = client()
+            for workout_id in ids[:requests]:
+                fresh.get_workout(workout_id)
+
+        elapsed = best_of(args.repeats, fetch_all)
+        results["end_to_end_requests_per_second"] = result(
+            requests / elapsed, "req/s", True
+        )
+
+        warm = client()
+        warm.get_workout(ids[0])
+        latencies = []
+        for _ in range(args.cache_hits):
+            started = time.perf_counter()
+            warm.get_workout(ids[0])
+            latencies.append(time.perf_counter() - started)
+        results["cache_hit_latency_us"] = result(
+            statistics.median(latencies) * 1e6, "us", False
+        )
+
+        elapsed = best_of(
+            args.repeats,
+            lambda: sum(1 for _ in iter_workouts(client(), args.page_size)),
+        )
+        results["pagination_workouts_per_second"] = result(
+            len(workouts) / elapsed, "workouts/s", True
+        )
+
+    # Validation alone, from an already decoded page
+    page = {"page": 1, "page_count": 1, "workouts": workouts[: args.page_size]}
+    elapsed = best_of(args.repeats, lambda: WorkoutsResponse(page, 200, {}))
+    results["parse_workouts_per_second"] = result(
+        len(page["workouts"]) / elapsed, "workouts/s", True
+    )
+    encoded = json.dumps(page).encode()
+    elapsed = best_of(args.repeats, lambda: json.loads(encoded))
+    results["json_decode_mb_per_second"] = result(
+        len(encoded) / elapsed / 1e6, "MB/s", True
+    )
+
+    # Retained bytes per item, see tests/test_memory.py for the hard limits
+    for name, size in footprints(seed=args.seed).items():
+        results[f"memory_{name}_bytes"] = result(size, "bytes", False)
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, Any]], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    regressions = []
+    for name, current in results.items():
+        previous = baseline["results"].get(name)
+        if previous is None or not previous["value"]:
+            continue
+        change = current["value"] / previous["value"] - 1
+        worse = -change if current["higher_is_better"] else change
+        marker = "REGRESSION" if worse > tolerance else ""
+        print(
+            f"{name:<44} {previous['value']:>12.1f} -> {current['value']:>12.1f}"
+            f" {current['unit']:<10} {change:+7.1%} {marker}"
+        )
+        if marker:
+            regressions.append(name)
+    return regressions
+
+
+def latest_baseline() -> Optional[Path]:
+    # Most recent stored run of another version
+    runs = [path for path in RESULTS_DIR.glob("*.json") if path.stem != __version__]
+    return max(runs, key=lambda path: path.stat().st_mtime, default=None)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workouts", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--cache-hits", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--save", action="store_true")
+    args = parser.parse_args()
+
+    results = run(args)
+    for name, current in results.items():
+        print(f"{name:<44} {current['value']:>12.1f} {current['unit']}")
+
+    report = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            name: value
+            for name, value in vars(args).items()
+            if name not in ("baseline", "tolerance", "save")
+        },
+        "results": results,
+    }
+    if args.save:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        path = RESULTS_DIR / f"{__version__}.json"
+        path.write_text(json.dumps(report, indent=2, default=str) + "\n")
+        print(f"Saved {path}")
+
+    baseline_path = args.baseline or latest_baseline()
+    if baseline_path is None:
+        return 0
+    print(f"\nCompared with {baseline_path}")
+    baseline = json.loads(baseline_path.read_text())
+    if baseline.get("config") != report["config"]:
+        print("Warning: the baseline was run with a different configuration")
+    return 1 if compare(results, baseline, args.tolerance) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,11 +4,53 @@ __version__ = "0.1.0"
 
 # Import main client class
 from . import models
+from .analytics import MuscleGroupStats, muscle_group_summary
+from .archive import WorkoutArchive
+from .catalog import ExerciseTemplateCatalog
 from .client import HevyClient
+from .columnar import write_csv, write_npz
+from .export import export_users, export_workouts, iter_workouts
+from .mirror import LocalMirror
+from .outbox import Outbox
+from .profiling import Profiler
+from .prometheus import MetricsRegistry
+from .records import PersonalRecords
+from .sync import (
+    Watermarks,
+    WorkoutEventSync,
+    sync_routines_since,
+    sync_workouts_since,
+)
+from .tracing import InMemoryExporter, JsonLinesExporter, Tracer
 
 __all__ = [
     # Client
     "HevyClient",
+    "ExerciseTemplateCatalog",
+    "LocalMirror",
+    "WorkoutArchive",
+    "Outbox",
+    # Sync
+    "Watermarks",
+    "WorkoutEventSync",
+    "sync_routines_since",
+    "sync_workouts_since",
+    # Export
+    "export_users",
+    "export_workouts",
+    "iter_workouts",
+    "write_csv",
+    "write_npz",
+    # Analytics
+    "MuscleGroupStats",
+    "PersonalRecords",
+    "muscle_group_summary",
+    # Observability
+    "MetricsRegistry",
+    "Tracer",
+    "InMemoryExporter",
+    "JsonLinesExporter",
+    "Profiler",
     # Models
     "models",
     # Version
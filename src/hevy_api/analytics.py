@@ -0,0 +1,66 @@
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from hevy_api.catalog import ExerciseTemplateCatalog
+from hevy_api.models.model import Workout
+
+# Bucket for exercises whose template is missing from the catalog
+UNKNOWN_MUSCLE_GROUP = "unknown"
+
+
+class MuscleGroupStats(BaseModel):
+    muscle_group: str
+    sets: int = 0
+    secondary_sets: int = 0
+    volume_kg: float = 0.0
+    # Number of workouts that trained this muscle group as a primary mover
+    frequency: int = 0
+
+
+def muscle_group_summary(
+    workouts: Iterable[Workout],
+    catalog: ExerciseTemplateCatalog,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> dict[str, MuscleGroupStats]:
+    stats: dict[str, MuscleGroupStats] = {}
+
+    def group(muscle_group: str) -> MuscleGroupStats:
+        if muscle_group not in stats:
+            stats[muscle_group] = MuscleGroupStats(muscle_group=muscle_group)
+        return stats[muscle_group]
+
+    for workout in workouts:
+        if start is not None and workout.start_time < start:
+            continue
+        if end is not None and workout.start_time >= end:
+            continue
+
+        trained: set[str] = set()
+        for exercise in workout.exercises:
+            template = catalog.get(exercise.exercise_template_id)
+            primary = template.primary_muscle_group if template else None
+            primary = primary or UNKNOWN_MUSCLE_GROUP
+            secondary = template.secondary_muscle_groups if template else []
+
+            # Warm-up sets are not working sets
+            working_sets = [s for s in exercise.sets if s.type != "warmup"]
+            if not working_sets:
+                continue
+
+            primary_stats = group(primary)
+            primary_stats.sets += len(working_sets)
+            primary_stats.volume_kg += sum(
+                (s.weight_kg or 0.0) * (s.reps or 0) for s in working_sets
+            )
+            trained.add(primary)
+            for muscle_group in secondary:
+                group(muscle_group).secondary_sets += len(working_sets)
+
+        for muscle_group in trained:
+            stats[muscle_group].frequency += 1
+
+    return stats
@@ -0,0 +1,263 @@
+import json
+import mmap
+import os
+import struct
+import threading
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+
+from hevy_api.models.model import Workout
+from hevy_api.storage import atomic_write
+
+# Data file layout: MAGIC, an 8 byte generation, then records made of a
+# (kind, payload length) header followed by the payload. Workout payloads are
+# compact JSON, tombstones are the deleted ID.
+MAGIC = b"HEVYWA01"
+_GENERATION_SIZE = 8
+_DATA_START = len(MAGIC) + _GENERATION_SIZE
+_RECORD = struct.Struct("<BI")
+WORKOUT_RECORD = 1
+TOMBSTONE_RECORD = 2
+
+
+class _Entry(NamedTuple):
+    offset: int
+    length: int
+    # None marks a tombstone in the index file
+    start_time: Optional[float]
+
+
+class WorkoutArchive:
+    # Append-only store: updates and deletions are new records, the offset
+    # index always points at the latest one and compact() drops the rest
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.index_path = self.path.with_name(f"{self.path.name}.idx")
+        self._lock = threading.RLock()
+        self._entries: dict[str, _Entry] = {}
+        # (start_time, id) pairs kept sorted for date range lookups
+        self._by_start_time: list[tuple[float, str]] = []
+        self._open()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            self._writer.close()
+            self._reader.close()
+
+    # Writes
+    def add_workout(self, workout: Workout) -> None:
+        self.add_workouts([workout])
+
+    def add_workouts(self, workouts: Iterable[Workout]) -> None:
+        with self._lock:
+            lines = []
+            for workout in workouts:
+                payload = workout.model_dump_json(exclude_none=True).encode()
+                offset = self._append(WORKOUT_RECORD, payload)
+                entry = _Entry(offset, len(payload), workout.start_time.timestamp())
+                self._index(workout.id, entry)
+                lines.append(_index_line(workout.id, entry))
+            self._commit(lines)
+
+    def remove_workout(self, workout_id: str) -> bool:
+        with self._lock:
+            if workout_id not in self._entries:
+                return False
+            payload = workout_id.encode()
+            offset = self._append(TOMBSTONE_RECORD, payload)
+            self._unindex(workout_id)
+            self._commit([_index_line(workout_id, _Entry(offset, len(payload), None))])
+            return True
+
+    # Reads
+    def get_workout(self, workout_id: str) -> Optional[Workout]:
+        with self._lock:
+            entry = self._entries.get(workout_id)
+            return None if entry is None else self._read(entry)
+
+    def workouts(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> list[Workout]:
+        # Newest first like the API, start is inclusive and end exclusive
+        with self._lock:
+            low = 0
+            if start is not None:
+                low = bisect_left(self._by_start_time, (start.timestamp(),))
+            high = len(self._by_start_time)
+            if end is not None:
+                high = bisect_left(self._by_start_time, (end.timestamp(),))
+            keys = self._by_start_time[low:high][::-1][:limit]
+            return [self._read(self._entries[workout_id]) for _, workout_id in keys]
+
+    @property
+    def reclaimable_bytes(self) -> int:
+        # Space held by superseded records and tombstones
+        with self._lock:
+            live = sum(_RECORD.size + entry.length for entry in self._entries.values())
+            return self._size - _DATA_START - live
+
+    def compact(self) -> int:
+        # Rewrites the live records in start time order, so date ranges are
+        # read sequentially, and returns the number of bytes reclaimed
+        with self._lock:
+            size_before = self._size
+            generation = os.urandom(_GENERATION_SIZE)
+            entries: dict[str, _Entry] = {}
+            compact_path = self.path.with_name(f"{self.path.name}.compact")
+            with open(compact_path, "wb") as file:
+                file.write(MAGIC + generation)
+                for start_time, workout_id in self._by_start_time:
+                    payload = self._payload(self._entries[workout_id])
+                    entries[workout_id] = _Entry(file.tell(), len(payload), start_time)
+                    file.write(_RECORD.pack(WORKOUT_RECORD, len(payload)) + payload)
+                end = file.tell()
+                file.flush()
+                os.fsync(file.fileno())
+
+            # The index carries the generation, so if we crash between the two
+            # replaces the stale index is detected and rebuilt from the data
+            self.close()
+            os.replace(compact_path, self.path)
+            atomic_write(self.index_path, _index_file(generation, entries, end))
+            self._open()
+            return size_before - self._size
+
+    def _open(self) -> None:
+        if not self.path.exists() or self.path.stat().st_size < _DATA_START:
+            generation = os.urandom(_GENERATION_SIZE)
+            atomic_write(self.path, MAGIC + generation)
+            atomic_write(self.index_path, _index_file(generation, {}, _DATA_START))
+
+        self._reader = open(self.path, "rb")  # noqa: SIM115
+        header = self._reader.read(_DATA_START)
+        if header[: len(MAGIC)] != MAGIC:
+            self._reader.close()
+            raise ValueError(f"{self.path} is not a workout archive")
+        self._generation = header[len(MAGIC) :]
+        self._mmap: Optional[mmap.mmap] = None
+        self._size = os.fstat(self._reader.fileno()).st_size
+
+        self._entries.clear()
+        self._by_start_time.clear()
+        indexed_end = self._load_index()
+        recovered_end = self._scan(indexed_end)
+        if recovered_end != self._size or indexed_end != self._size:
+            # Drop a torn trailing record, then persist what the scan found
+            os.truncate(self.path, recovered_end)
+            self._size = recovered_end
+            atomic_write(
+                self.index_path,
+                _index_file(self._generation, self._entries, recovered_end),
+            )
+        self._writer = open(self.path, "ab")  # noqa: SIM115
+
+    def _load_index(self) -> int:
+        # Returns the end of the data the index covers
+        try:
+            lines = self.index_path.read_bytes().split(b"\n")
+        except FileNotFoundError:
+            return _DATA_START
+        try:
+            header = json.loads(lines[0])
+        except ValueError:
+            return _DATA_START
+        if header.get("generation") != self._generation.hex():
+            return _DATA_START
+
+        end = header["end"]
+        for line in lines[1:]:
+            try:
+                workout_id, offset, length, start_time = json.loads(line)
+            except ValueError:
+                # A torn last line, the data scan picks up from here
+                break
+            if start_time is None:
+                self._unindex(workout_id)
+            else:
+                self._index(workout_id, _Entry(offset, length, start_time))
+            end = max(end, offset + _RECORD.size + length)
+        return min(end, self._size)
+
+    def _scan(self, offset: int) -> int:
+        # Indexes records the index file never heard about, returns where the
+        # last complete record ends
+        self._reader.seek(offset)
+        while offset + _RECORD.size <= self._size:
+            kind, length = _RECORD.unpack(self._reader.read(_RECORD.size))
+            payload = self._reader.read(length)
+            if len(payload) < length:
+                break
+            if kind == WORKOUT_RECORD:
+                workout = Workout.model_validate_json(payload)
+                start_time = workout.start_time.timestamp()
+                self._index(workout.id, _Entry(offset, length, start_time))
+            else:
+                self._unindex(payload.decode())
+            offset += _RECORD.size + length
+        return offset
+
+    def _append(self, kind: int, payload: bytes) -> int:
+        offset = self._size
+        self._writer.write(_RECORD.pack(kind, len(payload)) + payload)
+        self._size += _RECORD.size + len(payload)
+        return offset
+
+    def _commit(self, lines: list[bytes]) -> None:
+        # Data reaches the disk before the index entries that point into it
+        self._writer.flush()
+        os.fsync(self._writer.fileno())
+        with open(self.index_path, "ab") as index:
+            index.write(b"".join(lines))
+
+    def _payload(self, entry: _Entry) -> bytes:
+        start = entry.offset + _RECORD.size
+        if self._mmap is None or len(self._mmap) < start + entry.length:
+            # The file grew since it was mapped
+            self._writer.flush()
+            if self._mmap is not None:
+                self._mmap.close()
+            self._mmap = mmap.mmap(self._reader.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap[start : start + entry.length]
+
+    def _read(self, entry: _Entry) -> Workout:
+        return Workout.model_validate_json(self._payload(entry))
+
+    def _index(self, workout_id: str, entry: _Entry) -> None:
+        self._unindex(workout_id)
+        self._entries[workout_id] = entry
+        insort(self._by_start_time, (entry.start_time, workout_id))
+
+    def _unindex(self, workout_id: str) -> None:
+        entry = self._entries.pop(workout_id, None)
+        if entry is not None:
+            position = bisect_left(self._by_start_time, (entry.start_time, workout_id))
+            del self._by_start_time[position]
+
+    def __contains__(self, workout_id: object) -> bool:
+        return workout_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _index_line(workout_id: str, entry: _Entry) -> bytes:
+    return json.dumps([workout_id, *entry]).encode() + b"\n"
+
+
+def _index_file(generation: bytes, entries: dict[str, _Entry], end: int) -> bytes:
+    header = {"generation": generation.hex(), "end": end}
+    return b"".join(
+        [
+            json.dumps(header).encode() + b"\n",
+            *(_index_line(workout_id, entry) for workout_id, entry in entries.items()),
+        ]
+    )
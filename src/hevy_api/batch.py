@@ -0,0 +1,51 @@
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generic, TypeVar
+
+from hevy_api.models.base import BaseResponse
+from hevy_api.tracing import in_current_context
+
+T = TypeVar("T")
+R = TypeVar("R", bound=BaseResponse)
+
+
+class BatchResult(Generic[T, R]):
+    # Responses line up with the submitted items, in input order
+    def __init__(self, items: list[T], responses: list[R]):
+        self.items = items
+        self.responses = responses
+
+    @property
+    def succeeded(self) -> list[T]:
+        return [item for item, response in self if response.is_success]
+
+    @property
+    def failed(self) -> list[T]:
+        # Pass these back to the same batch call to retry only the failures
+        return [item for item, response in self if response.is_error]
+
+    @property
+    def skipped(self) -> int:
+        # Updates that were not sent because nothing changed
+        return sum(response.status_code == 304 for response in self.responses)
+
+    @property
+    def is_success(self) -> bool:
+        return all(response.is_success for response in self.responses)
+
+    def __iter__(self) -> Iterator[tuple[T, R]]:
+        return zip(self.items, self.responses, strict=True)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def run_batch(
+    submit: Callable[[T], R], items: Iterable[T], max_workers: int
+) -> BatchResult[T, R]:
+    items = list(items)
+    if not items:
+        return BatchResult([], [])
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        responses = pool.map(in_current_context(submit), items)
+        return BatchResult(items, list(responses))
@@ -0,0 +1,124 @@
+import sys
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from typing import Any, Optional
+
+from cachetools import TTLCache
+from pydantic import BaseModel
+
+
+class CacheTypeStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    # Misses answered by the local mirror instead of the API
+    mirror_hits: int = 0
+    # Responses served from fallback data while the API was unavailable
+    stale_hits: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+    bytes_per_entry: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CacheStats(BaseModel):
+    maxsize: int
+    ttl: float
+    size: int
+    # Keyed by response type, e.g. "WorkoutResponse"
+    types: dict[str, CacheTypeStats]
+
+    @property
+    def hits(self) -> int:
+        return sum(stats.hits for stats in self.types.values())
+
+    @property
+    def misses(self) -> int:
+        return sum(stats.misses for stats in self.types.values())
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def estimated_bytes(self) -> int:
+        return sum(stats.size * stats.bytes_per_entry for stats in self.types.values())
+
+
+class StatsTTLCache(TTLCache):
+    # TTLCache that counts evictions and expirations by the type of the
+    # cached value; hits and misses are recorded by the caller, which knows
+    # what type it was looking for
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(maxsize=maxsize, ttl=ttl, timer=timer)
+        self.counters: defaultdict[str, Counter[str]] = defaultdict(Counter)
+
+    def record(self, type_name: str, event: str) -> None:
+        self.counters[type_name][event] += 1
+
+    def popitem(self) -> tuple[Any, Any]:
+        key, value = super().popitem()
+        self.record(type(value).__name__, "evictions")
+        return key, value
+
+    def expire(self, time: Optional[float] = None) -> list[tuple[Any, Any]]:
+        expired = super().expire(time)
+        for _, value in expired:
+            self.record(type(value).__name__, "expirations")
+        return expired
+
+    def stats(self, sizes: bool = True) -> CacheStats:
+        # Measuring entries walks every cached object, leave bytes_per_entry
+        # at 0 when sizes is off to keep frequent polling cheap
+        self.expire()
+        entries: defaultdict[str, list[Any]] = defaultdict(list)
+        for value in self.values():
+            entries[type(value).__name__].append(value)
+
+        types = {}
+        for type_name in sorted(self.counters.keys() | entries.keys()):
+            values = entries.get(type_name, [])
+            types[type_name] = CacheTypeStats(
+                **self.counters.get(type_name, {}),
+                size=len(values),
+                bytes_per_entry=(
+                    sum(deep_sizeof(value) for value in values) // len(values)
+                    if values and sizes
+                    else 0
+                ),
+            )
+        return CacheStats(
+            maxsize=int(self.maxsize), ttl=self.ttl, size=len(self), types=types
+        )
+
+
+def deep_sizeof(value: Any, seen: Optional[set[int]] = None) -> int:
+    # Rough memory footprint: the object plus everything it references, each
+    # shared object counted once
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += deep_sizeof(vars(value), seen)
+    return size
@@ -0,0 +1,313 @@
+import gzip
+import json
+import re
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from heapq import nsmallest
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+from hevy_api.models.model import ExerciseTemplate, Routine, Workout
+from hevy_api.models.request import GetExerciseTemplates
+from hevy_api.models.response import ExerciseTemplatesResponse
+from hevy_api.storage import atomic_write
+from hevy_api.tracing import in_current_context, start_span
+
+if TYPE_CHECKING:
+    from hevy_api.client import HevyClient
+
+_NON_ALPHANUMERIC = re.compile(r"[^0-9a-z]+")
+
+# Bump whenever the snapshot layout changes, older snapshots are then ignored
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FIELDS = list(ExerciseTemplate.model_fields)
+
+
+def normalize_title(title: str) -> str:
+    return _NON_ALPHANUMERIC.sub(" ", title.lower()).strip()
+
+
+def trigrams(text: str) -> set[str]:
+    # Pad so that short words and word boundaries still produce trigrams
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class ExerciseTemplateCatalog:
+    # The API serves at most 100 exercise templates per page
+    max_page_size: int = 100
+    # Minimum trigram similarity for a fuzzy title match
+    min_similarity: float = 0.3
+
+    def __init__(self, templates: Iterable[ExerciseTemplate] = ()):
+        self._by_id: dict[str, ExerciseTemplate] = {}
+        self._by_muscle_group: dict[str, set[str]] = defaultdict(set)
+        self._by_secondary_muscle_group: dict[str, set[str]] = defaultdict(set)
+        self._by_type: dict[str, set[str]] = defaultdict(set)
+        self._custom: set[str] = set()
+        # Title indexes: sorted (word, id) pairs for prefix lookups with bisect,
+        # and trigram postings for typo-tolerant matching
+        self._titles: dict[str, str] = {}
+        self._words: list[tuple[str, str]] = []
+        self._trigrams: dict[str, set[str]] = defaultdict(set)
+        self._trigram_counts: dict[str, int] = {}
+        for template in templates:
+            self.add(template)
+
+    @classmethod
+    def load(
+        cls,
+        client: "HevyClient",
+        max_workers: int = 8,
+        snapshot: Optional[Union[str, Path]] = None,
+        max_age: Optional[timedelta] = None,
+    ) -> "ExerciseTemplateCatalog":
+        # Built-in templates come from the snapshot when there is a usable one,
+        # custom templates are then pulled in on demand with fetch_missing
+        if snapshot is not None:
+            catalog = cls.from_snapshot(snapshot, max_age=max_age)
+            if catalog is not None:
+                return catalog
+
+        catalog = cls()
+        catalog.refresh(client, max_workers=max_workers)
+        if snapshot is not None:
+            catalog.save_snapshot(snapshot)
+        return catalog
+
+    @classmethod
+    def from_snapshot(
+        cls, path: Union[str, Path], max_age: Optional[timedelta] = None
+    ) -> Optional["ExerciseTemplateCatalog"]:
+        try:
+            payload = json.loads(gzip.decompress(Path(path).read_bytes()))
+        except (OSError, EOFError, ValueError):
+            return None
+
+        try:
+            if (
+                payload.get("version") != SNAPSHOT_VERSION
+                or payload.get("fields") != SNAPSHOT_FIELDS
+            ):
+                return None
+            created_at = datetime.fromisoformat(payload["created_at"])
+            age = datetime.now(timezone.utc) - created_at
+            if max_age is not None and age > max_age:
+                return None
+
+            # We wrote these rows ourselves, so skip pydantic validation
+            templates = [
+                ExerciseTemplate.model_construct(
+                    **dict(zip(SNAPSHOT_FIELDS, row, strict=True))
+                )
+                for row in payload["templates"]
+            ]
+        except (AttributeError, KeyError, TypeError, ValueError):
+            # Not an object, no usable created_at, or rows that don't fit
+            return None
+        return cls(templates)
+
+    def save_snapshot(
+        self, path: Union[str, Path], include_custom: bool = False
+    ) -> None:
+        # Custom templates are per-account, so they stay out of shared snapshots
+        rows = [
+            [getattr(template, field) for field in SNAPSHOT_FIELDS]
+            for template in sorted(self, key=lambda t: t.id)
+            if include_custom or not template.is_custom
+        ]
+        payload = {
+            "version": SNAPSHOT_VERSION,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "fields": SNAPSHOT_FIELDS,
+            "templates": rows,
+        }
+        data = json.dumps(payload, separators=(",", ":")).encode()
+        atomic_write(path, gzip.compress(data, mtime=0))
+
+    def fetch_missing(
+        self, client: "HevyClient", ids: Iterable[str], max_workers: int = 8
+    ) -> list[str]:
+        # Returns the IDs that could not be fetched
+        missing = [template_id for template_id in ids if template_id not in self]
+        for template in client.resolve_template_ids(missing, max_workers).values():
+            self.add(template)
+        return sorted(set(missing) - self._by_id.keys())
+
+    def resolve(
+        self,
+        client: "HevyClient",
+        workouts: Iterable[Union[Workout, Routine]],
+        max_workers: int = 8,
+    ) -> dict[str, ExerciseTemplate]:
+        ids = {
+            exercise.exercise_template_id
+            for workout in workouts
+            for exercise in workout.exercises
+        }
+        self.fetch_missing(client, ids, max_workers=max_workers)
+        return {i: self._by_id[i] for i in ids if i in self._by_id}
+
+    def refresh(self, client: "HevyClient", max_workers: int = 8) -> int:
+        # Re-fetch every page and only re-index templates that actually changed.
+        # All pages are in before anything changes, so a failed page leaves
+        # the catalog as it was instead of dropping that page's templates.
+        templates = self._fetch_all(client, max_workers)
+        fetched: set[str] = set()
+        changed = 0
+        for template in templates:
+            fetched.add(template.id)
+            if self._by_id.get(template.id) != template:
+                self.add(template)
+                changed += 1
+        for template_id in self._by_id.keys() - fetched:
+            self.remove(template_id)
+            changed += 1
+        return changed
+
+    def add(self, template: ExerciseTemplate) -> None:
+        if template.id in self._by_id:
+            self.remove(template.id)
+
+        self._by_id[template.id] = template
+        self._by_muscle_group[template.primary_muscle_group].add(template.id)
+        for muscle_group in template.secondary_muscle_groups:
+            self._by_secondary_muscle_group[muscle_group].add(template.id)
+        self._by_type[template.type].add(template.id)
+        if template.is_custom:
+            self._custom.add(template.id)
+
+        title = normalize_title(template.title)
+        self._titles[template.id] = title
+        for word in set(title.split()):
+            insort(self._words, (word, template.id))
+        title_trigrams = trigrams(title)
+        for trigram in title_trigrams:
+            self._trigrams[trigram].add(template.id)
+        self._trigram_counts[template.id] = len(title_trigrams)
+
+    def remove(self, exercise_template_id: str) -> Optional[ExerciseTemplate]:
+        template = self._by_id.pop(exercise_template_id, None)
+        if template is None:
+            return None
+
+        self._by_muscle_group[template.primary_muscle_group].discard(template.id)
+        for muscle_group in template.secondary_muscle_groups:
+            self._by_secondary_muscle_group[muscle_group].discard(template.id)
+        self._by_type[template.type].discard(template.id)
+        self._custom.discard(template.id)
+
+        title = self._titles.pop(template.id)
+        for word in set(title.split()):
+            del self._words[bisect_left(self._words, (word, template.id))]
+        for trigram in trigrams(title):
+            self._trigrams[trigram].discard(template.id)
+        del self._trigram_counts[template.id]
+        return template
+
+    def get(self, exercise_template_id: str) -> Optional[ExerciseTemplate]:
+        return self._by_id.get(exercise_template_id)
+
+    def by_muscle_group(
+        self, muscle_group: str, include_secondary: bool = False
+    ) -> list[ExerciseTemplate]:
+        ids = set(self._by_muscle_group.get(muscle_group, ()))
+        if include_secondary:
+            ids |= self._by_secondary_muscle_group.get(muscle_group, set())
+        return self._templates(ids)
+
+    def by_type(self, type: str) -> list[ExerciseTemplate]:
+        return self._templates(self._by_type.get(type, set()))
+
+    def custom(self) -> list[ExerciseTemplate]:
+        return self._templates(self._custom)
+
+    def search(
+        self, query: str, limit: int = 10, fuzzy: bool = True
+    ) -> list[ExerciseTemplate]:
+        query = normalize_title(query)
+        if not query:
+            return []
+
+        # Every query word must prefix some word of the title
+        matches: Optional[set[str]] = None
+        for term in query.split():
+            ids = self._prefix_matches(term)
+            matches = ids if matches is None else matches & ids
+        titles = self._titles
+        ranked = nsmallest(
+            limit,
+            matches or (),
+            key=lambda i: (not titles[i].startswith(query), len(titles[i]), titles[i]),
+        )
+
+        if fuzzy and len(ranked) < limit:
+            seen = set(ranked)
+            ranked.extend(
+                template_id
+                for template_id in self._similar(query)
+                if template_id not in seen
+            )
+        return [self._by_id[template_id] for template_id in ranked[:limit]]
+
+    def _prefix_matches(self, term: str) -> set[str]:
+        ids = set()
+        position = bisect_left(self._words, (term,))
+        while position < len(self._words) and self._words[position][0].startswith(term):
+            ids.add(self._words[position][1])
+            position += 1
+        return ids
+
+    def _similar(self, query: str) -> list[str]:
+        query_trigrams = trigrams(query)
+        shared: Counter[str] = Counter()
+        for trigram in query_trigrams:
+            shared.update(self._trigrams.get(trigram, ()))
+
+        scored = []
+        for template_id, count in shared.items():
+            # Jaccard similarity between the two trigram sets
+            total = len(query_trigrams) + self._trigram_counts[template_id]
+            similarity = count / (total - count)
+            if similarity >= self.min_similarity:
+                scored.append((-similarity, self._titles[template_id], template_id))
+        return [template_id for _, _, template_id in sorted(scored)]
+
+    def _templates(self, ids: Iterable[str]) -> list[ExerciseTemplate]:
+        return sorted((self._by_id[i] for i in ids), key=lambda t: t.title)
+
+    def _fetch_all(
+        self, client: "HevyClient", max_workers: int
+    ) -> list[ExerciseTemplate]:
+        # Pages bypass the response cache: the catalog is the cache here
+        def fetch(page_number: int) -> ExerciseTemplatesResponse:
+            request = GetExerciseTemplates(page_number, self.max_page_size)
+            response = client._execute(request, ExerciseTemplatesResponse)
+            response.raise_for_status()
+            return response
+
+        with start_span(
+            client.tracer, "hevy.fetch_exercise_templates", page_size=self.max_page_size
+        ) as span:
+            # The first page tells us how many others to fetch concurrently
+            first_page = fetch(1)
+            templates = list(first_page.exercise_templates)
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                for page in pool.map(
+                    in_current_context(fetch), range(2, first_page.page_count + 1)
+                ):
+                    templates.extend(page.exercise_templates)
+            span.set(pages=first_page.page_count, templates=len(templates))
+            return templates
+
+    def __contains__(self, exercise_template_id: object) -> bool:
+        return exercise_template_id in self._by_id
+
+    def __iter__(self) -> Iterator[ExerciseTemplate]:
+        return iter(self._by_id.values())
+
+    def __len__(self) -> int:
+        return len(self._by_id)
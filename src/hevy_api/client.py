@@ -1,17 +1,29 @@
 import os
-from typing import Optional
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Optional, TypeVar, Union
 
 import requests
-from cachetools import TTLCache
+from cachetools import LRUCache
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
+from hevy_api.batch import BatchResult, run_batch
+from hevy_api.cache import CacheStats, StatsTTLCache
+from hevy_api.metrics import HOOK_EVENTS, RequestEvent, RequestMetrics
+from hevy_api.mirror import LocalMirror
 from hevy_api.models.base import BaseRequest, BaseResponse
-from hevy_api.models.model import Routine, Workout
+from hevy_api.models.model import ExerciseTemplate, Routine, Workout
 from hevy_api.models.request import (
     GetExerciseTemplate,
     GetExerciseTemplates,
     GetRoutineRequest,
     GetRoutinesRequest,
+    GetWorkoutEventsRequest,
     GetWorkoutRequest,
     GetWorkoutsCountRequest,
     GetWorkoutsRequest,
@@ -26,9 +38,15 @@ from hevy_api.models.response import (
     RoutineResponse,
     RoutinesResponse,
     WorkoutCountResponse,
+    WorkoutEventsResponse,
     WorkoutResponse,
     WorkoutsResponse,
 )
+from hevy_api.profiling import Profiler
+from hevy_api.ratelimit import RateLimiter
+from hevy_api.tracing import Tracer, in_current_context, start_span
+
+R = TypeVar("R", bound=BaseResponse)
 
 
 class HTTPClient:
@@ -36,9 +54,30 @@ class HTTPClient:
         self,
         base_url: str,
         api_key: str,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = 3,
+        pool_maxsize: int = 16,
+        tracer: Optional[Tracer] = None,
+        max_retry_delay: float = 60.0,
     ):
         self.base_url = base_url.rstrip("/")
         self.session = requests.Session()
+        # Keep enough connections open for concurrent batch calls
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.rate_limiter = rate_limiter
+        # Requests rejected with 429 are retried this many times, waiting at
+        # most max_retry_delay seconds before each retry. A 429 asking for a
+        # longer wait is returned as is, for the caller to reschedule.
+        self.max_retries = max_retries
+        self.max_retry_delay = max_retry_delay
+        self.tracer = tracer
+        # Always on: per-route latency histograms, status and byte counters
+        self.metrics = RequestMetrics()
+        self.hooks: dict[str, list[Callable[[RequestEvent], None]]] = {
+            event: [] for event in HOOK_EVENTS
+        }
 
         # Set default headers from config
         headers = {
@@ -50,36 +89,131 @@ class HTTPClient:
 
         self.session.headers.update(headers)
 
+    def add_hook(self, event: str, callback: Callable[[RequestEvent], None]) -> None:
+        if event not in self.hooks:
+            raise ValueError(f"Unknown hook {event!r}, expected one of {HOOK_EVENTS}")
+        self.hooks[event].append(callback)
+
     def execute(self, request: BaseRequest) -> BaseResponse:
+        method, route = request.get_method(), request.get_route()
+        for attempt in range(self.max_retries + 1):
+            with start_span(
+                self.tracer, "http.attempt", method=method, route=route, attempt=attempt
+            ) as span:
+                response = self._send(request, method, route, attempt)
+                span.set(status_code=response.status_code)
+            if response.status_code != 429 or attempt == self.max_retries:
+                break
+            delay = _retry_after(response)
+            if delay is None:
+                # No usable Retry-After, back off exponentially
+                delay = min(0.5 * 2**attempt, self.max_retry_delay)
+            elif delay > self.max_retry_delay:
+                break
+            self.metrics.observe_retry(method, route)
+            if self.hooks["on_retry"]:
+                self._emit(
+                    "on_retry",
+                    RequestEvent(
+                        request,
+                        method,
+                        route,
+                        attempt,
+                        response=response,
+                        retry_delay=delay,
+                    ),
+                )
+            time.sleep(delay)
+        return response
+
+    def _send(
+        self, request: BaseRequest, method: str, route: str, attempt: int
+    ) -> BaseResponse:
+        if self.rate_limiter is not None:
+            with start_span(self.tracer, "rate_limiter.acquire"):
+                self.rate_limiter.acquire()
         url = f"{self.base_url}{request.get_endpoint()}"
 
         # Merge request headers with session headers
         headers = {**self.session.headers, **request.headers}
 
+        if self.hooks["before_request"]:
+            self._emit("before_request", RequestEvent(request, method, route, attempt))
+        started = time.perf_counter()
         try:
             response = self.session.request(
-                method=request.get_method(),
+                method=method,
                 url=url,
                 headers=headers,
                 json=request.get_body(),
             )
 
             # Try to parse JSON, fallback to text
-            try:
-                data = response.json()
-            except ValueError:
-                data = response.text
+            with start_span(self.tracer, "json.decode"):
+                try:
+                    data = response.json()
+                except ValueError:
+                    data = response.text
 
-            return BaseResponse(
+            result = BaseResponse(
                 data=data,
                 status_code=response.status_code,
                 headers=dict(response.headers),
             )
+            elapsed = time.perf_counter() - started
+            self.metrics.observe(
+                method,
+                route,
+                elapsed,
+                result.status_code,
+                _size(getattr(response.request, "body", None)),
+                _size(response.content),
+            )
+            if self.hooks["after_response"]:
+                self._emit(
+                    "after_response",
+                    RequestEvent(
+                        request, method, route, attempt, elapsed, response=result
+                    ),
+                )
+            return result
 
         except requests.RequestException as e:
+            elapsed = time.perf_counter() - started
+            self.metrics.observe(method, route, elapsed, 0)
+            if self.hooks["on_error"]:
+                self._emit(
+                    "on_error",
+                    RequestEvent(request, method, route, attempt, elapsed, error=e),
+                )
             # Return error response
             return BaseResponse(data={"error": str(e)}, status_code=0, headers={})
 
+    def _emit(self, name: str, event: RequestEvent) -> None:
+        for callback in self.hooks[name]:
+            try:
+                callback(event)
+            except Exception as e:
+                # A broken hook must never break the request itself
+                print(f"Hook {name} failed: ", e)
+
+
+def _size(body: object) -> int:
+    if isinstance(body, str):
+        return len(body.encode())
+    return len(body) if isinstance(body, bytes) else 0
+
+
+def _retry_after(response: BaseResponse) -> Optional[float]:
+    # Retry-After in seconds, None when missing or not a number
+    for name, value in response.headers.items():
+        if name.lower() == "retry-after":
+            try:
+                return max(float(value), 0.0)
+            except ValueError:
+                return None
+    return None
+
 
 class HevyClient:
     env_token: str = "HEVY_API_KEY"
@@ -90,6 +224,17 @@ class HevyClient:
         api_key: Optional[str] = None,
         cache_ttl: int = 300,  # 5 minutes,
         cache_maxsize: int = 1_000,
+        mirror: Optional[LocalMirror] = None,
+        mirror_max_age: Optional[int] = 300,  # 5 minutes, None to never expire
+        offline_fallback: bool = False,
+        rate_limit: Optional[float] = None,  # requests per second
+        max_retries: int = 3,
+        max_retry_delay: float = 60.0,  # seconds
+        skip_unchanged_writes: bool = False,
+        tracer: Optional[Tracer] = None,
+        profile: bool = False,
+        base_url: Optional[str] = None,
+        keep_raw_data: bool = True,
     ):
         if not api_key:
             load_dotenv()
@@ -99,222 +244,432 @@ class HevyClient:
                 "api-key must be provided either directly or via configuration"
             )
 
+        # Time and allocations per route and phase for the client's lifetime,
+        # see profile() to profile a block of code instead
+        self.profiler: Optional[Profiler] = None
+        if profile:
+            self.profiler = Profiler(tracer.exporter if tracer else None)
+            self.profiler.start()
+            tracer = self.profiler
+
         self.http_client = HTTPClient(
-            base_url=self.base_url,
+            # Overridden to point at a local stand-in, see hevy_api.testing
+            base_url=base_url or self.base_url,
             api_key=api_key,
+            rate_limiter=RateLimiter(rate_limit) if rate_limit else None,
+            max_retries=max_retries,
+            tracer=tracer,
+            max_retry_delay=max_retry_delay,
         )
-        self._cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        # Spans for every call, HTTP attempt, JSON decode and model validation
+        self.tracer = tracer
+        self._cache = StatsTTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        # TTLCache is not thread-safe and pages may be fetched concurrently
+        self._cache_lock = threading.RLock()
+        # Optional local store, read through for single entities synced less
+        # than mirror_max_age seconds ago and kept up to date with every
+        # successful response
+        self.mirror = mirror
+        self.mirror_max_age = mirror_max_age
+        # While the API is unreachable, serve the last good response (or the
+        # mirror's copy) flagged as stale instead of an empty error response
+        self.offline_fallback = offline_fallback
+        self._last_good: LRUCache = LRUCache(maxsize=cache_maxsize)
+        # Fingerprint of the last known server state of each workout and
+        # routine. When enabled, updates that would not change it are answered
+        # locally with a 304, so only turn it on when no other device edits
+        # the same account in between.
+        self.skip_unchanged_writes = skip_unchanged_writes
+        self.skipped_writes = 0
+        self._fingerprints: LRUCache = LRUCache(maxsize=cache_maxsize)
+        # When off, responses drop their decoded JSON (response.data) and most
+        # headers once parsed, so cached entries hold only the models
+        self.keep_raw_data = keep_raw_data
+
+    @property
+    def metrics(self) -> RequestMetrics:
+        return self.http_client.metrics
+
+    @contextmanager
+    def profile(self, trace_memory: bool = True) -> Iterator[Profiler]:
+        # Profiles the calls made inside the block, spans keep going to the
+        # current tracer's exporter
+        previous = self.tracer
+        profiler = Profiler(previous.exporter if previous else None, trace_memory)
+        self.tracer = self.http_client.tracer = profiler
+        profiler.start()
+        try:
+            yield profiler
+        finally:
+            profiler.stop()
+            self.tracer = self.http_client.tracer = previous
 
-    #####################################################################
-    # TODO - Check if we can merge these methods which are very similar #
-    #####################################################################
     def get_workout_count(self) -> WorkoutCountResponse:
-        # Check the cache first
-        cache_key = WorkoutCountResponse.__name__
-        cached_response = self._cache.get(cache_key)
-        if cached_response is not None and isinstance(
-            cached_response, WorkoutCountResponse
-        ):
-            return cached_response
-
-        # Cache miss - make the API call
-        response = self.http_client.execute(GetWorkoutsCountRequest())
-
-        workouts_count = WorkoutCountResponse(
-            data=response.data,
-            status_code=response.status_code,
-            headers=response.headers,
+        return self._get_cached(
+            WorkoutCountResponse.__name__,
+            GetWorkoutsCountRequest(),
+            WorkoutCountResponse,
         )
 
-        # Avoid caching error responses
-        if workouts_count.is_success:
-            self._cache[cache_key] = workouts_count
-
-        return workouts_count
-
     def get_exercise_templates(
         self, page_number: int = 1, page_size: int = 5
     ) -> ExerciseTemplatesResponse:
-        # Check the cache first
-        cache_key = f"{ExerciseTemplatesResponse.__name__}:{page_number}:{page_size}"
-        cached_response = self._cache.get(cache_key)
-        if cached_response is not None and isinstance(
-            cached_response, ExerciseTemplatesResponse
-        ):
-            return cached_response
-
-        # Cache miss - make the API call
-        request = GetExerciseTemplates(page_number, page_size)
-        response = self.http_client.execute(request)
-
-        exercise_templates = ExerciseTemplatesResponse(
-            data=response.data,
-            status_code=response.status_code,
-            headers=response.headers,
+        return self._get_cached(
+            f"{ExerciseTemplatesResponse.__name__}:{page_number}:{page_size}",
+            GetExerciseTemplates(page_number, page_size),
+            ExerciseTemplatesResponse,
         )
 
-        # Avoid caching error responses
-        if exercise_templates.is_success:
-            self._cache[cache_key] = exercise_templates
-
-        return exercise_templates
-
     def get_exercise_template(
         self, exercise_template_id: str
     ) -> ExerciseTemplateResponse:
-        # Check the cache first
-        cached_response = self._cache.get(exercise_template_id)
-        if cached_response is not None and isinstance(
-            cached_response, ExerciseTemplateResponse
-        ):
-            return cached_response
-
-        # Cache miss - make the API call
-        request = GetExerciseTemplate(exercise_template_id)
-        response = self.http_client.execute(request)
-
-        exercise_template = ExerciseTemplateResponse(
-            data=response.data,
-            status_code=response.status_code,
-            headers=response.headers,
+        return self._get_cached(
+            exercise_template_id,
+            GetExerciseTemplate(exercise_template_id),
+            ExerciseTemplateResponse,
         )
 
-        # Avoid caching error responses
-        if exercise_template.is_success:
-            self._cache[exercise_template_id] = exercise_template
-
-        return exercise_template
-
     def get_workout(self, workout_id: str) -> WorkoutResponse:
-        # Check the cache first
-        cached_response = self._cache.get(workout_id)
-        if cached_response is not None and isinstance(cached_response, WorkoutResponse):
-            return cached_response
-
-        # Cache miss - make the API call
-        request = GetWorkoutRequest(workout_id)
-        response = self.http_client.execute(request)
-
-        workout_response = WorkoutResponse(
-            data=response.data,
-            status_code=response.status_code,
-            headers=response.headers,
+        return self._get_cached(
+            workout_id, GetWorkoutRequest(workout_id), WorkoutResponse
         )
 
-        # Avoid caching error responses
-        if workout_response.is_success:
-            self._cache[workout_id] = workout_response
-
-        return workout_response
-
     def update_workout(self, workout_id: str, workout: Workout) -> WorkoutResponse:
-        request = PutWorkoutRequest(workout_id, workout)
-        response = self.http_client.execute(request)
-        return WorkoutResponse(
-            data=response.data,
-            status_code=response.status_code,
-            headers=response.headers,
+        return self._update(
+            workout_id,
+            workout,
+            PutWorkoutRequest(workout_id, workout),
+            WorkoutResponse,
+            {**workout.model_dump(mode="json"), "id": workout_id},
         )
 
     def create_workout(self, workout: Workout) -> WorkoutResponse:
-        request = PostWorkoutRequest(workout)
-        response = self.http_client.execute(request)
-        return WorkoutResponse(
-            data=response.data,
-            status_code=response.status_code,
-            headers=response.headers,
-        )
+        return self._execute(PostWorkoutRequest(workout), WorkoutResponse)
+
+    def create_workouts(
+        self, workouts: Iterable[Workout], max_workers: int = 8
+    ) -> BatchResult[Workout, WorkoutResponse]:
+        return run_batch(self.create_workout, workouts, max_workers)
+
+    def update_workouts(
+        self,
+        workouts: Union[Mapping[str, Workout], Iterable[tuple[str, Workout]]],
+        max_workers: int = 8,
+    ) -> BatchResult[tuple[str, Workout], WorkoutResponse]:
+        # Takes (workout_id, workout) pairs too, so result.failed can be retried
+        items = workouts.items() if isinstance(workouts, Mapping) else workouts
+        return run_batch(lambda item: self.update_workout(*item), items, max_workers)
 
     def get_workouts(
         self, page_number: int = 1, page_size: int = 5
     ) -> WorkoutsResponse:
-        # Check the cache first
-        cache_key = f"{WorkoutsResponse.__name__}:{page_number}:{page_size}"
-        cached_response = self._cache.get(cache_key)
-        if cached_response is not None and isinstance(
-            cached_response, WorkoutsResponse
-        ):
-            return cached_response
-
-        # Cache miss - make the API call
-        request = GetWorkoutsRequest(page_number, page_size)
-        response = self.http_client.execute(request)
-
-        workouts_response = WorkoutsResponse(
-            data=response.data,
-            status_code=response.status_code,
-            headers=response.headers,
+        return self._get_cached(
+            f"{WorkoutsResponse.__name__}:{page_number}:{page_size}",
+            GetWorkoutsRequest(page_number, page_size),
+            WorkoutsResponse,
         )
 
-        # Avoid caching error responses
-        if workouts_response.is_success:
-            self._cache[cache_key] = workouts_response
-
-        return workouts_response
+    def get_workout_events(
+        self, since: datetime, page_number: int = 1, page_size: int = 10
+    ) -> WorkoutEventsResponse:
+        # The events feed is only useful fresh, so it is never cached
+        return self._execute(
+            GetWorkoutEventsRequest(page_number, page_size, since),
+            WorkoutEventsResponse,
+        )
 
     def get_routine(self, routine_id: str) -> RoutineResponse:
-        # Check the cache first
-        cached_response = self._cache.get(routine_id)
-        if cached_response is not None and isinstance(cached_response, RoutineResponse):
-            return cached_response
-
-        # Cache miss - make the API call
-        request = GetRoutineRequest(routine_id)
-        response = self.http_client.execute(request)
-
-        routine_response = RoutineResponse(
-            data=response.data,
-            status_code=response.status_code,
-            headers=response.headers,
+        return self._get_cached(
+            routine_id, GetRoutineRequest(routine_id), RoutineResponse
         )
 
-        # Avoid caching error responses
-        if routine_response.is_success:
-            self._cache[routine_id] = routine_response
-
-        return routine_response
-
     def update_routine(self, routine_id: str, routine: Routine) -> RoutineResponse:
-        request = PutRoutineRequest(routine_id, routine)
-        response = self.http_client.execute(request)
-        return RoutineResponse(
-            data=response.data,
-            status_code=response.status_code,
-            headers=response.headers,
+        return self._update(
+            routine_id,
+            routine,
+            PutRoutineRequest(routine_id, routine),
+            RoutineResponse,
+            {"routine": {**routine.model_dump(mode="json"), "id": routine_id}},
         )
 
     def create_routine(self, routine: Routine) -> RoutineResponse:
-        request = PostRoutineRequest(routine)
-        response = self.http_client.execute(request)
-        return RoutineResponse(
-            data=response.data,
-            status_code=response.status_code,
-            headers=response.headers,
-        )
+        return self._execute(PostRoutineRequest(routine), RoutineResponse)
 
     def get_routines(
         self, page_number: int = 1, page_size: int = 5
     ) -> RoutinesResponse:
-        # Check the cache first
-        cache_key = f"{RoutinesResponse.__name__}:{page_number}:{page_size}"
-        cached_response = self._cache.get(cache_key)
-        if cached_response is not None and isinstance(
-            cached_response, RoutinesResponse
-        ):
-            return cached_response
-
-        # Cache miss - make the API call
-        request = GetRoutinesRequest(page_number, page_size)
-        response = self.http_client.execute(request)
-
-        routines_response = RoutinesResponse(
-            data=response.data,
-            status_code=response.status_code,
-            headers=response.headers,
+        return self._get_cached(
+            f"{RoutinesResponse.__name__}:{page_number}:{page_size}",
+            GetRoutinesRequest(page_number, page_size),
+            RoutinesResponse,
         )
 
-        # Avoid caching error responses
-        if routines_response.is_success:
-            self._cache[cache_key] = routines_response
+    def resolve_templates(
+        self, workouts: Iterable[Union[Workout, Routine]], max_workers: int = 8
+    ) -> dict[str, ExerciseTemplate]:
+        return self.resolve_template_ids(
+            (
+                exercise.exercise_template_id
+                for workout in workouts
+                for exercise in workout.exercises
+            ),
+            max_workers=max_workers,
+        )
+
+    def resolve_template_ids(
+        self, exercise_template_ids: Iterable[str], max_workers: int = 8
+    ) -> dict[str, ExerciseTemplate]:
+        templates: dict[str, ExerciseTemplate] = {}
+        missing: list[str] = []
+
+        # Serve what we can from the cache, each distinct ID is looked up once
+        for template_id in dict.fromkeys(exercise_template_ids):
+            cached_response = self._from_cache(template_id, ExerciseTemplateResponse)
+            if cached_response is not None and cached_response.exercise_template:
+                templates[template_id] = cached_response.exercise_template
+            else:
+                missing.append(template_id)
+
+        # Fetch the rest concurrently, failed lookups are left out of the result.
+        # Their cache misses are already recorded, so skip the second lookup.
+        def fetch(template_id: str) -> ExerciseTemplateResponse:
+            return self._get_cached(
+                template_id,
+                GetExerciseTemplate(template_id),
+                ExerciseTemplateResponse,
+                check_cache=False,
+            )
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as pool:
+                for template_id, response in zip(
+                    missing, pool.map(in_current_context(fetch), missing), strict=True
+                ):
+                    if response.exercise_template is not None:
+                        templates[template_id] = response.exercise_template
+        return templates
+
+    def _update(
+        self,
+        entity_id: str,
+        entity: Union[Workout, Routine],
+        request: BaseRequest,
+        response_type: type[R],
+        unchanged_data: dict,
+    ) -> R:
+        fingerprint = entity.fingerprint
+        if self.skip_unchanged_writes:
+            with self._cache_lock:
+                unchanged = self._fingerprints.get(entity_id) == fingerprint
+                if unchanged:
+                    self.skipped_writes += 1
+            if unchanged:
+                # Answer like a server would for a conditional request
+                return response_type(data=unchanged_data, status_code=304, headers={})
+
+        response = self._execute(request, response_type)
+        if response.is_success:
+            self._remember(entity_id, entity)
+        return response
+
+    def _remember(self, entity_id: str, entity: Union[Workout, Routine]) -> None:
+        with self._cache_lock:
+            self._fingerprints[entity_id] = entity.fingerprint
+
+    def _apply_workout_change(
+        self, workout_id: str, workout: Optional[Workout] = None
+    ) -> None:
+        response = None
+        if workout is not None:
+            response = WorkoutResponse(
+                data=workout.model_dump(mode="json"), status_code=200, headers={}
+            )
+        self._apply_change(workout_id, response, WorkoutsResponse)
+        if workout is None:
+            with self._cache_lock:
+                self._fingerprints.pop(workout_id, None)
+        else:
+            self._remember(workout_id, workout)
+        if self.mirror is not None:
+            if workout is None:
+                self.mirror.remove_workout(workout_id)
+            else:
+                self.mirror.add_workout(workout)
+        with self._cache_lock:
+            self._cache.pop(WorkoutCountResponse.__name__, None)
+
+    def _apply_routine_change(
+        self, routine_id: str, routine: Optional[Routine] = None
+    ) -> None:
+        response = None
+        if routine is not None:
+            response = RoutineResponse(
+                data={"routine": routine.model_dump(mode="json")},
+                status_code=200,
+                headers={},
+            )
+        self._apply_change(routine_id, response, RoutinesResponse)
+        if routine is None:
+            with self._cache_lock:
+                self._fingerprints.pop(routine_id, None)
+        else:
+            self._remember(routine_id, routine)
+        if self.mirror is not None:
+            if routine is None:
+                self.mirror.remove_routine(routine_id)
+            else:
+                self.mirror.add_routine(routine)
+
+    def _apply_change(
+        self,
+        entity_id: str,
+        response: Optional[BaseResponse],
+        page_type: type[BaseResponse],
+    ) -> None:
+        # Swap in the new version of the entity (or drop it when deleted), and
+        # forget the cached pages since their contents may have shifted
+        with self._cache_lock:
+            if response is None:
+                self._cache.pop(entity_id, None)
+            else:
+                if not self.keep_raw_data:
+                    response.compact()
+                self._cache[entity_id] = response
+            for cache_key in list(self._cache.keys()):
+                if cache_key.startswith(f"{page_type.__name__}:"):
+                    del self._cache[cache_key]
+
+    def cache_stats(self, sizes: bool = True) -> CacheStats:
+        with self._cache_lock:
+            return self._cache.stats(sizes)
+
+    def _from_cache(self, cache_key: str, response_type: type[R]) -> Optional[R]:
+        with self._cache_lock:
+            cached_response = self._cache.get(cache_key)
+            if cached_response is not None and isinstance(
+                cached_response, response_type
+            ):
+                self._cache.record(response_type.__name__, "hits")
+                return cached_response
+            self._cache.record(response_type.__name__, "misses")
+        return None
+
+    def _get_cached(
+        self,
+        cache_key: str,
+        request: BaseRequest,
+        response_type: type[R],
+        check_cache: bool = True,
+    ) -> R:
+        with start_span(
+            self.tracer,
+            "hevy.get",
+            **_span_attributes(request),
+            cache_key=cache_key,
+            response_type=response_type.__name__,
+        ) as span:
+            # Check the cache first
+            if check_cache:
+                cached_response = self._from_cache(cache_key, response_type)
+                if cached_response is not None:
+                    span.set(source="cache")
+                    return cached_response
+
+            # Cache miss - try the local mirror, then make the API call
+            response = None
+            if self.mirror is not None:
+                response = self.mirror.load_response(
+                    cache_key, response_type, self.mirror_max_age
+                )
+                if response is not None:
+                    span.set(source="mirror")
+                    if not self.keep_raw_data:
+                        response.compact()
+                    with self._cache_lock:
+                        self._cache.record(response_type.__name__, "mirror_hits")
+            if response is None:
+                span.set(source="api")
+                response = self._execute(request, response_type)
+                if response.is_unavailable and self.offline_fallback:
+                    response = self._fallback(cache_key, request, response)
+                    span.set(stale=response.is_stale)
+                    return response
+
+            # Avoid caching error responses
+            if response.is_success:
+                with self._cache_lock:
+                    self._cache[cache_key] = response
+                    if self.offline_fallback:
+                        self._last_good[cache_key] = (response, time.time())
+
+            return response
+
+    def _fallback(self, cache_key: str, request: BaseRequest, response: R) -> R:
+        with self._cache_lock:
+            last_good = self._last_good.get(cache_key)
+        if last_good is not None:
+            good_response, fetched_at = last_good
+            self._record_stale_hit(response)
+            return good_response.as_stale(timedelta(seconds=time.time() - fetched_at))
+
+        stale = self.mirror.load_stale(request) if self.mirror is not None else None
+        if stale is not None:
+            data, synced_at = stale
+            self._record_stale_hit(response)
+            return type(response)(data=data, status_code=200, headers={}).as_stale(
+                timedelta(seconds=time.time() - synced_at)
+            )
 
-        return routines_response
+        # Nothing to fall back on, surface the original error
+        return response
+
+    def _record_stale_hit(self, response: BaseResponse) -> None:
+        with self._cache_lock:
+            self._cache.record(type(response).__name__, "stale_hits")
+
+    def _execute(self, request: BaseRequest, response_type: type[R]) -> R:
+        with start_span(
+            self.tracer, "hevy.execute", **_span_attributes(request)
+        ) as span:
+            response = self.http_client.execute(request)
+            with start_span(
+                self.tracer, "validate", response_type=response_type.__name__
+            ):
+                typed_response = response_type(
+                    data=response.data,
+                    status_code=response.status_code,
+                    headers=response.headers,
+                )
+            span.set(status_code=typed_response.status_code)
+            if self.mirror is not None:
+                self.mirror.store_response(typed_response)
+            if typed_response.is_success:
+                for entity in _entities(typed_response):
+                    self._remember(entity.id, entity)
+            if not self.keep_raw_data:
+                typed_response.compact()
+            return typed_response
+
+
+def _span_attributes(request: BaseRequest) -> dict[str, Any]:
+    # The route drops the query, so pages are told apart by their number
+    attributes: dict[str, Any] = {
+        "method": request.get_method(),
+        "route": request.get_route(),
+    }
+    if request.page_number is not None:
+        attributes["page"] = request.page_number
+    return attributes
+
+
+def _entities(response: BaseResponse) -> list[Union[Workout, Routine]]:
+    # Workouts and routines carried by a response, the known server state
+    if isinstance(response, WorkoutResponse) and response.workout:
+        return [response.workout]
+    if isinstance(response, RoutineResponse) and response.routine:
+        return [response.routine]
+    if isinstance(response, WorkoutsResponse):
+        return list(response.workouts)
+    if isinstance(response, RoutinesResponse):
+        return list(response.routines)
+    return []
@@ -0,0 +1,175 @@
+import csv
+import json
+import tempfile
+import zipfile
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any, Union, get_args
+
+from hevy_api.models.model import Exercise, Set, Workout
+
+# One row per set, with the workout and exercise it belongs to repeated on
+# every row. Exercise and set columns follow the models, so new fields show up
+# here without any changes.
+WORKOUT_FIELDS = ("id", "title", "start_time", "end_time")
+EXERCISE_FIELDS = tuple(field for field in Exercise.model_fields if field != "sets")
+SET_FIELDS = tuple(Set.model_fields)
+# Fields Set.summary leaves out, they identify the set rather than measure it
+SET_KEYS = ("index", "type")
+SET_MEASURES = tuple(field for field in SET_FIELDS if field not in SET_KEYS)
+
+# Field names too generic to stand on their own once flattened
+_GENERIC_FIELDS = {"id", "index", "title", "type", "notes"}
+
+
+def _column_name(prefix: str, field: str) -> str:
+    return f"{prefix}_{field}" if field in _GENERIC_FIELDS else field
+
+
+def _column_kind(annotation: Any) -> str:
+    if annotation is str or str in get_args(annotation):
+        return "str"
+    if annotation is datetime:
+        return "datetime"
+    if annotation is int:
+        return "int"
+    # Optional numbers become floats so that missing values can be NaN
+    return "float"
+
+
+COLUMNS: dict[str, str] = {
+    **{
+        _column_name("workout", field): _column_kind(
+            Workout.model_fields[field].annotation
+        )
+        for field in WORKOUT_FIELDS
+    },
+    **{
+        _column_name("exercise", field): _column_kind(
+            Exercise.model_fields[field].annotation
+        )
+        for field in EXERCISE_FIELDS
+    },
+    **{
+        _column_name("set", field): _column_kind(Set.model_fields[field].annotation)
+        for field in SET_FIELDS
+    },
+}
+
+
+def iter_set_rows(workouts: Iterable[Workout]) -> Iterator[tuple]:
+    for workout in workouts:
+        workout_values = tuple(getattr(workout, field) for field in WORKOUT_FIELDS)
+        for exercise in workout.exercises:
+            exercise_values = tuple(
+                getattr(exercise, field) for field in EXERCISE_FIELDS
+            )
+            for set in exercise.sets:
+                measures = set.summary
+                yield (
+                    *workout_values,
+                    *exercise_values,
+                    *(getattr(set, field) for field in SET_KEYS),
+                    *(measures.get(field) for field in SET_MEASURES),
+                )
+
+
+def write_csv(workouts: Iterable[Workout], path: Union[str, Path]) -> int:
+    rows = 0
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(COLUMNS)
+        for row in iter_set_rows(workouts):
+            writer.writerow(
+                value.isoformat() if isinstance(value, datetime) else value
+                for value in row
+            )
+            rows += 1
+    return rows
+
+
+def write_npz(
+    workouts: Iterable[Workout], path: Union[str, Path], chunk_size: int = 10_000
+) -> int:
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "numpy is required for .npz exports: pip install hevy-api[numpy]"
+        ) from None
+
+    # Rows are converted a chunk at a time and spooled column by column to
+    # temporary files, the archive is assembled once the row count is known
+    with ExitStack() as stack:
+        columns = [
+            _SpooledColumn(name, kind, stack.enter_context(tempfile.TemporaryFile()))
+            for name, kind in COLUMNS.items()
+        ]
+        rows = 0
+        row_iterator = iter_set_rows(workouts)
+        while chunk := list(islice(row_iterator, chunk_size)):
+            for column, values in zip(columns, zip(*chunk, strict=True), strict=True):
+                column.append(np, values)
+            rows += len(chunk)
+
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for column in columns:
+                # Fixed timestamp keeps archives of the same data identical
+                info = zipfile.ZipInfo(f"{column.name}.npy", (1980, 1, 1, 0, 0, 0))
+                info.compress_type = zipfile.ZIP_DEFLATED
+                with archive.open(info, "w", force_zip64=True) as member:
+                    column.write_npy(np, member, rows, chunk_size)
+    return rows
+
+
+class _SpooledColumn:
+    def __init__(self, name: str, kind: str, file: IO[bytes]):
+        self.name = name
+        self.kind = kind
+        self.file = file
+        # Widest string so far, numpy strings are fixed width
+        self.width = 1
+
+    def dtype(self, np: Any) -> Any:
+        return {
+            "str": np.dtype(f"<U{self.width}"),
+            "datetime": np.dtype("<M8[s]"),
+            "int": np.dtype("<i8"),
+            "float": np.dtype("<f8"),
+        }[self.kind]
+
+    def append(self, np: Any, values: tuple) -> None:
+        if self.kind == "str":
+            # One JSON string per line, so embedded newlines stay escaped
+            values = tuple("" if value is None else value for value in values)
+            self.width = max(self.width, *map(len, values))
+            self.file.write("".join(f"{json.dumps(v)}\n" for v in values).encode())
+        elif self.kind == "datetime":
+            seconds = [int(value.timestamp()) for value in values]
+            self.file.write(np.asarray(seconds, dtype="<i8").tobytes())
+        elif self.kind == "int":
+            self.file.write(np.asarray(values, dtype="<i8").tobytes())
+        else:
+            floats = [np.nan if value is None else value for value in values]
+            self.file.write(np.asarray(floats, dtype="<f8").tobytes())
+
+    def write_npy(self, np: Any, out: IO[bytes], rows: int, chunk_size: int) -> None:
+        dtype = self.dtype(np)
+        header = {
+            "descr": np.lib.format.dtype_to_descr(dtype),
+            "fortran_order": False,
+            "shape": (rows,),
+        }
+        np.lib.format.write_array_header_1_0(out, header)
+
+        self.file.seek(0)
+        if self.kind != "str":
+            while data := self.file.read(chunk_size * dtype.itemsize):
+                out.write(data)
+            return
+        while lines := list(islice(self.file, chunk_size)):
+            values = [json.loads(line) for line in lines]
+            out.write(np.asarray(values, dtype=dtype).tobytes())
@@ -0,0 +1,161 @@
+import gzip
+import json
+import lzma
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+from pydantic import BaseModel
+
+from hevy_api.models.model import Workout
+from hevy_api.models.request import GetWorkoutsRequest
+from hevy_api.models.response import WorkoutsResponse
+from hevy_api.storage import atomic_write
+from hevy_api.tracing import in_current_context, start_span
+
+if TYPE_CHECKING:
+    from hevy_api.client import HevyClient
+
+# Every page is compressed as its own member: concatenated gzip members and xz
+# streams still decompress as one file, and a resume can append to it. gzip
+# headers carry no timestamp so the same data always gives the same bytes.
+COMPRESSORS: dict[Optional[str], Callable[[bytes], bytes]] = {
+    None: lambda data: data,
+    "gzip": lambda data: gzip.compress(data, mtime=0),
+    "xz": lzma.compress,
+}
+
+
+class ExportResult(BaseModel):
+    path: Path
+    pages: int = 0
+    workouts: int = 0
+    resumed: bool = False
+
+
+def iter_workout_pages(
+    client: "HevyClient", page_size: int = 10, start_page: int = 1
+) -> Iterator[list[Workout]]:
+    for response in _workout_pages(client, page_size, start_page):
+        yield response.workouts
+
+
+def iter_workouts(client: "HevyClient", page_size: int = 10) -> Iterator[Workout]:
+    for workouts in iter_workout_pages(client, page_size):
+        yield from workouts
+
+
+def export_workouts(
+    client: "HevyClient",
+    path: Union[str, Path],
+    compression: Optional[str] = None,
+    page_size: int = 10,
+) -> ExportResult:
+    with start_span(client.tracer, "hevy.export_workouts", page_size=page_size) as span:
+        result = _export_workouts(client, path, compression, page_size)
+        span.set(pages=result.pages, workouts=result.workouts, resumed=result.resumed)
+        return result
+
+
+def export_users(
+    exports: Iterable[tuple["HevyClient", Union[str, Path]]],
+    compression: Optional[str] = None,
+    page_size: int = 10,
+    max_workers: int = 4,
+) -> list[ExportResult]:
+    # One client per user, each export streams and checkpoints on its own
+    export = in_current_context(export_workouts)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(export, client, path, compression, page_size)
+            for client, path in exports
+        ]
+        return [future.result() for future in futures]
+
+
+def _export_workouts(
+    client: "HevyClient",
+    path: Union[str, Path],
+    compression: Optional[str],
+    page_size: int,
+) -> ExportResult:
+    compress = COMPRESSORS[compression]
+    path = Path(path)
+    checkpoint_path = path.with_name(f"{path.name}.checkpoint")
+    checkpoint = _read_checkpoint(checkpoint_path, page_size, compression)
+
+    result = ExportResult(path=path)
+    offset = 0
+    page_count: Optional[int] = None
+    if checkpoint is not None and path.exists():
+        result.pages, result.workouts = checkpoint["page"], checkpoint["workouts"]
+        result.resumed = True
+        offset = checkpoint["offset"]
+        page_count = checkpoint.get("page_count")
+    # A crash between the last checkpoint and its removal leaves nothing to fetch
+    finished = page_count is not None and result.pages >= page_count
+
+    with open(path, "r+b" if result.resumed else "wb") as file:
+        # Drop whatever a crash left behind after the last finished page
+        file.truncate(offset)
+        file.seek(offset)
+        pages = () if finished else _workout_pages(client, page_size, result.pages + 1)
+        for response in pages:
+            workouts = response.workouts
+            lines = b"".join(
+                workout.model_dump_json(exclude_none=True).encode() + b"\n"
+                for workout in workouts
+            )
+            file.write(compress(lines))
+            file.flush()
+            os.fsync(file.fileno())
+            result.pages += 1
+            result.workouts += len(workouts)
+            # The checkpoint only moves once the page is safely on disk
+            checkpoint = {
+                "page": result.pages,
+                "offset": file.tell(),
+                "workouts": result.workouts,
+                "page_count": response.page_count,
+                "page_size": page_size,
+                "compression": compression,
+            }
+            atomic_write(checkpoint_path, json.dumps(checkpoint).encode())
+
+    checkpoint_path.unlink(missing_ok=True)
+    return result
+
+
+def _workout_pages(
+    client: "HevyClient", page_size: int, start_page: int
+) -> Iterator[WorkoutsResponse]:
+    # Pages bypass the response cache, a full export would only evict it
+    page_number, page_count = start_page, start_page
+    while page_number <= page_count:
+        response = client._execute(
+            GetWorkoutsRequest(page_number, page_size), WorkoutsResponse
+        )
+        # Also raises on a page that failed to parse, which would otherwise be
+        # exported as an empty page and checkpointed past
+        response.raise_for_status()
+        yield response
+        page_number, page_count = page_number + 1, response.page_count
+
+
+def _read_checkpoint(
+    path: Path, page_size: int, compression: Optional[str]
+) -> Optional[dict]:
+    try:
+        checkpoint = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    # Pages of a different size or encoding cannot be continued
+    if (
+        not isinstance(checkpoint, dict)
+        or checkpoint.get("page_size") != page_size
+        or checkpoint.get("compression") != compression
+    ):
+        return None
+    return checkpoint
@@ -0,0 +1,158 @@
+import copy
+import threading
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from hevy_api.models.base import BaseRequest, BaseResponse
+
+# Upper bounds in seconds, the last bucket catches everything slower
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HOOK_EVENTS = ("before_request", "after_response", "on_error", "on_retry")
+
+
+class RequestEvent:
+    # Passed to every hook; response, error and elapsed are only set once
+    # known, retry_delay only for on_retry
+    __slots__ = (
+        "request",
+        "method",
+        "route",
+        "attempt",
+        "elapsed",
+        "response",
+        "error",
+        "retry_delay",
+    )
+
+    def __init__(
+        self,
+        request: "BaseRequest",
+        method: str,
+        route: str,
+        attempt: int,
+        elapsed: Optional[float] = None,
+        response: Optional["BaseResponse"] = None,
+        error: Optional[Exception] = None,
+        retry_delay: Optional[float] = None,
+    ):
+        self.request = request
+        self.method = method
+        self.route = route
+        self.attempt = attempt
+        self.elapsed = elapsed
+        self.response = response
+        self.error = error
+        self.retry_delay = retry_delay
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        # Interpolates linearly within the bucket holding the q-th value
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                if i == len(self.buckets):
+                    return lower
+                return lower + (self.buckets[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+
+class RouteStats:
+    def __init__(self, buckets: Sequence[float]):
+        self.latency = Histogram(buckets)
+        self.statuses: Counter[int] = Counter()
+        self.errors = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "requests": self.latency.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "statuses": dict(sorted(self.statuses.items())),
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency_sum": self.latency.sum,
+            "latency_p50": self.latency.quantile(0.5),
+            "latency_p95": self.latency.quantile(0.95),
+            "latency_p99": self.latency.quantile(0.99),
+        }
+
+
+class RequestMetrics:
+    # Per (method, route) counters, updated on every request so kept to a
+    # dict lookup, a bisect and a few additions under one lock
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._routes: dict[tuple[str, str], RouteStats] = {}
+        self._lock = threading.Lock()
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        elapsed: float,
+        status_code: int,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        with self._lock:
+            stats = self._stats(method, route)
+            stats.latency.observe(elapsed)
+            stats.statuses[status_code] += 1
+            if status_code == 0 or status_code >= 400:
+                stats.errors += 1
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+
+    def observe_retry(self, method: str, route: str) -> None:
+        with self._lock:
+            self._stats(method, route).retries += 1
+
+    def get(self, method: str, route: str) -> Optional[RouteStats]:
+        with self._lock:
+            return self._routes.get((method, route))
+
+    def routes(self) -> dict[tuple[str, str], RouteStats]:
+        # Consistent copies, safe to read while requests keep coming in
+        with self._lock:
+            return copy.deepcopy(self._routes)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {
+                f"{method} {route}": stats.snapshot()
+                for (method, route), stats in sorted(self._routes.items())
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+    def _stats(self, method: str, route: str) -> RouteStats:
+        stats = self._routes.get((method, route))
+        if stats is None:
+            stats = self._routes[(method, route)] = RouteStats(self.buckets)
+        return stats
@@ -0,0 +1,530 @@
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from hevy_api.models.base import BaseRequest, BaseResponse
+from hevy_api.models.model import Exercise, ExerciseTemplate, Routine, Workout
+from hevy_api.models.request import (
+    GetExerciseTemplate,
+    GetRoutineRequest,
+    GetRoutinesRequest,
+    GetWorkoutRequest,
+    GetWorkoutsCountRequest,
+    GetWorkoutsRequest,
+)
+from hevy_api.models.response import (
+    ExerciseTemplateResponse,
+    ExerciseTemplatesResponse,
+    RoutineResponse,
+    RoutinesResponse,
+    WorkoutResponse,
+    WorkoutsResponse,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS workouts (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS workouts_start_time ON workouts (start_time);
+
+CREATE TABLE IF NOT EXISTS routines (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    folder_id INTEGER,
+    updated_at TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+
+-- Exercises and sets are shared by workouts and routines, told apart by owner_type
+CREATE TABLE IF NOT EXISTS exercises (
+    owner_type TEXT NOT NULL,
+    owner_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    notes TEXT,
+    exercise_template_id TEXT NOT NULL,
+    supersets_id INTEGER,
+    PRIMARY KEY (owner_type, owner_id, idx)
+);
+CREATE INDEX IF NOT EXISTS exercises_template
+    ON exercises (exercise_template_id, owner_type);
+
+CREATE TABLE IF NOT EXISTS sets (
+    owner_type TEXT NOT NULL,
+    owner_id TEXT NOT NULL,
+    exercise_idx INTEGER NOT NULL,
+    idx INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    weight_kg REAL,
+    reps INTEGER,
+    distance_meters REAL,
+    duration_seconds INTEGER,
+    rpe REAL,
+    custom_metric REAL,
+    PRIMARY KEY (owner_type, owner_id, exercise_idx, idx)
+);
+
+CREATE TABLE IF NOT EXISTS exercise_templates (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    type TEXT NOT NULL,
+    primary_muscle_group TEXT NOT NULL,
+    secondary_muscle_groups TEXT NOT NULL,
+    is_custom INTEGER NOT NULL,
+    synced_at REAL NOT NULL
+);
+"""
+
+WORKOUT = "workout"
+ROUTINE = "routine"
+
+SET_COLUMNS = (
+    "type",
+    "weight_kg",
+    "reps",
+    "distance_meters",
+    "duration_seconds",
+    "rpe",
+    "custom_metric",
+)
+
+# Stay well below SQLite's limit on bound parameters per statement
+_MAX_PARAMETERS = 500
+
+
+def _timestamp(value: datetime) -> str:
+    # Stored in UTC so that text ordering matches chronological ordering
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.isoformat()
+
+
+def _chunks(ids: list[str]) -> Iterator[list[str]]:
+    for i in range(0, len(ids), _MAX_PARAMETERS):
+        yield ids[i : i + _MAX_PARAMETERS]
+
+
+class LocalMirror:
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.executescript(SCHEMA)
+        # One connection shared by every thread, so serialize access to it
+        self._lock = threading.RLock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    # Workouts
+    def add_workout(self, workout: Workout) -> None:
+        self.add_workouts([workout])
+
+    def add_workouts(self, workouts: Iterable[Workout]) -> None:
+        synced_at = time.time()
+        with self._lock, self._connection:
+            for workout in workouts:
+                self._delete_exercises(WORKOUT, workout.id)
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO workouts VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        workout.id,
+                        workout.title,
+                        workout.description,
+                        _timestamp(workout.start_time),
+                        _timestamp(workout.end_time),
+                        _timestamp(workout.updated_at),
+                        _timestamp(workout.created_at),
+                        synced_at,
+                    ),
+                )
+                self._insert_exercises(WORKOUT, workout.id, workout.exercises)
+
+    def remove_workout(self, workout_id: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM workouts WHERE id = ?", (workout_id,))
+            self._delete_exercises(WORKOUT, workout_id)
+
+    def get_workout(self, workout_id: str) -> Optional[Workout]:
+        workouts = self._workouts("WHERE id = ?", (workout_id,))
+        return workouts[0] if workouts else None
+
+    def workouts(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> list[Workout]:
+        return self._workouts_between([], [], start, end, limit, offset)
+
+    def workouts_with_exercise(
+        self,
+        exercise_template_id: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> list[Workout]:
+        return self._workouts_between(
+            [
+                "id IN (SELECT owner_id FROM exercises"
+                " WHERE exercise_template_id = ? AND owner_type = ?)"
+            ],
+            [exercise_template_id, WORKOUT],
+            start,
+            end,
+            limit,
+        )
+
+    def workout_count(self) -> int:
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM workouts").fetchone()
+        return row[0]
+
+    def _workouts_between(
+        self,
+        clauses: list[str],
+        parameters: list[Any],
+        start: Optional[datetime],
+        end: Optional[datetime],
+        limit: Optional[int],
+        offset: int = 0,
+    ) -> list[Workout]:
+        # Newest first like the API, start is inclusive and end exclusive
+        if start is not None:
+            clauses.append("start_time >= ?")
+            parameters.append(_timestamp(start))
+        if end is not None:
+            clauses.append("start_time < ?")
+            parameters.append(_timestamp(end))
+        query = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        query += " ORDER BY start_time DESC"
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            parameters.extend([limit, offset])
+        return self._workouts(query, parameters)
+
+    # Routines
+    def add_routine(self, routine: Routine) -> None:
+        self.add_routines([routine])
+
+    def add_routines(self, routines: Iterable[Routine]) -> None:
+        synced_at = time.time()
+        with self._lock, self._connection:
+            for routine in routines:
+                self._delete_exercises(ROUTINE, routine.id)
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO routines VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        routine.id,
+                        routine.title,
+                        routine.folder_id,
+                        _timestamp(routine.updated_at),
+                        _timestamp(routine.created_at),
+                        synced_at,
+                    ),
+                )
+                self._insert_exercises(ROUTINE, routine.id, routine.exercises)
+
+    def remove_routine(self, routine_id: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM routines WHERE id = ?", (routine_id,))
+            self._delete_exercises(ROUTINE, routine_id)
+
+    def get_routine(self, routine_id: str) -> Optional[Routine]:
+        routines = self._routines("WHERE id = ?", (routine_id,))
+        return routines[0] if routines else None
+
+    def routines(self, limit: int = -1, offset: int = 0) -> list[Routine]:
+        return self._routines(
+            "ORDER BY updated_at DESC LIMIT ? OFFSET ?", (limit, offset)
+        )
+
+    def routine_count(self) -> int:
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM routines").fetchone()
+        return row[0]
+
+    # Exercise templates
+    def add_exercise_templates(self, templates: Iterable[ExerciseTemplate]) -> None:
+        synced_at = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO exercise_templates VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        template.id,
+                        template.title,
+                        template.type,
+                        template.primary_muscle_group,
+                        json.dumps(template.secondary_muscle_groups),
+                        template.is_custom,
+                        synced_at,
+                    )
+                    for template in templates
+                ],
+            )
+
+    def get_exercise_template(
+        self, exercise_template_id: str
+    ) -> Optional[ExerciseTemplate]:
+        templates = self._exercise_templates("WHERE id = ?", (exercise_template_id,))
+        return templates[0] if templates else None
+
+    def exercise_templates(self) -> list[ExerciseTemplate]:
+        return self._exercise_templates("ORDER BY title", ())
+
+    # Client responses
+    def load_response(
+        self,
+        entity_id: str,
+        response_type: type[BaseResponse],
+        max_age: Optional[float] = None,
+    ) -> Optional[BaseResponse]:
+        # Copies synced more than max_age seconds ago are left to the API, they
+        # may have been edited elsewhere since
+        data: Optional[dict[str, Any]] = None
+        if response_type is WorkoutResponse:
+            workout = self.get_workout(entity_id)
+            data = workout.model_dump(mode="json") if workout else None
+            table = "workouts"
+        elif response_type is RoutineResponse:
+            routine = self.get_routine(entity_id)
+            data = {"routine": routine.model_dump(mode="json")} if routine else None
+            table = "routines"
+        elif response_type is ExerciseTemplateResponse:
+            template = self.get_exercise_template(entity_id)
+            data = template.model_dump(mode="json") if template else None
+            table = "exercise_templates"
+        if data is None:
+            return None
+        if (
+            max_age is not None
+            and time.time() - self._synced_at(table, [entity_id]) > max_age
+        ):
+            return None
+        return response_type(data=data, status_code=200, headers={})
+
+    def load_stale(
+        self, request: BaseRequest
+    ) -> Optional[tuple[dict[str, Any], float]]:
+        # Rebuilds the payload the API would have sent for this request from
+        # whatever was mirrored, along with when the oldest part was synced
+        data: dict[str, Any]
+        if isinstance(request, GetWorkoutRequest):
+            workout = self.get_workout(request.workout_id)
+            if workout is None:
+                return None
+            data, table, ids = workout.model_dump(mode="json"), "workouts", [workout.id]
+        elif isinstance(request, GetRoutineRequest):
+            routine = self.get_routine(request.routine_id)
+            if routine is None:
+                return None
+            data = {"routine": routine.model_dump(mode="json")}
+            table, ids = "routines", [routine.id]
+        elif isinstance(request, GetExerciseTemplate):
+            template = self.get_exercise_template(request.exercise_id)
+            if template is None:
+                return None
+            data = template.model_dump(mode="json")
+            table, ids = "exercise_templates", [template.id]
+        elif isinstance(request, GetWorkoutsRequest):
+            offset = (request.page_number - 1) * request.page_size
+            workouts = self.workouts(limit=request.page_size, offset=offset)
+            if not workouts:
+                return None
+            data = {
+                "page": request.page_number,
+                "page_count": -(-self.workout_count() // request.page_size),
+                "workouts": [workout.model_dump(mode="json") for workout in workouts],
+            }
+            table, ids = "workouts", [workout.id for workout in workouts]
+        elif isinstance(request, GetRoutinesRequest):
+            offset = (request.page_number - 1) * request.page_size
+            routines = self.routines(limit=request.page_size, offset=offset)
+            if not routines:
+                return None
+            data = {
+                "page": request.page_number,
+                "page_count": -(-self.routine_count() // request.page_size),
+                "routines": [routine.model_dump(mode="json") for routine in routines],
+            }
+            table, ids = "routines", [routine.id for routine in routines]
+        elif isinstance(request, GetWorkoutsCountRequest):
+            count = self.workout_count()
+            if not count:
+                return None
+            data, table, ids = {"workout_count": count}, "workouts", None
+        else:
+            return None
+        return data, self._synced_at(table, ids)
+
+    def store_response(self, response: BaseResponse) -> None:
+        if not response.is_success:
+            return
+        if isinstance(response, WorkoutResponse) and response.workout:
+            self.add_workout(response.workout)
+        elif isinstance(response, WorkoutsResponse):
+            self.add_workouts(response.workouts)
+        elif isinstance(response, RoutineResponse) and response.routine:
+            self.add_routine(response.routine)
+        elif isinstance(response, RoutinesResponse):
+            self.add_routines(response.routines)
+        elif isinstance(response, ExerciseTemplateResponse):
+            if response.exercise_template:
+                self.add_exercise_templates([response.exercise_template])
+        elif isinstance(response, ExerciseTemplatesResponse):
+            self.add_exercise_templates(response.exercise_templates)
+
+    # Row mapping
+    def _synced_at(self, table: str, ids: Optional[list[str]]) -> float:
+        query, parameters = f"SELECT MIN(synced_at) FROM {table}", ()
+        if ids is not None:
+            query += f" WHERE id IN ({', '.join('?' * len(ids))})"
+            parameters = tuple(ids)
+        with self._lock:
+            return self._connection.execute(query, parameters).fetchone()[0]
+
+    def _workouts(self, where: str, parameters: Iterable[Any]) -> list[Workout]:
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT * FROM workouts {where}", tuple(parameters)
+            ).fetchall()
+            exercises = self._exercises(WORKOUT, [row["id"] for row in rows])
+        return [
+            Workout(
+                id=row["id"],
+                title=row["title"],
+                description=row["description"],
+                start_time=row["start_time"],
+                end_time=row["end_time"],
+                updated_at=row["updated_at"],
+                created_at=row["created_at"],
+                exercises=exercises.get(row["id"], []),
+            )
+            for row in rows
+        ]
+
+    def _routines(self, where: str, parameters: Iterable[Any]) -> list[Routine]:
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT * FROM routines {where}", tuple(parameters)
+            ).fetchall()
+            exercises = self._exercises(ROUTINE, [row["id"] for row in rows])
+        return [
+            Routine(
+                id=row["id"],
+                title=row["title"],
+                folder_id=row["folder_id"],
+                updated_at=row["updated_at"],
+                created_at=row["created_at"],
+                exercises=exercises.get(row["id"], []),
+            )
+            for row in rows
+        ]
+
+    def _exercise_templates(
+        self, where: str, parameters: Iterable[Any]
+    ) -> list[ExerciseTemplate]:
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT * FROM exercise_templates {where}", tuple(parameters)
+            ).fetchall()
+        return [
+            ExerciseTemplate(
+                id=row["id"],
+                title=row["title"],
+                type=row["type"],
+                primary_muscle_group=row["primary_muscle_group"],
+                secondary_muscle_groups=json.loads(row["secondary_muscle_groups"]),
+                is_custom=bool(row["is_custom"]),
+            )
+            for row in rows
+        ]
+
+    def _exercises(
+        self, owner_type: str, owner_ids: list[str]
+    ) -> dict[str, list[Exercise]]:
+        sets: dict[tuple[str, int], list[dict[str, Any]]] = {}
+        exercises: dict[str, list[Exercise]] = {}
+        for chunk in _chunks(owner_ids):
+            placeholders = ", ".join("?" * len(chunk))
+            for row in self._connection.execute(
+                f"SELECT * FROM sets WHERE owner_type = ? AND owner_id IN ({placeholders})"
+                " ORDER BY owner_id, exercise_idx, idx",
+                (owner_type, *chunk),
+            ):
+                set_data = {column: row[column] for column in SET_COLUMNS}
+                sets.setdefault((row["owner_id"], row["exercise_idx"]), []).append(
+                    {"index": row["idx"], **set_data}
+                )
+            for row in self._connection.execute(
+                "SELECT * FROM exercises"
+                f" WHERE owner_type = ? AND owner_id IN ({placeholders})"
+                " ORDER BY owner_id, idx",
+                (owner_type, *chunk),
+            ):
+                exercises.setdefault(row["owner_id"], []).append(
+                    Exercise(
+                        index=row["idx"],
+                        title=row["title"],
+                        notes=row["notes"],
+                        exercise_template_id=row["exercise_template_id"],
+                        supersets_id=row["supersets_id"],
+                        sets=sets.get((row["owner_id"], row["idx"]), []),
+                    )
+                )
+        return exercises
+
+    def _insert_exercises(
+        self, owner_type: str, owner_id: str, exercises: list[Exercise]
+    ) -> None:
+        self._connection.executemany(
+            "INSERT INTO exercises VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    owner_type,
+                    owner_id,
+                    exercise.index,
+                    exercise.title,
+                    exercise.notes,
+                    exercise.exercise_template_id,
+                    exercise.supersets_id,
+                )
+                for exercise in exercises
+            ],
+        )
+        self._connection.executemany(
+            "INSERT INTO sets VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    owner_type,
+                    owner_id,
+                    exercise.index,
+                    set.index,
+                    *(getattr(set, column) for column in SET_COLUMNS),
+                )
+                for exercise in exercises
+                for set in exercise.sets
+            ],
+        )
+
+    def _delete_exercises(self, owner_type: str, owner_id: str) -> None:
+        for table in ("exercises", "sets"):
+            self._connection.execute(
+                f"DELETE FROM {table} WHERE owner_type = ? AND owner_id = ?",
+                (owner_type, owner_id),
+            )
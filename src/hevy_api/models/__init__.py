@@ -1,9 +1,19 @@
-from .model import Exercise, ExerciseTemplate, Routine, Set, Workout, WorkoutCount
+from .base import HevyAPIError
+from .model import (
+    Exercise,
+    ExerciseTemplate,
+    Routine,
+    Set,
+    Workout,
+    WorkoutCount,
+    WorkoutEvent,
+)
 from .request import (
     GetExerciseTemplate,
     GetExerciseTemplates,
     GetRoutineRequest,
     GetRoutinesRequest,
+    GetWorkoutEventsRequest,
     GetWorkoutRequest,
     GetWorkoutsCountRequest,
     GetWorkoutsRequest,
@@ -18,6 +28,7 @@ from .response import (
     RoutineResponse,
     RoutinesResponse,
     WorkoutCountResponse,
+    WorkoutEventsResponse,
     WorkoutResponse,
     WorkoutsResponse,
 )
@@ -30,6 +41,7 @@ __all__ = [
     "GetRoutinesRequest",
     "PutRoutineRequest",
     "PostRoutineRequest",
+    "GetWorkoutEventsRequest",
     "GetWorkoutRequest",
     "GetWorkoutsCountRequest",
     "GetWorkoutsRequest",
@@ -39,10 +51,12 @@ __all__ = [
     "RoutineResponse",
     "RoutinesResponse",
     "WorkoutCountResponse",
+    "WorkoutEventsResponse",
     "WorkoutResponse",
     "WorkoutsResponse",
     "ExerciseTemplateResponse",
     "ExerciseTemplatesResponse",
+    "HevyAPIError",
     # Model
     "Exercise",
     "ExerciseTemplate",
@@ -50,4 +64,5 @@ __all__ = [
     "Set",
     "Workout",
     "WorkoutCount",
+    "WorkoutEvent",
 ]
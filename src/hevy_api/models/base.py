@@ -1,8 +1,18 @@
+import copy
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from datetime import timedelta
+from typing import Any, Optional, TypeVar
+
+R = TypeVar("R", bound="BaseResponse")
+
+# Headers a compacted response keeps, compared lowercase
+KEPT_HEADERS = {"content-type", "date", "etag", "last-modified"}
 
 
 class BaseRequest(ABC):
+    # Set by paged requests, so traces can tell the pages of a route apart
+    page_number: Optional[int] = None
+
     def __init__(self, headers: Optional[dict[str, str]] = None):
         self.headers = headers or {}
 
@@ -17,17 +27,67 @@ class BaseRequest(ABC):
     def get_body(self) -> dict[str, Any]:
         return {}
 
+    def get_route(self) -> str:
+        # Endpoint without IDs or query, so metrics group by route
+        return self.get_endpoint().split("?")[0]
+
+
+class HevyAPIError(Exception):
+    def __init__(self, response: "BaseResponse"):
+        if response.parse_error is not None:
+            message = f"Hevy API response could not be parsed: {response.parse_error}"
+        else:
+            message = f"Hevy API error {response.status_code}: {response.data}"
+        super().__init__(message)
+        self.response = response
+
 
 class BaseResponse:
     def __init__(self, data: Any, status_code: int, headers: dict[str, str]):
         self.data = data
         self.status_code = status_code
         self.headers = headers
+        # Only set on responses served from fallback data while the API is down
+        self.age: Optional[timedelta] = None
+        # Set by subclasses when the data could not be turned into models
+        self.parse_error: Optional[Exception] = None
 
     @property
     def is_success(self) -> bool:
         return 200 <= self.status_code < 400
 
+    @property
+    def is_stale(self) -> bool:
+        return self.age is not None
+
+    @property
+    def is_unavailable(self) -> bool:
+        # Network failures are reported with a status code of 0
+        return self.status_code == 0 or self.status_code >= 500
+
     @property
     def is_error(self) -> bool:
         return not self.is_success
+
+    def raise_for_status(self) -> None:
+        # A success whose data failed to parse would otherwise look empty
+        if self.is_error or self.parse_error is not None:
+            raise HevyAPIError(self)
+
+    def compact(self) -> None:
+        # Drops the decoded JSON once the models hold the same data, about a
+        # quarter of what a cached response costs. Errors and responses that
+        # failed to parse keep it for debugging.
+        if self.is_success and self.parse_error is None:
+            self.data = None
+            self.headers = {
+                name: value
+                for name, value in self.headers.items()
+                if name.lower() in KEPT_HEADERS
+            }
+
+    def as_stale(self: R, age: timedelta) -> R:
+        # Shallow copy, so the cached original is never flagged itself
+        stale = copy.copy(self)
+        stale.age = age
+        return stale
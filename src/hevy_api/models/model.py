@@ -1,8 +1,20 @@
+import hashlib
+import json
 from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel
 
+# Assigned by the server, a PUT body never changes them
+SERVER_FIELDS = {"id", "updated_at", "created_at"}
+
+
+def _fingerprint(model: BaseModel) -> str:
+    # Stable across processes: canonical JSON of the fields a write can change
+    content = model.model_dump(mode="json", exclude=SERVER_FIELDS)
+    canonical = json.dumps(content, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
 
 class WorkoutCount(BaseModel):
     workout_count: int
@@ -61,6 +73,10 @@ class Workout(BaseModel):
     def duration(self):
         return self.end_time - self.start_time
 
+    @property
+    def fingerprint(self) -> str:
+        return _fingerprint(self)
+
     @property
     def summary(self):
         summary = self.model_dump(
@@ -73,6 +89,21 @@ class Workout(BaseModel):
         return summary
 
 
+class WorkoutEvent(BaseModel):
+    type: str
+    workout: Optional[Workout] = None
+    id: Optional[str] = None
+    deleted_at: Optional[datetime] = None
+
+    @property
+    def workout_id(self) -> str:
+        return self.workout.id if self.workout is not None else self.id or ""
+
+    @property
+    def timestamp(self) -> Optional[datetime]:
+        return self.workout.updated_at if self.workout is not None else self.deleted_at
+
+
 class Routine(BaseModel):
     id: str
     title: str
@@ -81,6 +112,10 @@ class Routine(BaseModel):
     created_at: datetime
     exercises: list[Exercise]
 
+    @property
+    def fingerprint(self) -> str:
+        return _fingerprint(self)
+
     @property
     def summary(self):
         summary = self.model_dump(include={"id", "title"}, exclude_none=True)
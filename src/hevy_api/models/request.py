@@ -1,4 +1,6 @@
+from datetime import datetime
 from typing import Any
+from urllib.parse import quote
 
 from hevy_api.models.base import BaseRequest
 from hevy_api.models.model import Routine, Workout
@@ -38,6 +40,9 @@ class GetExerciseTemplate(BaseRequest):
     def get_endpoint(self) -> str:
         return f"/v1/exercise_templates/{self.exercise_id}"
 
+    def get_route(self) -> str:
+        return "/v1/exercise_templates/{exerciseTemplateId}"
+
     def get_method(self) -> str:
         return "GET"
 
@@ -55,6 +60,25 @@ class GetWorkoutsRequest(BaseRequest):
         return "GET"
 
 
+class GetWorkoutEventsRequest(BaseRequest):
+    def __init__(
+        self, page_number: int, page_size: int, since: datetime, **kwargs: Any
+    ) -> None:
+        super().__init__(**kwargs)
+        self.page_number = page_number
+        self.page_size = page_size
+        self.since = since
+
+    def get_endpoint(self) -> str:
+        return (
+            f"/v1/workouts/events?page={self.page_number}&pageSize={self.page_size}"
+            f"&since={quote(self.since.isoformat())}"
+        )
+
+    def get_method(self) -> str:
+        return "GET"
+
+
 class GetWorkoutRequest(BaseRequest):
     def __init__(self, workout_id: str, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -63,6 +87,9 @@ class GetWorkoutRequest(BaseRequest):
     def get_endpoint(self) -> str:
         return f"/v1/workouts/{self.workout_id}"
 
+    def get_route(self) -> str:
+        return "/v1/workouts/{workoutId}"
+
     def get_method(self) -> str:
         return "GET"
 
@@ -76,11 +103,14 @@ class PutWorkoutRequest(BaseRequest):
     def get_endpoint(self) -> str:
         return f"/v1/workouts/{self.workout_id}"
 
+    def get_route(self) -> str:
+        return "/v1/workouts/{workoutId}"
+
     def get_method(self) -> str:
         return "PUT"
 
     def get_body(self) -> dict[str, Any]:
-        return self.workout.model_dump()
+        return self.workout.model_dump(mode="json")
 
 
 class PostWorkoutRequest(BaseRequest):
@@ -95,7 +125,7 @@ class PostWorkoutRequest(BaseRequest):
         return "POST"
 
     def get_body(self) -> dict[str, Any]:
-        return self.workout.model_dump()
+        return self.workout.model_dump(mode="json")
 
 
 class GetRoutinesRequest(BaseRequest):
@@ -119,6 +149,9 @@ class GetRoutineRequest(BaseRequest):
     def get_endpoint(self) -> str:
         return f"/v1/routines/{self.routine_id}"
 
+    def get_route(self) -> str:
+        return "/v1/routines/{routineId}"
+
     def get_method(self) -> str:
         return "GET"
 
@@ -132,11 +165,14 @@ class PutRoutineRequest(BaseRequest):
     def get_endpoint(self) -> str:
         return f"/v1/routines/{self.routine_id}"
 
+    def get_route(self) -> str:
+        return "/v1/routines/{routineId}"
+
     def get_method(self) -> str:
         return "PUT"
 
     def get_body(self) -> dict[str, Any]:
-        return self.routine.model_dump()
+        return self.routine.model_dump(mode="json")
 
 
 class PostRoutineRequest(BaseRequest):
@@ -151,4 +187,4 @@ class PostRoutineRequest(BaseRequest):
         return "POST"
 
     def get_body(self) -> dict[str, Any]:
-        return self.routine.model_dump()
+        return self.routine.model_dump(mode="json")
@@ -1,7 +1,13 @@
 from typing import Any, Optional
 
 from hevy_api.models.base import BaseResponse
-from hevy_api.models.model import ExerciseTemplate, Routine, Workout, WorkoutCount
+from hevy_api.models.model import (
+    ExerciseTemplate,
+    Routine,
+    Workout,
+    WorkoutCount,
+    WorkoutEvent,
+)
 
 
 class WorkoutCountResponse(BaseResponse):
@@ -13,6 +19,7 @@ class WorkoutCountResponse(BaseResponse):
                 self.workout_count: Optional[WorkoutCount] = WorkoutCount(**data)
             except Exception as e:
                 print("Failed to serialize WorkoutCountResponse: ", e)
+                self.parse_error = e
                 self.workout_count = None
         else:
             self.workout_count = None
@@ -29,6 +36,7 @@ class ExerciseTemplateResponse(BaseResponse):
                 )
             except Exception as e:
                 print("Failed to serialize ExerciseTemplateResponse: ", e)
+                self.parse_error = e
                 self.exercise_template = None
         else:
             self.exercise_template = None
@@ -37,16 +45,19 @@ class ExerciseTemplateResponse(BaseResponse):
 class ExerciseTemplatesResponse(BaseResponse):
     def __init__(self, data: Any, status_code: int, headers: dict[str, str]) -> None:
         super().__init__(data, status_code, headers)
+        self.page: int = 0
+        self.page_count: int = 0
         if self.is_success and data:
             try:
-                self.page: int = data["page"]
-                self.page_count: int = data["page_count"]
+                self.page = data["page"]
+                self.page_count = data["page_count"]
                 self.exercise_templates: list[ExerciseTemplate] = [
                     ExerciseTemplate(**exercise_template)
                     for exercise_template in data["exercise_templates"]
                 ]
             except Exception as e:
                 print("Failed to serialize ExerciseTemplatesResponse: ", e)
+                self.parse_error = e
                 self.exercise_templates = []
         else:
             self.exercise_templates = []
@@ -55,21 +66,45 @@ class ExerciseTemplatesResponse(BaseResponse):
 class WorkoutsResponse(BaseResponse):
     def __init__(self, data: Any, status_code: int, headers: dict[str, str]) -> None:
         super().__init__(data, status_code, headers)
+        self.page: int = 0
+        self.page_count: int = 0
         # Only create Workouts model if response is successful and data is valid
         if self.is_success and data:
             try:
-                self.page: int = data["page"]
-                self.page_count: int = data["page_count"]
+                self.page = data["page"]
+                self.page_count = data["page_count"]
                 self.workouts: list[Workout] = [
                     Workout(**workout_data) for workout_data in data["workouts"]
                 ]
             except Exception as e:
                 print("Failed to serialize WorkoutsResponse: ", e)
+                self.parse_error = e
                 self.workouts = []
         else:
             self.workouts = []
 
 
+class WorkoutEventsResponse(BaseResponse):
+    def __init__(self, data: Any, status_code: int, headers: dict[str, str]) -> None:
+        super().__init__(data, status_code, headers)
+        self.page: int = 0
+        self.page_count: int = 0
+        # Only create WorkoutEvent models if response is successful and data is valid
+        if self.is_success and data:
+            try:
+                self.page = data["page"]
+                self.page_count = data["page_count"]
+                self.events: list[WorkoutEvent] = [
+                    WorkoutEvent(**event_data) for event_data in data["events"]
+                ]
+            except Exception as e:
+                print("Failed to serialize WorkoutEventsResponse: ", e)
+                self.parse_error = e
+                self.events = []
+        else:
+            self.events = []
+
+
 class WorkoutResponse(BaseResponse):
     def __init__(self, data: Any, status_code: int, headers: dict[str, str]) -> None:
         super().__init__(data, status_code, headers)
@@ -79,6 +114,7 @@ class WorkoutResponse(BaseResponse):
                 self.workout: Optional[Workout] = Workout(**data)
             except Exception as e:
                 print("Failed to serialize WorkoutResponse: ", e)
+                self.parse_error = e
                 self.workout = None
         else:
             self.workout = None
@@ -87,16 +123,19 @@ class WorkoutResponse(BaseResponse):
 class RoutinesResponse(BaseResponse):
     def __init__(self, data: Any, status_code: int, headers: dict[str, str]) -> None:
         super().__init__(data, status_code, headers)
+        self.page: int = 0
+        self.page_count: int = 0
         # Only create Routines model if response is successful and data is valid
         if self.is_success and data:
             try:
-                self.page: int = data["page"]
-                self.page_count: int = data["page_count"]
+                self.page = data["page"]
+                self.page_count = data["page_count"]
                 self.routines: list[Routine] = [
                     Routine(**routine_data) for routine_data in data["routines"]
                 ]
             except Exception as e:
                 print("Failed to serialize RoutinesResponse: ", e)
+                self.parse_error = e
                 self.routines = []
         else:
             self.routines = []
@@ -111,6 +150,7 @@ class RoutineResponse(BaseResponse):
                 self.routine: Optional[Routine] = Routine(**data["routine"])
             except Exception as e:
                 print("Failed to serialize RoutineResponse: ", e)
+                self.parse_error = e
                 self.routine = None
         else:
             self.routine = None
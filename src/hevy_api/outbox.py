@@ -0,0 +1,337 @@
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from pydantic import BaseModel
+
+from hevy_api.batch import run_batch
+from hevy_api.models.base import BaseResponse
+from hevy_api.models.model import Routine, Workout
+
+if TYPE_CHECKING:
+    from hevy_api.client import HevyClient
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    -- Writes sharing an entity key are sent one at a time, in order
+    entity_key TEXT NOT NULL,
+    entity_id TEXT,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    sent_at REAL
+);
+CREATE INDEX IF NOT EXISTS outbox_entity ON outbox (entity_key, seq);
+"""
+
+WORKOUT = "workout"
+ROUTINE = "routine"
+CREATE = "create"
+UPDATE = "update"
+
+PENDING = "pending"
+SENDING = "sending"
+FAILED = "failed"
+SENT = "sent"
+
+_MODELS: dict[str, type[Union[Workout, Routine]]] = {
+    WORKOUT: Workout,
+    ROUTINE: Routine,
+}
+
+
+class OutboxEntry(BaseModel):
+    key: str
+    kind: str
+    operation: str
+    entity_id: Optional[str] = None
+    status: str
+    attempts: int
+    last_error: Optional[str] = None
+
+
+class Outbox:
+    # Durable write-behind queue: writes return once they are on disk, and a
+    # background flusher sends them with retries. Successful writes are kept
+    # as sent for sent_retention seconds so their keys stay deduplicated,
+    # writes the API rejects are kept as failed for inspection.
+    def __init__(
+        self,
+        client: "HevyClient",
+        path: Union[str, Path] = ":memory:",
+        max_attempts: int = 8,
+        retry_delay: float = 1.0,
+        flush_interval: float = 5.0,
+        batch_size: int = 32,
+        max_workers: int = 4,
+        sent_retention: float = 24 * 60 * 60,
+    ):
+        self.client = client
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.sent_retention = sent_retention
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        with self._lock, self._connection:
+            self._connection.executescript(SCHEMA)
+            # Whatever was in flight when we last stopped is sent again
+            self._connection.execute(
+                "UPDATE outbox SET status = ? WHERE status = ?", (PENDING, SENDING)
+            )
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def close(self) -> None:
+        self.stop()
+        with self._lock:
+            self._connection.close()
+
+    # Writes
+    def create_workout(self, workout: Workout, key: Optional[str] = None) -> str:
+        return self._enqueue(WORKOUT, CREATE, None, workout, key)
+
+    def update_workout(
+        self, workout_id: str, workout: Workout, key: Optional[str] = None
+    ) -> str:
+        return self._enqueue(WORKOUT, UPDATE, workout_id, workout, key)
+
+    def create_routine(self, routine: Routine, key: Optional[str] = None) -> str:
+        return self._enqueue(ROUTINE, CREATE, None, routine, key)
+
+    def update_routine(
+        self, routine_id: str, routine: Routine, key: Optional[str] = None
+    ) -> str:
+        return self._enqueue(ROUTINE, UPDATE, routine_id, routine, key)
+
+    # Inspection
+    def get(self, key: str) -> Optional[OutboxEntry]:
+        # None for keys that were never queued or were sent before the
+        # retention window
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT * FROM outbox WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else _entry(row)
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM outbox WHERE status IN (?, ?)",
+                (PENDING, SENDING),
+            ).fetchone()[0]
+
+    def failed(self) -> list[OutboxEntry]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT * FROM outbox WHERE status = ? ORDER BY seq", (FAILED,)
+            ).fetchall()
+        return [_entry(row) for row in rows]
+
+    def retry_failed(self) -> int:
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "UPDATE outbox SET status = ?, attempts = 0, next_attempt_at = 0"
+                " WHERE status = ?",
+                (PENDING, FAILED),
+            )
+        self._wakeup.set()
+        return cursor.rowcount
+
+    # Flushing
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="hevy-outbox", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def flush(self) -> int:
+        # Sends everything that is due right now, returns the number of
+        # writes that went through
+        self._prune()
+        sent = 0
+        while True:
+            entries = self._claim()
+            if not entries:
+                return sent
+            sent += self._send(entries)
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                self.flush()
+            except Exception as e:
+                # Keep the flusher alive, the writes stay queued
+                print("Outbox flush failed: ", e)
+            self._wakeup.wait(self._next_wait())
+            self._wakeup.clear()
+
+    def _next_wait(self) -> float:
+        with self._lock:
+            next_attempt_at = self._connection.execute(
+                "SELECT MIN(next_attempt_at) FROM outbox WHERE status = ?",
+                (PENDING,),
+            ).fetchone()[0]
+        if next_attempt_at is None:
+            return self.flush_interval
+        return min(max(next_attempt_at - time.time(), 0.0), self.flush_interval)
+
+    def _enqueue(
+        self,
+        kind: str,
+        operation: str,
+        entity_id: Optional[str],
+        entity: Union[Workout, Routine],
+        key: Optional[str],
+    ) -> str:
+        # A caller's own key has to stay visible through get(), so only writes
+        # without one are folded into an earlier queued update
+        coalesce = key is None
+        key = key or uuid.uuid4().hex
+        payload = entity.model_dump_json()
+        with self._lock, self._connection:
+            # Enqueuing a known key again is a no-op, even after it was sent,
+            # which makes retried handler calls safe
+            if self._connection.execute(
+                "SELECT 1 FROM outbox WHERE key = ?", (key,)
+            ).fetchone():
+                return key
+
+            if operation == UPDATE and coalesce:
+                # A PUT replaces the whole entity, so an update still waiting
+                # for its first attempt can simply take the newer payload
+                cursor = self._connection.execute(
+                    "UPDATE outbox SET payload = ? WHERE seq = ("
+                    " SELECT MAX(seq) FROM outbox WHERE entity_key = ?"
+                    ") AND operation = ? AND status = ? AND attempts = 0",
+                    (payload, f"{kind}:{entity_id}", UPDATE, PENDING),
+                )
+                if cursor.rowcount:
+                    row = self._connection.execute(
+                        "SELECT key FROM outbox WHERE entity_key = ?"
+                        " ORDER BY seq DESC LIMIT 1",
+                        (f"{kind}:{entity_id}",),
+                    ).fetchone()
+                    self._wakeup.set()
+                    return row["key"]
+
+            entity_key = f"{kind}:{entity_id if operation == UPDATE else key}"
+            self._connection.execute(
+                "INSERT INTO outbox (key, kind, operation, entity_key,"
+                " entity_id, payload, status, next_attempt_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                (key, kind, operation, entity_key, entity_id, payload, PENDING),
+            )
+        self._wakeup.set()
+        return key
+
+    def _claim(self) -> list[sqlite3.Row]:
+        # Due writes whose entity has nothing older still queued
+        with self._lock, self._connection:
+            rows = self._connection.execute(
+                "SELECT * FROM outbox AS o WHERE status = ? AND next_attempt_at <= ?"
+                " AND NOT EXISTS (SELECT 1 FROM outbox AS p"
+                "  WHERE p.entity_key = o.entity_key AND p.seq < o.seq"
+                "  AND p.status IN (?, ?))"
+                " ORDER BY seq LIMIT ?",
+                (PENDING, time.time(), PENDING, SENDING, self.batch_size),
+            ).fetchall()
+            self._connection.executemany(
+                "UPDATE outbox SET status = ? WHERE seq = ?",
+                [(SENDING, row["seq"]) for row in rows],
+            )
+        return rows
+
+    def _send(self, rows: list[sqlite3.Row]) -> int:
+        result = run_batch(self._submit, rows, self.max_workers)
+        sent = 0
+        now = time.time()
+        with self._lock, self._connection:
+            for row, response in result:
+                if response.is_success:
+                    self._connection.execute(
+                        "UPDATE outbox SET status = ?, sent_at = ? WHERE seq = ?",
+                        (SENT, now, row["seq"]),
+                    )
+                    sent += 1
+                    continue
+
+                attempts = row["attempts"] + 1
+                retryable = response.is_unavailable or response.status_code == 429
+                status = (
+                    PENDING if retryable and attempts < self.max_attempts else FAILED
+                )
+                # Exponential backoff between attempts
+                next_attempt_at = now + self.retry_delay * 2 ** (attempts - 1)
+                self._connection.execute(
+                    "UPDATE outbox SET status = ?, attempts = ?,"
+                    " next_attempt_at = ?, last_error = ? WHERE seq = ?",
+                    (
+                        status,
+                        attempts,
+                        next_attempt_at,
+                        f"{response.status_code}: {response.data}",
+                        row["seq"],
+                    ),
+                )
+        return sent
+
+    def _prune(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM outbox WHERE status = ? AND sent_at < ?",
+                (SENT, time.time() - self.sent_retention),
+            )
+
+    def _submit(self, row: sqlite3.Row) -> BaseResponse:
+        entity: Any = _MODELS[row["kind"]].model_validate_json(row["payload"])
+        if row["kind"] == WORKOUT:
+            if row["operation"] == CREATE:
+                return self.client.create_workout(entity)
+            return self.client.update_workout(row["entity_id"], entity)
+        if row["operation"] == CREATE:
+            return self.client.create_routine(entity)
+        return self.client.update_routine(row["entity_id"], entity)
+
+    def __enter__(self) -> "Outbox":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+def _entry(row: sqlite3.Row) -> OutboxEntry:
+    return OutboxEntry(
+        key=row["key"],
+        kind=row["kind"],
+        operation=row["operation"],
+        entity_id=row["entity_id"],
+        status=row["status"],
+        attempts=row["attempts"],
+        last_error=row["last_error"],
+    )
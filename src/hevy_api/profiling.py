@@ -0,0 +1,157 @@
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from hevy_api.tracing import Span, SpanExporter, Tracer
+
+# Where the time of each client span goes; a span's own time excludes the
+# time of the spans nested in it
+PHASES = {
+    "hevy.get": "cache",
+    "hevy.execute": "client",
+    "http.attempt": "io",
+    "rate_limiter.acquire": "rate_limit",
+    "json.decode": "parse",
+    "validate": "validate",
+}
+
+
+class PhaseStats(BaseModel):
+    calls: int = 0
+    wall_seconds: float = 0.0
+    # CPU time of the calling thread, low next to wall time means waiting
+    cpu_seconds: float = 0.0
+    # Net bytes still allocated when the phase ends, 0 unless memory is traced
+    allocated_bytes: int = 0
+
+
+class ProfileReport(BaseModel):
+    # Keyed by "METHOD /route", then by phase
+    routes: dict[str, dict[str, PhaseStats]]
+
+    def totals(self) -> dict[str, PhaseStats]:
+        totals: defaultdict[str, PhaseStats] = defaultdict(PhaseStats)
+        for phases in self.routes.values():
+            for phase, stats in phases.items():
+                total = totals[phase]
+                total.calls += stats.calls
+                total.wall_seconds += stats.wall_seconds
+                total.cpu_seconds += stats.cpu_seconds
+                total.allocated_bytes += stats.allocated_bytes
+        return dict(totals)
+
+    def format(self) -> str:
+        lines = [
+            f"{'route':<40} {'phase':<10} {'calls':>7} {'wall s':>9}"
+            f" {'cpu s':>9} {'wall %':>7} {'alloc KiB':>10}"
+        ]
+        for route, phases in sorted(self.routes.items()):
+            route_wall = sum(stats.wall_seconds for stats in phases.values())
+            for phase, stats in sorted(
+                phases.items(), key=lambda item: -item[1].wall_seconds
+            ):
+                share = stats.wall_seconds / route_wall * 100 if route_wall else 0.0
+                lines.append(
+                    f"{route:<40} {phase:<10} {stats.calls:>7}"
+                    f" {stats.wall_seconds:>9.4f} {stats.cpu_seconds:>9.4f}"
+                    f" {share:>6.1f}% {stats.allocated_bytes / 1024:>10.1f}"
+                )
+        return "\n".join(lines)
+
+
+class _Frame:
+    __slots__ = ("route", "child_wall", "child_cpu", "child_allocated")
+
+    def __init__(self, route: Optional[str]):
+        self.route = route
+        self.child_wall = 0.0
+        self.child_cpu = 0.0
+        self.child_allocated = 0
+
+
+class _DiscardExporter:
+    def export(self, span: Span) -> None:
+        pass
+
+
+class Profiler(Tracer):
+    # A tracer that also measures wall time, thread CPU time and, optionally,
+    # tracemalloc allocations of every client span, summed per route and
+    # phase. Spans are still passed on to the exporter when one is given.
+    def __init__(
+        self, exporter: Optional[SpanExporter] = None, trace_memory: bool = True
+    ):
+        super().__init__(exporter or _DiscardExporter())
+        self.trace_memory = trace_memory
+        self._started_tracemalloc = False
+        self._frame: ContextVar[Optional[_Frame]] = ContextVar(
+            "hevy_profile_frame", default=None
+        )
+        self._stats: defaultdict[tuple[str, str], PhaseStats] = defaultdict(PhaseStats)
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        # tracemalloc slows every allocation down, so it only runs while
+        # a profile is being taken
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def report(self) -> ProfileReport:
+        routes: defaultdict[str, dict[str, PhaseStats]] = defaultdict(dict)
+        with self._lock:
+            for (route, phase), stats in sorted(self._stats.items()):
+                routes[route][phase] = stats.model_copy()
+        return ProfileReport(routes=dict(routes))
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        parent = self._frame.get()
+        route = parent.route if parent else None
+        if "route" in attributes:
+            route = f"{attributes.get('method', 'GET')} {attributes['route']}"
+        frame = _Frame(route)
+        token = self._frame.set(frame)
+        wall, cpu, allocated = time.perf_counter(), time.thread_time(), _allocated()
+        try:
+            with super().span(name, **attributes) as span:
+                yield span
+        finally:
+            self._frame.reset(token)
+            wall = time.perf_counter() - wall
+            cpu = time.thread_time() - cpu
+            # Process wide, so concurrent requests blur each other's numbers
+            allocated = _allocated() - allocated
+            if parent is not None:
+                with self._lock:
+                    parent.child_wall += wall
+                    parent.child_cpu += cpu
+                    parent.child_allocated += allocated
+            phase = PHASES.get(name)
+            if phase is not None and route is not None:
+                with self._lock:
+                    stats = self._stats[(route, phase)]
+                    stats.calls += 1
+                    stats.wall_seconds += max(wall - frame.child_wall, 0.0)
+                    stats.cpu_seconds += max(cpu - frame.child_cpu, 0.0)
+                    stats.allocated_bytes += allocated - frame.child_allocated
+
+
+def _allocated() -> int:
+    return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
@@ -0,0 +1,188 @@
+import threading
+from collections.abc import Iterable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Union
+
+from hevy_api.storage import atomic_write
+
+if TYPE_CHECKING:
+    from hevy_api.client import HevyClient
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = dict[str, str]
+
+
+class _Family:
+    def __init__(self, name: str, type: str, help: str):
+        self.name = name
+        self.type = type
+        self.help = help
+        self.samples: list[tuple[str, Labels, float]] = []
+
+    def add(self, labels: Labels, value: float, suffix: str = "") -> None:
+        self.samples.append((suffix, labels, value))
+
+    def render(self) -> Iterable[str]:
+        if not self.samples:
+            return
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {self.type}"
+        for suffix, labels, value in self.samples:
+            yield f"{self.name}{suffix}{_labels(labels)} {_value(value)}"
+
+
+class MetricsRegistry:
+    # Renders the state of the registered clients in the Prometheus text
+    # exposition format, on demand or from a small stdlib HTTP server
+    def __init__(self, namespace: str = "hevy_client"):
+        self.namespace = namespace
+        self._clients: list[tuple["HevyClient", Labels]] = []
+        self._lock = threading.Lock()
+
+    def register(self, client: "HevyClient", **labels: str) -> None:
+        # Extra labels tell several clients in one process apart
+        with self._lock:
+            self._clients.append((client, labels))
+
+    def render(self) -> str:
+        families = {
+            name: _Family(f"{self.namespace}_{name}", type, help)
+            for name, type, help in (
+                (
+                    "request_duration_seconds",
+                    "histogram",
+                    "Latency of Hevy API requests.",
+                ),
+                ("requests_total", "counter", "Hevy API requests by status."),
+                ("retries_total", "counter", "Requests retried after a 429."),
+                ("rate_limited_total", "counter", "Responses with status 429."),
+                ("request_bytes_total", "counter", "Request body bytes sent."),
+                ("response_bytes_total", "counter", "Response body bytes received."),
+                ("cache_events_total", "counter", "Response cache events."),
+                ("cache_entries", "gauge", "Responses currently cached."),
+                ("cache_hit_ratio", "gauge", "Cache hits over lookups."),
+                (
+                    "rate_limiter_wait_seconds_total",
+                    "counter",
+                    "Time spent waiting on the client-side rate limiter.",
+                ),
+                (
+                    "rate_limiter_acquisitions_total",
+                    "counter",
+                    "Requests that went through the client-side rate limiter.",
+                ),
+                ("skipped_writes_total", "counter", "Updates skipped as no-ops."),
+            )
+        }
+        with self._lock:
+            clients = list(self._clients)
+        for client, client_labels in clients:
+            self._collect(families, client, client_labels)
+
+        lines = [line for family in families.values() for line in family.render()]
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def dump(self, path: Union[str, Path]) -> None:
+        # For node_exporter's textfile collector, which must never see a
+        # partially written file
+        atomic_write(path, self.render().encode())
+
+    def serve(self, host: str = "127.0.0.1", port: int = 9464) -> ThreadingHTTPServer:
+        # Serves GET /metrics on a daemon thread, call shutdown() to stop
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                # Scrapes every few seconds would flood stderr
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(
+            target=server.serve_forever, name="hevy-metrics", daemon=True
+        ).start()
+        return server
+
+    def _collect(
+        self, families: dict[str, _Family], client: "HevyClient", labels: Labels
+    ) -> None:
+        for (method, route), stats in sorted(client.metrics.routes().items()):
+            route_labels = {**labels, "method": method, "route": route}
+            histogram = stats.latency
+            duration = families["request_duration_seconds"]
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts, strict=False):
+                cumulative += count
+                duration.add(
+                    {**route_labels, "le": _value(bound)}, cumulative, "_bucket"
+                )
+            duration.add({**route_labels, "le": "+Inf"}, histogram.count, "_bucket")
+            duration.add(route_labels, histogram.sum, "_sum")
+            duration.add(route_labels, histogram.count, "_count")
+
+            for status, count in sorted(stats.statuses.items()):
+                families["requests_total"].add(
+                    {**route_labels, "status": str(status)}, count
+                )
+            families["retries_total"].add(route_labels, stats.retries)
+            families["rate_limited_total"].add(route_labels, stats.statuses[429])
+            families["request_bytes_total"].add(route_labels, stats.bytes_sent)
+            families["response_bytes_total"].add(route_labels, stats.bytes_received)
+
+        # Entry sizes aren't exported and measuring them holds the cache lock
+        cache_stats = client.cache_stats(sizes=False)
+        for type_name, type_stats in cache_stats.types.items():
+            type_labels = {**labels, "type": type_name}
+            for event in (
+                "hits",
+                "misses",
+                "mirror_hits",
+                "stale_hits",
+                "evictions",
+                "expirations",
+            ):
+                families["cache_events_total"].add(
+                    {**type_labels, "event": event}, getattr(type_stats, event)
+                )
+            families["cache_entries"].add(type_labels, type_stats.size)
+            families["cache_hit_ratio"].add(type_labels, type_stats.hit_ratio)
+
+        rate_limiter = client.http_client.rate_limiter
+        if rate_limiter is not None:
+            families["rate_limiter_wait_seconds_total"].add(
+                labels, rate_limiter.wait_seconds
+            )
+            families["rate_limiter_acquisitions_total"].add(
+                labels, rate_limiter.acquisitions
+            )
+        families["skipped_writes_total"].add(labels, client.skipped_writes)
+
+
+def _labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return f"{{{pairs}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _value(value: float) -> str:
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
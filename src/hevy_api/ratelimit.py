@@ -0,0 +1,36 @@
+import threading
+import time
+
+
+class RateLimiter:
+    # Token bucket shared by every thread using the client: `rate` requests per
+    # second on average, with bursts of up to `burst` requests
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        # Totals for monitoring how much the limit slows callers down
+        self.acquisitions = 0
+        self.wait_seconds = 0.0
+
+    def acquire(self) -> float:
+        # Blocks until a request may go out, returns how long it waited
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            # Take the token now, even if it only becomes available later, so
+            # that waiting threads queue up in order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.acquisitions += 1
+            self.wait_seconds += wait
+        if wait > 0:
+            time.sleep(wait)
+        return wait
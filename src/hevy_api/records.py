@@ -0,0 +1,172 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Union
+
+from pydantic import BaseModel, Field
+
+from hevy_api.models.model import Set, Workout
+from hevy_api.storage import atomic_write
+
+SCALAR_RECORDS = (
+    "best_weight_kg",
+    "best_one_rep_max_kg",
+    "longest_distance_meters",
+    "longest_duration_seconds",
+)
+
+
+def estimate_one_rep_max(weight_kg: float, reps: int) -> float:
+    # Epley formula - a single rep already is the one-rep max
+    if reps == 1:
+        return weight_kg
+    return weight_kg * (1 + reps / 30)
+
+
+class Record(BaseModel):
+    value: float
+    workout_id: str
+    achieved_at: datetime
+
+    def beats(self, other: Optional["Record"]) -> bool:
+        if other is None or self.value > other.value:
+            return True
+        # Ties go to whoever got there first, independently of insertion order
+        return self.value == other.value and self.achieved_at < other.achieved_at
+
+
+class ExerciseRecords(BaseModel):
+    exercise_template_id: str
+    best_weight_kg: Optional[Record] = None
+    best_one_rep_max_kg: Optional[Record] = None
+    longest_distance_meters: Optional[Record] = None
+    longest_duration_seconds: Optional[Record] = None
+    best_reps_by_weight: dict[float, Record] = Field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.best_reps_by_weight and all(
+            getattr(self, name) is None for name in SCALAR_RECORDS
+        )
+
+    def held_by(self, workout_id: str) -> bool:
+        records = [getattr(self, name) for name in SCALAR_RECORDS]
+        records.extend(self.best_reps_by_weight.values())
+        return any(r is not None and r.workout_id == workout_id for r in records)
+
+    def add_set(self, set: Set, workout_id: str, achieved_at: datetime) -> None:
+        # Warm-up sets never count towards personal records
+        if set.type == "warmup":
+            return
+
+        def offer(name: str, value: Optional[float]) -> None:
+            if value is None or value <= 0:
+                return
+            record = Record(value=value, workout_id=workout_id, achieved_at=achieved_at)
+            if record.beats(getattr(self, name)):
+                setattr(self, name, record)
+
+        offer("best_weight_kg", set.weight_kg)
+        offer("longest_distance_meters", set.distance_meters)
+        offer("longest_duration_seconds", set.duration_seconds)
+        if set.weight_kg and set.reps:
+            offer("best_one_rep_max_kg", estimate_one_rep_max(set.weight_kg, set.reps))
+            record = Record(
+                value=set.reps, workout_id=workout_id, achieved_at=achieved_at
+            )
+            if record.beats(self.best_reps_by_weight.get(set.weight_kg)):
+                self.best_reps_by_weight[set.weight_kg] = record
+
+    def merge(self, other: "ExerciseRecords") -> None:
+        for name in SCALAR_RECORDS:
+            record = getattr(other, name)
+            if record is not None and record.beats(getattr(self, name)):
+                setattr(self, name, record)
+        for weight, record in other.best_reps_by_weight.items():
+            if record.beats(self.best_reps_by_weight.get(weight)):
+                self.best_reps_by_weight[weight] = record
+
+    def improvements_over(self, previous: Optional["ExerciseRecords"]) -> list[str]:
+        improved = []
+        for name in SCALAR_RECORDS:
+            record = getattr(self, name)
+            before = getattr(previous, name) if previous else None
+            if record is not None and (before is None or record.value > before.value):
+                improved.append(name)
+        for weight, record in sorted(self.best_reps_by_weight.items()):
+            before = previous.best_reps_by_weight.get(weight) if previous else None
+            if before is None or record.value > before.value:
+                improved.append(f"best_reps_at_{weight:g}kg")
+        return improved
+
+
+def workout_records(workout: Workout) -> dict[str, ExerciseRecords]:
+    records: dict[str, ExerciseRecords] = {}
+    for exercise in workout.exercises:
+        template_id = exercise.exercise_template_id
+        if template_id not in records:
+            records[template_id] = ExerciseRecords(exercise_template_id=template_id)
+        for set in exercise.sets:
+            records[template_id].add_set(set, workout.id, workout.start_time)
+    return records
+
+
+class PersonalRecords(BaseModel):
+    records: dict[str, ExerciseRecords] = Field(default_factory=dict)
+    # Each workout's own bests, kept so edits and deletions can be retracted
+    workouts: dict[str, dict[str, ExerciseRecords]] = Field(default_factory=dict)
+
+    def get(self, exercise_template_id: str) -> Optional[ExerciseRecords]:
+        return self.records.get(exercise_template_id)
+
+    def add_workout(self, workout: Workout) -> dict[str, list[str]]:
+        # Returns the records improved by this workout, keyed by template ID
+        contributions = workout_records(workout)
+        previous = self.workouts.get(workout.id, {})
+        self.workouts[workout.id] = contributions
+
+        improved: dict[str, list[str]] = {}
+        for template_id in contributions.keys() | previous.keys():
+            before = self.records.get(template_id)
+            if before is not None and before.held_by(workout.id):
+                # The old version of this workout held a record - rebuild it
+                after = self._recompute(template_id)
+            else:
+                after = before.model_copy(deep=True) if before else None
+                if template_id in contributions:
+                    after = after or ExerciseRecords(exercise_template_id=template_id)
+                    after.merge(contributions[template_id])
+                self._store(template_id, after)
+            if after is not None and (names := after.improvements_over(before)):
+                improved[template_id] = names
+        return improved
+
+    def remove_workout(self, workout_id: str) -> None:
+        contributions = self.workouts.pop(workout_id, {})
+        for template_id in contributions:
+            records = self.records.get(template_id)
+            if records is not None and records.held_by(workout_id):
+                self._recompute(template_id)
+
+    def save(self, path: Union[str, Path]) -> None:
+        atomic_write(path, self.model_dump_json(exclude_none=True).encode())
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "PersonalRecords":
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        return cls.model_validate_json(path.read_text())
+
+    def _recompute(self, template_id: str) -> Optional[ExerciseRecords]:
+        records = ExerciseRecords(exercise_template_id=template_id)
+        for contributions in self.workouts.values():
+            if template_id in contributions:
+                records.merge(contributions[template_id])
+        self._store(template_id, records)
+        return self.records.get(template_id)
+
+    def _store(self, template_id: str, records: Optional[ExerciseRecords]) -> None:
+        if records is None or records.is_empty:
+            self.records.pop(template_id, None)
+        else:
+            self.records[template_id] = records
@@ -0,0 +1,11 @@
+import os
+from pathlib import Path
+from typing import Union
+
+
+def atomic_write(path: Union[str, Path], data: bytes) -> None:
+    # Write to a sibling file first so a crash never leaves a torn file
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
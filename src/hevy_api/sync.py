@@ -0,0 +1,194 @@
+import json
+from collections.abc import Callable, Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Generic, Optional, Protocol, TypeVar, Union
+
+from pydantic import BaseModel, Field
+
+from hevy_api.models.model import Routine, Workout, WorkoutEvent
+from hevy_api.models.request import GetRoutinesRequest, GetWorkoutsRequest
+from hevy_api.models.response import RoutinesResponse, WorkoutsResponse
+from hevy_api.storage import atomic_write
+from hevy_api.tracing import start_span
+
+if TYPE_CHECKING:
+    from hevy_api.client import HevyClient
+
+# Starting point of a first sync, which replays the whole history once
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+T = TypeVar("T", Workout, Routine)
+
+
+class WorkoutSink(Protocol):
+    def add_workout(self, workout: Workout) -> Any: ...
+
+    def remove_workout(self, workout_id: str) -> Any: ...
+
+
+class Watermarks:
+    # Named high-water marks, persisted as a small JSON file
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        try:
+            raw = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            raw = {}
+        self._marks = {name: datetime.fromisoformat(v) for name, v in raw.items()}
+
+    def get(self, name: str) -> Optional[datetime]:
+        return self._marks.get(name)
+
+    def set(self, name: str, value: datetime) -> None:
+        self._marks[name] = value
+        raw = {name: mark.isoformat() for name, mark in sorted(self._marks.items())}
+        atomic_write(self.path, json.dumps(raw).encode())
+
+
+class SyncResult(BaseModel, Generic[T]):
+    updated: list[T] = Field(default_factory=list)
+    deleted: list[str] = Field(default_factory=list)
+    watermark: Optional[datetime] = None
+
+
+class WorkoutEventSync:
+    watermark_name: str = "workout_events"
+
+    def __init__(
+        self,
+        client: "HevyClient",
+        watermarks: Watermarks,
+        sinks: Iterable[WorkoutSink] = (),
+        page_size: int = 10,
+    ):
+        self.client = client
+        self.watermarks = watermarks
+        self.sinks = list(sinks)
+        self.page_size = page_size
+
+    def sync(self) -> SyncResult[Workout]:
+        with start_span(
+            self.client.tracer, "hevy.sync_workout_events", page_size=self.page_size
+        ) as span:
+            result = self._sync()
+            span.set(updated=len(result.updated), deleted=len(result.deleted))
+            return result
+
+    def _sync(self) -> SyncResult[Workout]:
+        since = self.watermarks.get(self.watermark_name) or EPOCH
+
+        # Only the latest event per workout matters, whatever the feed order
+        latest: dict[str, WorkoutEvent] = {}
+        page_number, page_count = 1, 1
+        while page_number <= page_count:
+            response = self.client.get_workout_events(
+                since, page_number, self.page_size
+            )
+            response.raise_for_status()
+            for event in response.events:
+                current = latest.get(event.workout_id)
+                if current is None or _newer(event, current):
+                    latest[event.workout_id] = event
+            page_number, page_count = page_number + 1, response.page_count
+
+        result = SyncResult[Workout](watermark=since)
+        for workout_id, event in latest.items():
+            if event.workout is not None:
+                self._upsert(event.workout)
+                result.updated.append(event.workout)
+            else:
+                self._delete(workout_id)
+                result.deleted.append(workout_id)
+            if event.timestamp is not None and _after(
+                event.timestamp, result.watermark
+            ):
+                result.watermark = event.timestamp
+
+        # The mark only moves once every delta is applied, so an interrupted
+        # sync is replayed in full next time
+        if result.watermark is not None and result.watermark != since:
+            self.watermarks.set(self.watermark_name, result.watermark)
+        return result
+
+    def _upsert(self, workout: Workout) -> None:
+        for sink in self.sinks:
+            sink.add_workout(workout)
+        self.client._apply_workout_change(workout.id, workout)
+
+    def _delete(self, workout_id: str) -> None:
+        for sink in self.sinks:
+            sink.remove_workout(workout_id)
+        self.client._apply_workout_change(workout_id)
+
+
+def sync_workouts_since(
+    client: "HevyClient", since: Optional[datetime], page_size: int = 10
+) -> SyncResult[Workout]:
+    def fetch(page_number: int) -> tuple[list[Workout], int]:
+        request = GetWorkoutsRequest(page_number, page_size)
+        response = client._execute(request, WorkoutsResponse)
+        response.raise_for_status()
+        return response.workouts, response.page_count
+
+    with start_span(client.tracer, "hevy.sync_workouts", page_size=page_size) as span:
+        result = _sync_since(
+            since,
+            fetch,
+            lambda workout: client._apply_workout_change(workout.id, workout),
+        )
+        span.set(updated=len(result.updated))
+        return result
+
+
+def sync_routines_since(
+    client: "HevyClient", since: Optional[datetime], page_size: int = 10
+) -> SyncResult[Routine]:
+    def fetch(page_number: int) -> tuple[list[Routine], int]:
+        request = GetRoutinesRequest(page_number, page_size)
+        response = client._execute(request, RoutinesResponse)
+        response.raise_for_status()
+        return response.routines, response.page_count
+
+    with start_span(client.tracer, "hevy.sync_routines", page_size=page_size) as span:
+        result = _sync_since(
+            since,
+            fetch,
+            lambda routine: client._apply_routine_change(routine.id, routine),
+        )
+        span.set(updated=len(result.updated))
+        return result
+
+
+def _sync_since(
+    since: Optional[datetime],
+    fetch: Callable[[int], tuple[list[T], int]],
+    apply: Callable[[T], None],
+) -> SyncResult[T]:
+    result = SyncResult[T](watermark=since)
+    page_number, page_count = 1, 1
+    while page_number <= page_count:
+        # Pages bypass the response cache, they are what we check it against
+        items, page_count = fetch(page_number)
+        changed = [item for item in items if _after(item.updated_at, since)]
+        for item in changed:
+            apply(item)
+            result.updated.append(item)
+            if _after(item.updated_at, result.watermark):
+                result.watermark = item.updated_at
+
+        # Items come back newest first, so a page without changes ends the scan
+        if not changed:
+            break
+        page_number += 1
+    return result
+
+
+def _after(timestamp: datetime, other: Optional[datetime]) -> bool:
+    return other is None or timestamp > other
+
+
+def _newer(event: WorkoutEvent, other: WorkoutEvent) -> bool:
+    if event.timestamp is None:
+        return False
+    return _after(event.timestamp, other.timestamp)
@@ -0,0 +1,25 @@
+"""Local stand-ins for the Hevy API, for benchmarks and load tests."""
+
+from .data import (
+    SyntheticConfig,
+    SyntheticData,
+    encode,
+    exercise_template_payload,
+    routine_payload,
+    workout_payload,
+)
+from .load import LoadReport, LoadTest
+from .server import FakeHevyServer, Faults
+
+__all__ = [
+    "FakeHevyServer",
+    "Faults",
+    "LoadReport",
+    "LoadTest",
+    "SyntheticConfig",
+    "SyntheticData",
+    "encode",
+    "exercise_template_payload",
+    "routine_payload",
+    "workout_payload",
+]
@@ -0,0 +1,3 @@
+from hevy_api.testing.server import main
+
+main()
@@ -0,0 +1,312 @@
+import json
+import random
+import uuid
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+EPOCH = datetime(2024, 1, 1, 8, tzinfo=timezone.utc)
+
+
+def timestamp(value: datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def exercise_template_payload(index: int) -> dict[str, Any]:
+    return {
+        "id": f"{index:08X}",
+        "title": f"Exercise {index}",
+        "type": "weight_reps",
+        "primary_muscle_group": "chest",
+        "secondary_muscle_groups": ["triceps"],
+        "is_custom": False,
+    }
+
+
+def _exercises(exercises: int, sets: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "index": i,
+            "title": f"Exercise {i}",
+            "notes": None,
+            "exercise_template_id": f"{i:08X}",
+            "supersets_id": None,
+            "sets": [
+                {
+                    "index": j,
+                    "type": "normal",
+                    "weight_kg": 60.0 + j * 2.5,
+                    "reps": 10 - j,
+                    "distance_meters": None,
+                    "duration_seconds": None,
+                    "rpe": None,
+                    "custom_metric": None,
+                }
+                for j in range(sets)
+            ],
+        }
+        for i in range(exercises)
+    ]
+
+
+def workout_payload(index: int, exercises: int = 5, sets: int = 3) -> dict[str, Any]:
+    start = EPOCH + timedelta(days=index)
+    return {
+        "id": f"workout-{index:08d}",
+        "title": f"Workout {index}",
+        "description": "",
+        "start_time": timestamp(start),
+        "end_time": timestamp(start + timedelta(hours=1)),
+        "updated_at": timestamp(start + timedelta(hours=1)),
+        "created_at": timestamp(start + timedelta(hours=1)),
+        "exercises": _exercises(exercises, sets),
+    }
+
+
+def routine_payload(index: int, exercises: int = 5, sets: int = 3) -> dict[str, Any]:
+    return {
+        "id": f"routine-{index:08d}",
+        "title": f"Routine {index}",
+        "folder_id": None,
+        "updated_at": timestamp(EPOCH),
+        "created_at": timestamp(EPOCH),
+        "exercises": _exercises(exercises, sets),
+    }
+
+
+MUSCLE_GROUPS = (
+    "chest",
+    "shoulders",
+    "triceps",
+    "biceps",
+    "lats",
+    "upper_back",
+    "lower_back",
+    "abdominals",
+    "quadriceps",
+    "hamstrings",
+    "glutes",
+    "calves",
+)
+
+# Template type and how common it is, each fills in different set fields
+TEMPLATE_TYPES = {
+    "weight_reps": 0.7,
+    "reps_only": 0.1,
+    "bodyweight_reps": 0.1,
+    "duration": 0.05,
+    "distance_duration": 0.05,
+}
+
+SET_TYPES = {"normal": 0.8, "warmup": 0.12, "failure": 0.05, "dropset": 0.03}
+
+
+class SyntheticConfig(BaseModel):
+    # Inclusive ranges, drawn uniformly
+    exercises_per_workout: tuple[int, int] = (3, 8)
+    sets_per_exercise: tuple[int, int] = (1, 5)
+    templates: int = 400
+    custom_template_share: float = 0.1
+    workouts_per_week: float = 4.0
+    # Chance that an optional field is filled in
+    description_probability: float = 0.3
+    notes_probability: float = 0.15
+    superset_probability: float = 0.1
+    rpe_probability: float = 0.25
+    custom_metric_probability: float = 0.02
+    # Day of the latest workout, the history goes back from it. Fixed rather
+    # than today, so the same seed always gives the same data.
+    end: datetime = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+
+class SyntheticData:
+    # Seeded generator of realistic, valid API payloads. Every item is drawn
+    # from its own seed, so workout(i) is the same however many others were
+    # generated and in whatever order.
+    def __init__(self, seed: int = 0, config: Optional[SyntheticConfig] = None):
+        self.seed = seed
+        self.config = config or SyntheticConfig()
+        self._templates = [
+            self.exercise_template(i) for i in range(self.config.templates)
+        ]
+
+    def exercise_template(self, index: int) -> dict[str, Any]:
+        rng = self._rng("template", index)
+        is_custom = rng.random() < self.config.custom_template_share
+        muscles = rng.sample(MUSCLE_GROUPS, rng.randint(1, 3))
+        template_type = _choice(rng, TEMPLATE_TYPES)
+        return {
+            "id": _uuid(rng) if is_custom else f"{rng.getrandbits(32):08X}",
+            "title": f"{_title(rng)} {index}",
+            "type": template_type,
+            "primary_muscle_group": "cardio"
+            if template_type == "distance_duration"
+            else muscles[0],
+            "secondary_muscle_groups": muscles[1:],
+            "is_custom": is_custom,
+        }
+
+    def exercise_templates(self) -> list[dict[str, Any]]:
+        return list(self._templates)
+
+    def workout(self, index: int) -> dict[str, Any]:
+        rng = self._rng("workout", index)
+        # Spread back in time at the configured frequency, at a random time
+        # of day; updates within the hour keep the days apart in updated_at
+        days_ago = int(index * 7 / self.config.workouts_per_week)
+        day = datetime.combine(
+            self.config.end.date() - timedelta(days=days_ago),
+            datetime.min.time(),
+            timezone.utc,
+        )
+        start = day + timedelta(minutes=rng.randint(6 * 60, 21 * 60))
+        end = start + timedelta(minutes=rng.randint(25, 120))
+        return {
+            "id": _uuid(rng),
+            "title": _title(rng),
+            "description": _sentence(rng)
+            if rng.random() < self.config.description_probability
+            else "",
+            "start_time": timestamp(start),
+            "end_time": timestamp(end),
+            "updated_at": timestamp(end + timedelta(minutes=rng.randint(0, 60))),
+            "created_at": timestamp(end),
+            "exercises": self._exercises(rng),
+        }
+
+    def workouts(self, count: int, offset: int = 0) -> Iterator[dict[str, Any]]:
+        # Newest first, like the API
+        for index in range(offset, offset + count):
+            yield self.workout(index)
+
+    def routine(self, index: int) -> dict[str, Any]:
+        rng = self._rng("routine", index)
+        return {
+            "id": _uuid(rng),
+            "title": f"{_title(rng)} Routine",
+            "folder_id": rng.randint(1, 20) if rng.random() < 0.5 else None,
+            "updated_at": timestamp(self.config.end),
+            "created_at": timestamp(self.config.end),
+            "exercises": self._exercises(rng),
+        }
+
+    def routines(self, count: int, offset: int = 0) -> Iterator[dict[str, Any]]:
+        for index in range(offset, offset + count):
+            yield self.routine(index)
+
+    def workouts_json(self, count: int, offset: int = 0) -> Iterator[bytes]:
+        # The same payloads encoded as the API sends them
+        for workout in self.workouts(count, offset):
+            yield encode(workout)
+
+    def routines_json(self, count: int, offset: int = 0) -> Iterator[bytes]:
+        for routine in self.routines(count, offset):
+            yield encode(routine)
+
+    def _rng(self, kind: str, index: int) -> random.Random:
+        # String seeds are hashed with SHA-512, stable across processes
+        return random.Random(f"{self.seed}:{kind}:{index}")
+
+    def _exercises(self, rng: random.Random) -> list[dict[str, Any]]:
+        config = self.config
+        templates = rng.sample(
+            self._templates,
+            min(rng.randint(*config.exercises_per_workout), len(self._templates)),
+        )
+        exercises = []
+        superset_id = None
+        for i, template in enumerate(templates):
+            # Neighbouring exercises share a superset
+            if superset_id is None and rng.random() < config.superset_probability:
+                superset_id = rng.randint(0, 1000)
+            elif superset_id is not None and rng.random() < 0.5:
+                superset_id = None
+            exercises.append(
+                {
+                    "index": i,
+                    "title": template["title"],
+                    "notes": _sentence(rng)
+                    if rng.random() < config.notes_probability
+                    else None,
+                    "exercise_template_id": template["id"],
+                    "supersets_id": superset_id,
+                    "sets": [
+                        self._set(rng, j, template["type"])
+                        for j in range(rng.randint(*config.sets_per_exercise))
+                    ],
+                }
+            )
+        return exercises
+
+    def _set(
+        self, rng: random.Random, index: int, template_type: str
+    ) -> dict[str, Any]:
+        weighted = template_type == "weight_reps"
+        with_reps = template_type.endswith("reps")
+        timed = template_type in ("duration", "distance_duration")
+        return {
+            "index": index,
+            "type": _choice(rng, SET_TYPES),
+            "weight_kg": round(rng.uniform(5, 200) / 2.5) * 2.5 if weighted else None,
+            "reps": rng.randint(1, 20) if with_reps else None,
+            "distance_meters": round(rng.uniform(200, 10_000))
+            if template_type == "distance_duration"
+            else None,
+            "duration_seconds": rng.randint(30, 3_600) if timed else None,
+            "rpe": rng.choice((6, 6.5, 7, 7.5, 8, 8.5, 9, 9.5, 10))
+            if with_reps and rng.random() < self.config.rpe_probability
+            else None,
+            "custom_metric": round(rng.uniform(1, 100), 1)
+            if rng.random() < self.config.custom_metric_probability
+            else None,
+        }
+
+
+WORDS = (
+    "push",
+    "pull",
+    "legs",
+    "upper",
+    "lower",
+    "full",
+    "body",
+    "heavy",
+    "light",
+    "volume",
+    "strength",
+    "power",
+    "press",
+    "row",
+    "squat",
+    "deadlift",
+    "curl",
+    "raise",
+    "fly",
+    "morning",
+    "evening",
+    "deload",
+    "tempo",
+    "paused",
+)
+
+
+def encode(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _choice(rng: random.Random, weights: dict[str, float]) -> str:
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _title(rng: random.Random) -> str:
+    return " ".join(rng.sample(WORDS, rng.randint(1, 3))).title()
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choices(WORDS, k=rng.randint(3, 15))).capitalize() + "."
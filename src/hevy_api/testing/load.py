@@ -0,0 +1,292 @@
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+import urllib.request
+from collections import Counter
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+from hevy_api.client import HevyClient
+from hevy_api.models.model import Workout
+from hevy_api.sync import sync_workouts_since
+from hevy_api.testing.data import SyntheticData
+from hevy_api.testing.server import STATS_PATH
+
+
+class ScenarioStats(BaseModel):
+    runs: int = 0
+    errors: int = 0
+    # Seconds per run, over successful and failed runs alike
+    latency_p50: float = 0.0
+    latency_p95: float = 0.0
+    latency_p99: float = 0.0
+    latency_max: float = 0.0
+
+
+class LoadReport(BaseModel):
+    users: int
+    duration_seconds: float
+    runs: int
+    errors: int
+    scenarios: dict[str, ScenarioStats]
+    # HTTP level, summed over every user's client
+    requests: int
+    statuses: dict[int, int]
+    retries: int
+    # Opened by the server, far fewer than requests when connections are reused
+    connections: Optional[int] = None
+    # (seconds since start, resident set size in bytes)
+    rss: list[tuple[float, int]] = Field(default_factory=list)
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.runs if self.runs else 0.0
+
+    @property
+    def runs_per_second(self) -> float:
+        return self.runs / self.duration_seconds if self.duration_seconds else 0.0
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.duration_seconds if self.duration_seconds else 0.0
+
+    def format(self) -> str:
+        lines = [
+            f"{self.users} users for {self.duration_seconds:.1f}s:"
+            f" {self.runs} runs ({self.runs_per_second:.1f}/s),"
+            f" {self.requests} requests ({self.requests_per_second:.1f}/s),"
+            f" error rate {self.error_rate:.2%}",
+            f"{'scenario':<10} {'runs':>7} {'errors':>7} {'p50 ms':>9}"
+            f" {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}",
+        ]
+        for name, stats in sorted(self.scenarios.items()):
+            lines.append(
+                f"{name:<10} {stats.runs:>7} {stats.errors:>7}"
+                f" {stats.latency_p50 * 1e3:>9.1f} {stats.latency_p95 * 1e3:>9.1f}"
+                f" {stats.latency_p99 * 1e3:>9.1f} {stats.latency_max * 1e3:>9.1f}"
+            )
+        statuses = ", ".join(f"{s}: {n}" for s, n in sorted(self.statuses.items()))
+        lines.append(f"statuses {statuses}; retries {self.retries}")
+        if self.connections is not None:
+            lines.append(f"connections opened {self.connections}")
+        if self.rss:
+            peak = max(rss for _, rss in self.rss)
+            lines.append(
+                f"rss start {self.rss[0][1] / 2**20:.1f} MiB,"
+                f" end {self.rss[-1][1] / 2**20:.1f} MiB, peak {peak / 2**20:.1f} MiB"
+            )
+        return "\n".join(lines)
+
+
+class _User:
+    # One simulated user: its own client, API key and random stream
+    def __init__(self, client: HevyClient, rng: random.Random, started: datetime):
+        self.client = client
+        self.rng = rng
+        self.page_count = 1
+        self.workout_ids: list[str] = []
+        self.since = started
+
+
+def browse(user: _User, data: SyntheticData) -> None:
+    # Look through a page of workouts, open a few and their first exercise
+    page = user.client.get_workouts(user.rng.randint(1, user.page_count), 10)
+    page.raise_for_status()
+    user.page_count = max(page.page_count, 1)
+    user.workout_ids = [workout.id for workout in page.workouts] or user.workout_ids
+    for workout_id in user.rng.sample(user.workout_ids, min(3, len(user.workout_ids))):
+        response = user.client.get_workout(workout_id)
+        response.raise_for_status()
+        if response.workout is not None and response.workout.exercises:
+            template_id = response.workout.exercises[0].exercise_template_id
+            user.client.get_exercise_template(template_id).raise_for_status()
+
+
+def sync(user: _User, data: SyntheticData) -> None:
+    # Pick up whatever changed since this user's last sync
+    result = sync_workouts_since(user.client, user.since)
+    user.since = result.watermark or user.since
+
+
+def write(user: _User, data: SyntheticData) -> None:
+    # Log a workout, then fix its title
+    workout = Workout(**data.workout(user.rng.randrange(1_000)))
+    created = user.client.create_workout(workout)
+    created.raise_for_status()
+    if created.workout is not None:
+        user.client.update_workout(
+            created.workout.id, workout.model_copy(update={"title": "Edited"})
+        ).raise_for_status()
+
+
+SCENARIOS: dict[str, Callable[[_User, SyntheticData], None]] = {
+    "browse": browse,
+    "sync": sync,
+    "write": write,
+}
+
+
+class LoadTest:
+    # Drives many independent clients, one thread each, through a weighted
+    # mix of scripted scenarios against a (fake) API for a fixed duration
+    def __init__(
+        self,
+        base_url: str,
+        users: int = 50,
+        duration: float = 30.0,
+        mix: Optional[dict[str, float]] = None,
+        ramp_up: float = 0.0,
+        think_time: float = 0.0,
+        seed: int = 0,
+        sample_interval: float = 1.0,
+        **client_options: Any,
+    ):
+        self.base_url = base_url
+        self.users = users
+        self.duration = duration
+        self.mix = mix or {"browse": 0.6, "sync": 0.3, "write": 0.1}
+        unknown = set(self.mix) - set(SCENARIOS)
+        if unknown:
+            raise ValueError(f"Unknown scenarios {sorted(unknown)}")
+        self.ramp_up = ramp_up
+        self.think_time = think_time
+        self.seed = seed
+        self.sample_interval = sample_interval
+        self.client_options = client_options
+        self.data = SyntheticData(seed)
+        self._latencies: dict[str, list[float]] = {name: [] for name in self.mix}
+        self._errors: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def run(self) -> LoadReport:
+        started_at = datetime.now(timezone.utc)
+        clients = [
+            HevyClient(
+                api_key=f"load-{i}", base_url=self.base_url, **self.client_options
+            )
+            for i in range(self.users)
+        ]
+        started = time.perf_counter()
+        deadline = started + self.duration
+        done = threading.Event()
+        rss: list[tuple[float, int]] = []
+        sampler = threading.Thread(
+            target=self._sample_rss, args=(started, rss, done), daemon=True
+        )
+        sampler.start()
+
+        threads = [
+            threading.Thread(
+                target=self._run_user,
+                args=(
+                    _User(client, random.Random(f"{self.seed}:{i}"), started_at),
+                    started + self.ramp_up * i / self.users,
+                    deadline,
+                ),
+                name=f"hevy-load-{i}",
+                daemon=True,
+            )
+            for i, client in enumerate(clients)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        done.set()
+        sampler.join()
+        rss.append((elapsed, _rss()))
+
+        statuses: Counter[int] = Counter()
+        retries = 0
+        for client in clients:
+            for stats in client.metrics.routes().values():
+                statuses.update(stats.statuses)
+                retries += stats.retries
+        return LoadReport(
+            users=self.users,
+            duration_seconds=elapsed,
+            runs=sum(len(latencies) for latencies in self._latencies.values()),
+            errors=sum(self._errors.values()),
+            scenarios={
+                name: _scenario_stats(latencies, self._errors[name])
+                for name, latencies in self._latencies.items()
+            },
+            requests=sum(statuses.values()),
+            statuses=dict(statuses),
+            retries=retries,
+            connections=self._server_connections(),
+            rss=rss,
+        )
+
+    def _server_connections(self) -> Optional[int]:
+        # Only known when the target is a FakeHevyServer
+        try:
+            with urllib.request.urlopen(f"{self.base_url}{STATS_PATH}") as response:
+                return json.loads(response.read())["connections"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _run_user(self, user: _User, start_at: float, deadline: float) -> None:
+        time.sleep(max(start_at - time.perf_counter(), 0.0))
+        names, weights = list(self.mix), list(self.mix.values())
+        while time.perf_counter() < deadline:
+            name = user.rng.choices(names, weights)[0]
+            started = time.perf_counter()
+            failed = False
+            try:
+                SCENARIOS[name](user, self.data)
+            except Exception:
+                failed = True
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._latencies[name].append(elapsed)
+                if failed:
+                    self._errors[name] += 1
+            if self.think_time:
+                time.sleep(user.rng.expovariate(1 / self.think_time))
+
+    def _sample_rss(
+        self, started: float, samples: list[tuple[float, int]], done: threading.Event
+    ) -> None:
+        while True:
+            samples.append((time.perf_counter() - started, _rss()))
+            if done.wait(self.sample_interval):
+                return
+
+
+def _scenario_stats(latencies: list[float], errors: int) -> ScenarioStats:
+    if not latencies:
+        return ScenarioStats(errors=errors)
+    if len(latencies) == 1:
+        cuts = latencies * 99
+    else:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return ScenarioStats(
+        runs=len(latencies),
+        errors=errors,
+        latency_p50=cuts[49],
+        latency_p95=cuts[94],
+        latency_p99=cuts[98],
+        latency_max=max(latencies),
+    )
+
+
+def _rss() -> int:
+    # Current RSS where /proc is available, else the peak so far
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Bytes on macOS, kilobytes elsewhere
+        return peak if sys.platform == "darwin" else peak * 1024
@@ -0,0 +1,123 @@
+import gc
+import json
+import sys
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from hevy_api.client import HevyClient, HTTPClient
+from hevy_api.models.base import BaseRequest, BaseResponse
+from hevy_api.models.model import Set, Workout
+from hevy_api.models.response import (
+    ExerciseTemplateResponse,
+    RoutineResponse,
+    WorkoutResponse,
+    WorkoutsResponse,
+)
+from hevy_api.testing.data import SyntheticData, encode
+
+# What requests hands over as response headers from the API, more or less
+TYPICAL_HEADERS = {
+    "Date": "Mon, 01 Jan 2024 00:00:00 GMT",
+    "Content-Type": "application/json; charset=utf-8",
+    "Content-Length": "3202",
+    "Connection": "keep-alive",
+    "X-Powered-By": "Express",
+    "Access-Control-Allow-Origin": "*",
+    "ETag": 'W/"c82-Jf1bOq9pmm8zXZ1nHN4H0Nxqj0A"',
+    "Vary": "Accept-Encoding",
+}
+
+
+class _ReplayHTTPClient(HTTPClient):
+    # Answers from canned bodies, so nothing but the client's own state
+    # stays allocated
+    def __init__(self, bodies: dict[str, bytes]):
+        super().__init__("http://replay.invalid", "memory")
+        self.bodies = bodies
+
+    def execute(self, request: BaseRequest) -> BaseResponse:
+        body = json.loads(self.bodies[request.get_endpoint()])
+        return BaseResponse(body, 200, dict(TYPICAL_HEADERS))
+
+
+def allocated_per_item(build: Callable[[int], Any], count: int) -> float:
+    # Net bytes still allocated per item while all of them are alive, as seen
+    # by tracemalloc; the list holding them is not counted
+    gc.collect()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        items = [build(i) for i in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return (after - before - sys.getsizeof(items)) / count
+
+
+def footprints(count: int = 100, seed: int = 0) -> dict[str, float]:
+    # Bytes per item for the objects the client keeps around, built the way
+    # the client builds them: from freshly decoded JSON, as a cache entry is
+    data = SyntheticData(seed)
+    workouts = list(data.workouts(count))
+    encoded = [encode(workout) for workout in workouts]
+    sets = [
+        set_data
+        for workout in workouts
+        for exercise in workout["exercises"]
+        for set_data in exercise["sets"]
+    ]
+    pages = [
+        b'{"page":1,"page_count":1,"workouts":['
+        + b",".join(encoded[start : start + 10])
+        + b"]}"
+        for start in range(0, count, 10)
+    ]
+    routines = [encode({"routine": r}) for r in data.routines(count)]
+    templates = [encode(t) for t in data.exercise_templates()[:count]]
+
+    def response(response_type: type, raw: bytes) -> Any:
+        return response_type(json.loads(raw), 200, dict(TYPICAL_HEADERS))
+
+    # The whole cost of a cached workout: response, cache and fingerprint
+    bodies = {
+        f"/v1/workouts/{w['id']}": raw for w, raw in zip(workouts, encoded, strict=True)
+    }
+
+    def fetcher(**options: Any) -> Callable[[int], None]:
+        client = HevyClient(api_key="memory", cache_maxsize=count, **options)
+        client.http_client = _ReplayHTTPClient(bodies)
+
+        def fetch(i: int) -> None:
+            # Kept alive by the client's cache, not by the caller
+            client.get_workout(workouts[i]["id"])
+
+        return fetch
+
+    return {
+        "set": allocated_per_item(lambda i: Set(**sets[i]), len(sets)),
+        "workout": allocated_per_item(lambda i: Workout(**workouts[i]), count),
+        "workout_payload": allocated_per_item(lambda i: json.loads(encoded[i]), count),
+        "workout_response": allocated_per_item(
+            lambda i: response(WorkoutResponse, encoded[i]), count
+        ),
+        "cached_workout": allocated_per_item(fetcher(), count),
+        "cached_workout_compact": allocated_per_item(
+            fetcher(keep_raw_data=False), count
+        ),
+        "workouts_response_per_workout": allocated_per_item(
+            lambda i: response(WorkoutsResponse, pages[i]), len(pages)
+        )
+        * len(pages)
+        / count,
+        "routine_response": allocated_per_item(
+            lambda i: response(RoutineResponse, routines[i]), count
+        ),
+        "exercise_template_response": allocated_per_item(
+            lambda i: response(ExerciseTemplateResponse, templates[i]),
+            len(templates),
+        ),
+    }
@@ -0,0 +1,356 @@
+import argparse
+import json
+import math
+import random
+import socket
+import struct
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import BaseModel
+
+from hevy_api.testing.data import SyntheticConfig, SyntheticData, timestamp
+
+Payload = dict[str, Any]
+
+STATS_PATH = "/_fake/stats"
+
+
+class Faults(BaseModel):
+    # Share of requests hit by each fault, drawn independently per request
+    rate_limited: float = 0.0  # 429 with Retry-After
+    server_error: float = 0.0  # 503
+    reset: float = 0.0  # connection reset without a response
+    # Extra latency, uniform between 0 and this many seconds
+    jitter: float = 0.0
+    retry_after: float = 1.0
+
+
+class FakeHevyServer:
+    # In-process stand-in for the Hevy API over real HTTP and keep-alive
+    # connections, for benchmarks and load tests. Serves the given payloads
+    # paginated like the API, newest first; writes update them in memory.
+    def __init__(
+        self,
+        workouts: Iterable[Payload] = (),
+        routines: Iterable[Payload] = (),
+        exercise_templates: Iterable[Payload] = (),
+        latency: float = 0.0,  # seconds added to every response
+        faults: Optional[Faults] = None,
+        rate_limit: Optional[int] = None,  # requests per second per API key
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        # Kept oldest first by updated_at, a write moves its item to the end
+        self.workouts = _by_updated_at(workouts)
+        self.routines = _by_updated_at(routines)
+        self.exercise_templates = {
+            template["id"]: template for template in exercise_templates
+        }
+        self.latency = latency
+        self.faults = faults or Faults()
+        self.rate_limit = rate_limit
+        self.request_count = 0
+        self.connection_count = 0
+        self.fault_counts: Counter[str] = Counter()
+        self._random = random.Random(seed)
+        self._windows: dict[str, tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        # Encoded GET responses, so serving them costs the client's process
+        # as little as possible; dropped on every write
+        self._encoded: dict[str, bytes] = {}
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def synthetic(
+        cls,
+        workouts: int = 1_000,
+        routines: int = 20,
+        seed: int = 0,
+        config: Optional[SyntheticConfig] = None,
+        **kwargs: Any,
+    ) -> "FakeHevyServer":
+        data = SyntheticData(seed, config)
+        return cls(
+            data.workouts(workouts),
+            data.routines(routines),
+            data.exercise_templates(),
+            seed=seed,
+            **kwargs,
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeHevyServer":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                # Short, so stop() and test teardown return quickly
+                kwargs={"poll_interval": 0.05},
+                name="hevy-fake-api",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeHevyServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def stats(self) -> Payload:
+        with self._lock:
+            return {
+                "requests": self.request_count,
+                "connections": self.connection_count,
+                "faults": dict(self.fault_counts),
+            }
+
+    def fault(self, api_key: str) -> Optional[str]:
+        # The fault to inject into this request, if any
+        with self._lock:
+            self.request_count += 1
+            for name in ("reset", "server_error", "rate_limited"):
+                if self._random.random() < getattr(self.faults, name):
+                    self.fault_counts[name] += 1
+                    return name
+            if self.rate_limit is not None:
+                second = int(time.time())
+                window, count = self._windows.get(api_key, (second, 0))
+                count = count + 1 if window == second else 1
+                self._windows[api_key] = (second, count)
+                if count > self.rate_limit:
+                    self.fault_counts["rate_limited"] += 1
+                    return "rate_limited"
+            return None
+
+    def delay(self) -> float:
+        with self._lock:
+            return self.latency + self._random.uniform(0, self.faults.jitter)
+
+    def handle(
+        self, method: str, path: str, body: Optional[Payload]
+    ) -> tuple[int, bytes]:
+        with self._lock:
+            if method == "GET":
+                encoded = self._encoded.get(path)
+                if encoded is None:
+                    status, payload = self._get(path)
+                    encoded = json.dumps(payload).encode()
+                    if status != 200:
+                        return status, encoded
+                    self._encoded[path] = encoded
+                return 200, encoded
+            status, payload = self._write(method, path, body or {})
+            if status < 400:
+                self._encoded.clear()
+            return status, json.dumps(payload).encode()
+
+    def _get(self, path: str) -> tuple[int, Payload]:
+        url = urlsplit(path)
+        query = {name: values[0] for name, values in parse_qs(url.query).items()}
+        parts = url.path.strip("/").split("/")[1:]
+        collections = {
+            "workouts": self.workouts,
+            "routines": self.routines,
+            "exercise_templates": self.exercise_templates,
+        }
+        if not parts or parts[0] not in collections:
+            return 404, {"error": "Not found"}
+        items = collections[parts[0]]
+
+        if parts == ["workouts", "count"]:
+            return 200, {"workout_count": len(items)}
+        if parts == ["workouts", "events"]:
+            since = _parse_time(query.get("since", "1970-01-01T00:00:00Z"))
+            events = [
+                {"type": "updated", "workout": workout}
+                for workout in items.values()
+                if _parse_time(workout["updated_at"]) > since
+            ]
+            return 200, _page(events, "events", query)
+        if len(parts) == 2:
+            item = items.get(parts[1])
+            if item is None:
+                return 404, {"error": "Not found"}
+            return 200, {"routine": item} if parts[0] == "routines" else item
+        if parts[0] == "exercise_templates":
+            return 200, _page(list(items.values()), parts[0], query)
+        return 200, _page(list(reversed(items.values())), parts[0], query)
+
+    def _write(self, method: str, path: str, body: Payload) -> tuple[int, Payload]:
+        parts = urlsplit(path).path.strip("/").split("/")[1:]
+        items = {"workouts": self.workouts, "routines": self.routines}.get(
+            parts[0] if parts else ""
+        )
+        if items is None:
+            return 404, {"error": "Not found"}
+        now = timestamp(datetime.now(timezone.utc))
+        if method == "POST" and len(parts) == 1:
+            item = {**body, "id": str(uuid.uuid4()), "created_at": now}
+        elif method == "PUT" and len(parts) == 2 and parts[1] in items:
+            item = {**items.pop(parts[1]), **body, "id": parts[1]}
+        else:
+            return 404, {"error": "Not found"}
+        item["updated_at"] = now
+        items[item["id"]] = item
+        return 200, {"routine": item} if parts[0] == "routines" else item
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, so connection pooling behaves as against the API
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes, with Nagle on each
+            # response would wait for the client's delayed ACK
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                super().setup()
+                with server._lock:
+                    server.connection_count += 1
+
+            def _respond(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                if self.path == STATS_PATH:
+                    self._send(200, json.dumps(server.stats()).encode())
+                    return
+
+                delay = server.delay()
+                if delay:
+                    time.sleep(delay)
+                fault = server.fault(self.headers.get("api-key", ""))
+                if fault == "reset":
+                    # Linger 0 makes close() send a RST instead of a FIN
+                    self.connection.setsockopt(
+                        socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+                    )
+                    self.close_connection = True
+                    return
+                if fault == "server_error":
+                    self._send(503, b'{"error": "Service unavailable"}')
+                    return
+                if fault == "rate_limited":
+                    retry_after = str(math.ceil(server.faults.retry_after))
+                    self._send(
+                        429,
+                        b'{"error": "Too many requests"}',
+                        {"Retry-After": retry_after},
+                    )
+                    return
+
+                status, body = server.handle(
+                    self.command, self.path, json.loads(raw) if raw else None
+                )
+                self._send(status, body)
+
+            def _send(
+                self, status: int, body: bytes, headers: Optional[dict[str, str]] = None
+            ) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                self._respond()
+
+            def do_POST(self) -> None:
+                self._respond()
+
+            def do_PUT(self) -> None:
+                self._respond()
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        return Handler
+
+
+def _by_updated_at(items: Iterable[Payload]) -> dict[str, Payload]:
+    ordered = sorted(items, key=lambda item: _parse_time(item["updated_at"]))
+    return {item["id"]: item for item in ordered}
+
+
+def _page(items: list[Payload], name: str, query: dict[str, str]) -> Payload:
+    page = max(int(query.get("page", 1)), 1)
+    page_size = max(int(query.get("pageSize", 5)), 1)
+    start = (page - 1) * page_size
+    return {
+        "page": page,
+        "page_count": max(-(-len(items) // page_size), 1),
+        name: items[start : start + page_size],
+    }
+
+
+def _parse_time(value: str) -> datetime:
+    # fromisoformat only takes a trailing Z from Python 3.11
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def main() -> None:
+    # python -m hevy_api.testing: serves synthetic data from its own process,
+    # so a load test measures only the client side
+    parser = argparse.ArgumentParser(description="Fake Hevy API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--workouts", type=int, default=1_000)
+    parser.add_argument("--routines", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int)
+    for name, field in Faults.model_fields.items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}", type=float, default=field.default
+        )
+    args = parser.parse_args()
+
+    server = FakeHevyServer.synthetic(
+        workouts=args.workouts,
+        routines=args.routines,
+        seed=args.seed,
+        latency=args.latency,
+        faults=Faults(**{name: getattr(args, name) for name in Faults.model_fields}),
+        rate_limit=args.rate_limit,
+        host=args.host,
+        port=args.port,
+    )
+    # The first line tells a parent process where to connect
+    print(server.url, flush=True)
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import contextvars
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Optional, Protocol, TypeVar, Union
+
+T = TypeVar("T")
+
+
+class Span:
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        attributes: dict[str, Any],
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start_time = time.time()
+        self.duration = 0.0
+        self.status = "ok"
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan(Span):
+    def __init__(self) -> None:
+        super().__init__("noop", "", None, {})
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+
+class _NoopSpanContext(AbstractContextManager):
+    # Shared by every untraced call, so tracing costs nothing when it is off
+    span = _NoopSpan()
+
+    def __enter__(self) -> Span:
+        return self.span
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NOOP_SPAN_CONTEXT = _NoopSpanContext()
+
+# The span currently open in this thread or task, parent of any new one
+_current_span: ContextVar[Optional[Span]] = ContextVar("hevy_span", default=None)
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None: ...
+
+
+class InMemoryExporter:
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+
+class JsonLinesExporter:
+    # One JSON object per finished span, children are written before parents
+    def __init__(self, path: Union[str, Path]):
+        self._file = open(path, "a")  # noqa: SIM115
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class Tracer:
+    def __init__(self, exporter: SpanExporter):
+        self.exporter = exporter
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        parent = _current_span.get()
+        span = Span(
+            name,
+            trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+            parent_id=parent.span_id if parent else None,
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        started = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "error"
+            span.set(error=repr(e))
+            raise
+        finally:
+            span.duration = time.perf_counter() - started
+            _current_span.reset(token)
+            self.exporter.export(span)
+
+
+def start_span(
+    tracer: Optional[Tracer], name: str, **attributes: Any
+) -> AbstractContextManager[Span]:
+    if tracer is None:
+        return _NOOP_SPAN_CONTEXT
+    return tracer.span(name, **attributes)
+
+
+def in_current_context(function: Callable[..., T]) -> Callable[..., T]:
+    # For pool workers: each call runs in a copy of the caller's context, so
+    # its spans nest under whatever span the work was submitted from
+    context = contextvars.copy_context()
+
+    def run(*args: Any, **kwargs: Any) -> T:
+        return context.copy().run(function, *args, **kwargs)
+
+    return run
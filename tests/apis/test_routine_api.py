@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 from unittest.mock import Mock, patch
 
@@ -322,6 +323,26 @@ class TestRoutineAPI:
         assert call_args[1]["url"] == "https://api.hevyapp.com/v1/routines/routine-123"
         assert call_args[1]["json"] is not None
 
+    # Patches send() rather than request(), so requests really encodes the body
+    @patch("requests.Session.send")
+    def test_routine_bodies_are_json_encoded(self, mock_send, client, sample_routine):
+        mock_response = Mock()
+        mock_response.json.return_value = {"error": "Invalid routine data"}
+        mock_response.status_code = 400
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_send.return_value = mock_response
+
+        client.create_routine(sample_routine)
+        client.update_routine("routine-123", sample_routine)
+
+        for call in mock_send.call_args_list:
+            body = json.loads(call.args[0].body)
+            assert body["title"] == sample_routine.title
+            assert (
+                body["created_at"]
+                == sample_routine.model_dump(mode="json")["created_at"]
+            )
+
     @patch("requests.Session.request")
     def test_update_routine_not_found(self, mock_request, client, sample_routine):
         mock_response = Mock()
@@ -405,13 +426,13 @@ class TestRoutineAPI:
         post_request = PostRoutineRequest(sample_routine)
         assert post_request.get_endpoint() == "/v1/routines"
         assert post_request.get_method() == "POST"
-        assert post_request.get_body() == sample_routine.model_dump()
+        assert post_request.get_body() == sample_routine.model_dump(mode="json")
 
         # Test PutRoutineRequest
         put_request = PutRoutineRequest("routine-123", sample_routine)
         assert put_request.get_endpoint() == "/v1/routines/routine-123"
         assert put_request.get_method() == "PUT"
-        assert put_request.get_body() == sample_routine.model_dump()
+        assert put_request.get_body() == sample_routine.model_dump(mode="json")
 
     # Edge cases and boundary tests
     @patch("requests.Session.request")
@@ -451,3 +472,74 @@ class TestRoutineAPI:
         assert result.routine is not None
         assert result.routine.folder_id is None
         assert len(result.routine.exercises) == 0
+
+    # Change detection
+    @patch("requests.Session.request")
+    def test_unchanged_update_is_skipped(
+        self, mock_request, sample_routine, sample_routine_data
+    ):
+        client = HevyClient(api_key="test_token", skip_unchanged_writes=True)
+        mock_response = Mock()
+        mock_response.json.return_value = {"routine": sample_routine_data}
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_request.return_value = mock_response
+        client.get_routine("routine-123")
+
+        # Server-assigned fields do not count as changes
+        unchanged = sample_routine.model_copy(
+            update={"updated_at": datetime(2030, 1, 1)}
+        )
+        result = client.update_routine("routine-123", unchanged)
+
+        assert result.is_success
+        assert result.status_code == 304
+        assert result.routine.fingerprint == sample_routine.fingerprint
+        assert client.skipped_writes == 1
+        mock_request.assert_called_once()
+
+    @patch("requests.Session.request")
+    def test_changed_update_is_sent(
+        self, mock_request, sample_routine, sample_routine_data
+    ):
+        client = HevyClient(api_key="test_token", skip_unchanged_writes=True)
+        mock_response = Mock()
+        mock_response.json.return_value = {"routine": sample_routine_data}
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_request.return_value = mock_response
+
+        # Nothing is known about the routine yet, so the first write goes out
+        client.update_routine("routine-123", sample_routine)
+        renamed = sample_routine.model_copy(update={"title": "Renamed"})
+        client.update_routine("routine-123", renamed)
+        # The server now holds the renamed routine
+        client.update_routine("routine-123", renamed)
+
+        assert mock_request.call_count == 2
+        assert client.skipped_writes == 1
+
+    @patch("requests.Session.request")
+    def test_change_detection_is_off_by_default(
+        self, mock_request, client, sample_routine, sample_routine_data
+    ):
+        mock_response = Mock()
+        mock_response.json.return_value = {"routine": sample_routine_data}
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_request.return_value = mock_response
+
+        client.update_routine("routine-123", sample_routine)
+        client.update_routine("routine-123", sample_routine)
+
+        assert mock_request.call_count == 2
+        assert client.skipped_writes == 0
+
+    def test_fingerprint_is_stable(self, sample_routine, sample_routine_data):
+        reordered = dict(reversed(sample_routine_data.items()))
+
+        assert Routine(**reordered).fingerprint == sample_routine.fingerprint
+        assert (
+            sample_routine.model_copy(update={"folder_id": 2}).fingerprint
+            != sample_routine.fingerprint
+        )
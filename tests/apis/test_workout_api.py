@@ -1,4 +1,5 @@
-from datetime import datetime
+import json
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
 import pytest
@@ -7,6 +8,7 @@ import requests
 from hevy_api.client import HevyClient
 from hevy_api.models.model import Workout
 from hevy_api.models.request import (
+    GetWorkoutEventsRequest,
     GetWorkoutRequest,
     GetWorkoutsCountRequest,
     GetWorkoutsRequest,
@@ -15,6 +17,7 @@ from hevy_api.models.request import (
 )
 from hevy_api.models.response import (
     WorkoutCountResponse,
+    WorkoutEventsResponse,
     WorkoutResponse,
     WorkoutsResponse,
 )
@@ -316,6 +319,26 @@ class TestWorkoutAPI:
         assert call_args[1]["url"] == "https://api.hevyapp.com/v1/workouts/workout-123"
         assert call_args[1]["json"] is not None
 
+    # Patches send() rather than request(), so requests really encodes the body
+    @patch("requests.Session.send")
+    def test_workout_bodies_are_json_encoded(self, mock_send, client, sample_workout):
+        mock_response = Mock()
+        mock_response.json.return_value = {"error": "Invalid workout data"}
+        mock_response.status_code = 400
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_send.return_value = mock_response
+
+        client.create_workout(sample_workout)
+        client.update_workout("workout-123", sample_workout)
+
+        for call in mock_send.call_args_list:
+            body = json.loads(call.args[0].body)
+            assert body["title"] == sample_workout.title
+            assert (
+                body["created_at"]
+                == sample_workout.model_dump(mode="json")["created_at"]
+            )
+
     @patch("requests.Session.request")
     def test_update_workout_not_found(self, mock_request, client, sample_workout):
         mock_response = Mock()
@@ -383,10 +406,97 @@ class TestWorkoutAPI:
         post_request = PostWorkoutRequest(sample_workout)
         assert post_request.get_endpoint() == "/v1/workouts"
         assert post_request.get_method() == "POST"
-        assert post_request.get_body() == sample_workout.model_dump()
+        assert post_request.get_body() == sample_workout.model_dump(mode="json")
 
         # Test PutWorkoutRequest
         put_request = PutWorkoutRequest("workout-123", sample_workout)
         assert put_request.get_endpoint() == "/v1/workouts/workout-123"
         assert put_request.get_method() == "PUT"
-        assert put_request.get_body() == sample_workout.model_dump()
+        assert put_request.get_body() == sample_workout.model_dump(mode="json")
+
+    # GET /v1/workouts/events tests
+    @patch("requests.Session.request")
+    def test_get_workout_events(self, mock_request, client, sample_workout_data):
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "page": 1,
+            "page_count": 1,
+            "events": [
+                {"type": "updated", "workout": sample_workout_data},
+                {
+                    "type": "deleted",
+                    "id": "workout-456",
+                    "deleted_at": "2024-01-16T10:00:00Z",
+                },
+            ],
+        }
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_request.return_value = mock_response
+
+        since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        result = client.get_workout_events(since)
+        client.get_workout_events(since)
+
+        assert isinstance(result, WorkoutEventsResponse)
+        assert result.page_count == 1
+        assert [event.workout_id for event in result.events] == [
+            "workout-123",
+            "workout-456",
+        ]
+        assert result.events[0].workout.title == "Push Day"
+        assert result.events[1].timestamp == datetime(
+            2024, 1, 16, 10, tzinfo=timezone.utc
+        )
+        # The events feed is never served from the cache
+        assert mock_request.call_count == 2
+        assert mock_request.call_args[1]["url"] == (
+            "https://api.hevyapp.com/v1/workouts/events"
+            "?page=1&pageSize=10&since=2024-01-01T00%3A00%3A00%2B00%3A00"
+        )
+        assert GetWorkoutEventsRequest(2, 5, since).get_method() == "GET"
+
+    # Change detection
+    @patch("requests.Session.request")
+    def test_unchanged_update_is_skipped(
+        self, mock_request, sample_workout, sample_workout_data
+    ):
+        client = HevyClient(api_key="test_token", skip_unchanged_writes=True)
+        mock_response = Mock()
+        mock_response.json.return_value = sample_workout_data
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_request.return_value = mock_response
+        client.get_workout("workout-123")
+
+        # Server-assigned fields do not count as changes
+        unchanged = sample_workout.model_copy(
+            update={"updated_at": datetime(2030, 1, 1, tzinfo=timezone.utc)}
+        )
+        result = client.update_workout("workout-123", unchanged)
+        renamed = sample_workout.model_copy(update={"title": "Renamed"})
+        client.update_workout("workout-123", renamed)
+
+        assert result.status_code == 304
+        assert result.workout.fingerprint == sample_workout.fingerprint
+        assert client.skipped_writes == 1
+        assert mock_request.call_count == 2
+        assert mock_request.call_args[1]["method"] == "PUT"
+
+    @patch("requests.Session.request")
+    def test_updates_are_sent_by_default(
+        self, mock_request, client, sample_workout, sample_workout_data
+    ):
+        mock_response = Mock()
+        mock_response.json.return_value = sample_workout_data
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_request.return_value = mock_response
+        client.get_workout("workout-123")
+
+        result = client.update_workout("workout-123", sample_workout)
+        client.update_workout("workout-123", sample_workout)
+
+        assert result.status_code == 200
+        assert client.skipped_writes == 0
+        assert mock_request.call_count == 3
@@ -0,0 +1,89 @@
+import json
+import re
+from unittest.mock import Mock
+
+import pytest
+
+from hevy_api.models.model import Workout
+
+
+@pytest.fixture
+def exercise_data():
+    # Sets are numbered in order and are normal sets unless given a type
+    def build(template_id="bench", sets=(), index=0, **fields):
+        return {
+            "index": index,
+            "title": template_id.title(),
+            "exercise_template_id": template_id,
+            "sets": [
+                {"index": set_index, "type": "normal", **set_data}
+                for set_index, set_data in enumerate(sets)
+            ],
+            **fields,
+        }
+
+    return build
+
+
+@pytest.fixture
+def workout_data():
+    # An API workout payload on 2024-01-<day>, 10:00 to 11:00 UTC
+    def build(workout_id="w1", day=15, exercises=(), **fields):
+        return {
+            "id": workout_id,
+            "title": "Push Day",
+            "description": "",
+            "start_time": f"2024-01-{day:02d}T10:00:00Z",
+            "end_time": f"2024-01-{day:02d}T11:00:00Z",
+            "updated_at": f"2024-01-{day:02d}T11:00:00Z",
+            "created_at": f"2024-01-{day:02d}T10:00:00Z",
+            "exercises": list(exercises),
+            **fields,
+        }
+
+    return build
+
+
+@pytest.fixture
+def make_workout(workout_data):
+    def build(workout_id="w1", day=15, exercises=(), **fields):
+        return Workout(**workout_data(workout_id, day, exercises, **fields))
+
+    return build
+
+
+@pytest.fixture
+def mock_response():
+    # What requests.Session.request returns, for a JSON body
+    def build(data=None, status_code=200, headers=None):
+        data = {} if data is None else data
+        response = Mock()
+        response.json.return_value = data
+        response.status_code = status_code
+        response.headers = (
+            {"Content-Type": "application/json"} if headers is None else headers
+        )
+        response.content = json.dumps(data).encode()
+        response.request.body = None
+        return response
+
+    return build
+
+
+@pytest.fixture
+def mock_pages(mock_response):
+    # A requests.Session.request side effect serving the given pages of items
+    # under key. Pages may be fetched concurrently, so it answers by the page
+    # in the URL rather than by call order.
+    def build(key, pages, fail_on_page=None):
+        def respond(method, url, headers, json):
+            page = int(re.search(r"page=(\d+)", url).group(1))
+            if page == fail_on_page:
+                return mock_response({"error": "Server error"}, 500)
+            return mock_response(
+                {"page": page, "page_count": len(pages), key: pages[page - 1]}
+            )
+
+        return respond
+
+    return build
@@ -0,0 +1,86 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from hevy_api.analytics import UNKNOWN_MUSCLE_GROUP, muscle_group_summary
+from hevy_api.catalog import ExerciseTemplateCatalog
+from hevy_api.models.model import ExerciseTemplate
+
+
+class TestMuscleGroupSummary:
+    @pytest.fixture
+    def catalog(self):
+        return ExerciseTemplateCatalog(
+            [
+                ExerciseTemplate(
+                    id="bench",
+                    title="Bench Press",
+                    type="weight_reps",
+                    primary_muscle_group="chest",
+                    secondary_muscle_groups=["triceps", "shoulders"],
+                ),
+                ExerciseTemplate(
+                    id="dips",
+                    title="Dips",
+                    type="bodyweight_reps",
+                    primary_muscle_group="triceps",
+                    secondary_muscle_groups=["chest"],
+                ),
+            ]
+        )
+
+    @pytest.fixture
+    def workouts(self, make_workout, exercise_data):
+        return [
+            make_workout(
+                "workout-1",
+                1,
+                [
+                    exercise_data(
+                        "bench",
+                        [
+                            {"type": "warmup", "weight_kg": 40, "reps": 10},
+                            {"weight_kg": 80, "reps": 5},
+                            {"weight_kg": 80, "reps": 5},
+                        ],
+                    ),
+                    exercise_data("dips", [{"reps": 12}], index=1),
+                ],
+            ),
+            make_workout(
+                "workout-2", 8, [exercise_data("bench", [{"weight_kg": 85, "reps": 3}])]
+            ),
+        ]
+
+    def test_summary(self, catalog, workouts):
+        stats = muscle_group_summary(workouts, catalog)
+
+        assert stats["chest"].sets == 3
+        assert stats["chest"].secondary_sets == 1
+        assert stats["chest"].volume_kg == 80 * 5 * 2 + 85 * 3
+        assert stats["chest"].frequency == 2
+        assert stats["triceps"].sets == 1
+        assert stats["triceps"].secondary_sets == 3
+        assert stats["triceps"].frequency == 1
+        assert stats["shoulders"].sets == 0
+        assert stats["shoulders"].secondary_sets == 3
+        assert stats["shoulders"].frequency == 0
+
+    def test_summary_date_range(self, catalog, workouts):
+        stats = muscle_group_summary(
+            workouts,
+            catalog,
+            start=datetime(2024, 1, 7, tzinfo=timezone.utc),
+            end=datetime(2024, 1, 14, tzinfo=timezone.utc),
+        )
+
+        assert stats["chest"].sets == 1
+        assert stats["chest"].frequency == 1
+        assert "triceps" in stats
+        assert stats["triceps"].sets == 0
+
+    def test_unknown_templates(self, catalog, make_workout, exercise_data):
+        workout = make_workout("workout-1", 1, [exercise_data("custom", [{"reps": 1}])])
+
+        stats = muscle_group_summary([workout], catalog)
+        assert stats[UNKNOWN_MUSCLE_GROUP].sets == 1
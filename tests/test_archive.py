@@ -0,0 +1,117 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from hevy_api.archive import WorkoutArchive
+
+
+class TestWorkoutArchive:
+    @pytest.fixture
+    def path(self, tmp_path):
+        return tmp_path / "workouts.archive"
+
+    @pytest.fixture
+    def archive(self, path):
+        archive = WorkoutArchive(path)
+        yield archive
+        archive.close()
+
+    def test_round_trip(self, archive, make_workout):
+        archive.add_workouts(make_workout(f"w{day}", day) for day in range(1, 6))
+
+        assert archive.get_workout("w3") == make_workout("w3", 3)
+        assert archive.get_workout("missing") is None
+        assert len(archive) == 5
+
+    def test_date_range(self, archive, make_workout):
+        archive.add_workouts(make_workout(f"w{day}", day) for day in range(1, 11))
+
+        workouts = archive.workouts(
+            start=datetime(2024, 1, 3, tzinfo=timezone.utc),
+            end=datetime(2024, 1, 6, tzinfo=timezone.utc),
+        )
+        assert [w.id for w in workouts] == ["w5", "w4", "w3"]
+        assert [w.id for w in archive.workouts(limit=2)] == ["w10", "w9"]
+
+    def test_updates_and_deletes(self, archive, make_workout):
+        archive.add_workout(make_workout("w1", 1))
+        archive.add_workout(make_workout("w2", 2))
+        archive.add_workout(make_workout("w1", 5, title="Leg Day"))
+
+        assert archive.remove_workout("w2")
+        assert not archive.remove_workout("w2")
+        assert archive.get_workout("w1").title == "Leg Day"
+        assert [w.id for w in archive.workouts()] == ["w1"]
+        assert archive.reclaimable_bytes > 0
+
+    def test_reopen_uses_index(self, path, make_workout):
+        archive = WorkoutArchive(path)
+        archive.add_workouts(make_workout(f"w{day}", day) for day in range(1, 4))
+        archive.remove_workout("w2")
+        archive.close()
+        index = path.with_name("workouts.archive.idx").read_bytes()
+
+        reopened = WorkoutArchive(path)
+        assert [w.id for w in reopened.workouts()] == ["w3", "w1"]
+        # Nothing needed recovering, so the index was left alone
+        assert path.with_name("workouts.archive.idx").read_bytes() == index
+        reopened.close()
+
+    def test_recovers_from_torn_writes(self, path, make_workout):
+        archive = WorkoutArchive(path)
+        archive.add_workout(make_workout("w1", 1))
+        archive.close()
+        index_path = path.with_name("workouts.archive.idx")
+        index = index_path.read_bytes()
+        archive = WorkoutArchive(path)
+        archive.add_workout(make_workout("w2", 2))
+        archive.close()
+
+        # The index never heard of w2, and a record was cut short
+        index_path.write_bytes(index + b'["w9", 10')
+        with open(path, "ab") as file:
+            file.write(b"\x01\xff\x00\x00\x00{")
+
+        reopened = WorkoutArchive(path)
+        assert [w.id for w in reopened.workouts()] == ["w2", "w1"]
+        reopened.add_workout(make_workout("w3", 3))
+        reopened.close()
+        assert len(WorkoutArchive(path)) == 3
+
+    def test_compact(self, path, archive, make_workout):
+        for day in range(1, 4):
+            archive.add_workout(make_workout("w1", day))
+        archive.add_workout(make_workout("w2", 2))
+        archive.remove_workout("w2")
+        size = path.stat().st_size
+
+        reclaimed = archive.compact()
+
+        assert reclaimed == size - path.stat().st_size
+        assert reclaimed > 0
+        assert archive.reclaimable_bytes == 0
+        assert archive.get_workout("w1") == make_workout("w1", 3)
+        archive.add_workout(make_workout("w4", 4))
+        archive.close()
+        assert [w.id for w in WorkoutArchive(path).workouts()] == ["w4", "w1"]
+
+    def test_stale_index_after_compaction_is_rebuilt(self, path, archive, make_workout):
+        archive.add_workouts(make_workout(f"w{day}", day) for day in range(1, 4))
+        index_path = path.with_name("workouts.archive.idx")
+        stale_index = index_path.read_bytes()
+        archive.remove_workout("w1")
+        archive.compact()
+        archive.close()
+        # As if we crashed right after swapping in the compacted data
+        index_path.write_bytes(stale_index)
+
+        reopened = WorkoutArchive(path)
+        assert [w.id for w in reopened.workouts()] == ["w3", "w2"]
+        reopened.close()
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "notes.txt"
+        path.write_text("not an archive at all")
+
+        with pytest.raises(ValueError):
+            WorkoutArchive(path)
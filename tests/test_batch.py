@@ -0,0 +1,160 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from hevy_api.client import HevyClient
+from hevy_api.ratelimit import RateLimiter
+
+
+@pytest.fixture
+def mock_writes(mock_response, workout_data):
+    # Answers written workouts with an id, failing the given titles
+    def build(fail_titles=(), delay=0.0):
+        def respond(method, url, headers, json):
+            time.sleep(delay)
+            title = json["title"]
+            if title in fail_titles:
+                return mock_response({"error": "Server error"}, 500)
+            return mock_response(workout_data(f"id-{title}", title=title))
+
+        return respond
+
+    return build
+
+
+class TestBatchWrites:
+    @pytest.fixture
+    def client(self):
+        return HevyClient(api_key="test_token")
+
+    @patch("requests.Session.request")
+    def test_create_workouts_in_input_order(
+        self, mock_request, client, make_workout, mock_writes
+    ):
+        mock_request.side_effect = mock_writes(fail_titles={"b"})
+        workouts = [make_workout(title=title) for title in "abcde"]
+
+        result = client.create_workouts(workouts, max_workers=4)
+
+        assert [response.status_code for response in result.responses] == [
+            200,
+            500,
+            200,
+            200,
+            200,
+        ]
+        assert [r.workout.id for r in result.responses if r.workout] == [
+            "id-a",
+            "id-c",
+            "id-d",
+            "id-e",
+        ]
+        assert not result.is_success
+        assert [workout.title for workout in result.failed] == ["b"]
+
+        # Only the failures are submitted again
+        mock_request.reset_mock()
+        mock_request.side_effect = mock_writes()
+        retried = client.create_workouts(result.failed)
+        assert retried.is_success
+        assert mock_request.call_count == 1
+
+    @patch("requests.Session.request")
+    def test_update_workouts(self, mock_request, client, make_workout, mock_writes):
+        mock_request.side_effect = mock_writes(fail_titles={"b"})
+
+        result = client.update_workouts(
+            {"w1": make_workout(title="a"), "w2": make_workout(title="b")}
+        )
+
+        urls = sorted(call[1]["url"] for call in mock_request.call_args_list)
+        assert urls == [
+            "https://api.hevyapp.com/v1/workouts/w1",
+            "https://api.hevyapp.com/v1/workouts/w2",
+        ]
+        assert [workout_id for workout_id, _ in result.failed] == ["w2"]
+        mock_request.side_effect = mock_writes()
+        assert client.update_workouts(result.failed).is_success
+
+    @patch("requests.Session.request")
+    def test_throughput_scales_with_workers(
+        self, mock_request, client, make_workout, mock_writes
+    ):
+        mock_request.side_effect = mock_writes(delay=0.05)
+        workouts = [make_workout(str(i)) for i in range(8)]
+
+        started = time.monotonic()
+        assert client.create_workouts(workouts, max_workers=8).is_success
+        assert time.monotonic() - started < 0.3
+
+    @patch("requests.Session.request")
+    def test_empty_batch(self, mock_request, client):
+        assert len(client.create_workouts([])) == 0
+        mock_request.assert_not_called()
+
+
+class TestRateLimiting:
+    @patch("requests.Session.request")
+    def test_retries_rate_limited_requests(
+        self, mock_request, make_workout, mock_response
+    ):
+        limited = mock_response(
+            {"error": "Too many requests"}, 429, {"Retry-After": "0"}
+        )
+        ok = mock_response(make_workout(title="a").model_dump(mode="json"))
+        mock_request.side_effect = [limited, limited, ok]
+        client = HevyClient(api_key="test_token")
+
+        assert client.create_workout(make_workout(title="a")).is_success
+        assert mock_request.call_count == 3
+
+    @patch("requests.Session.request")
+    def test_gives_up_after_max_retries(
+        self, mock_request, make_workout, mock_response
+    ):
+        limited = mock_response(
+            {"error": "Too many requests"}, 429, {"retry-after": "0"}
+        )
+        mock_request.return_value = limited
+        client = HevyClient(api_key="test_token", max_retries=1)
+
+        assert client.create_workout(make_workout(title="a")).status_code == 429
+        assert mock_request.call_count == 2
+
+    @patch("requests.Session.request")
+    def test_long_retry_after_is_not_waited_out(
+        self, mock_request, make_workout, mock_response
+    ):
+        mock_request.return_value = mock_response(
+            {"error": "Too many requests"}, 429, {"Retry-After": "3600"}
+        )
+        client = HevyClient(api_key="test_token", max_retry_delay=5)
+
+        started = time.monotonic()
+        assert client.create_workout(make_workout(title="a")).status_code == 429
+        assert time.monotonic() - started < 1
+        assert mock_request.call_count == 1
+
+    def test_rate_limiter_spaces_requests(self):
+        limiter = RateLimiter(rate=50, burst=2)
+        started = time.monotonic()
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Two requests go out at once, the other four wait 20ms each
+        assert time.monotonic() - started >= 0.075
+
+    @patch("requests.Session.request")
+    def test_client_rate_limit(self, mock_request, make_workout, mock_writes):
+        mock_request.side_effect = mock_writes()
+        client = HevyClient(api_key="test_token", rate_limit=100)
+
+        started = time.monotonic()
+        client.create_workouts([make_workout(str(i)) for i in range(5)])
+        assert time.monotonic() - started >= 0.035
+        assert mock_request.call_count == 5
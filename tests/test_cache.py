@@ -0,0 +1,147 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from hevy_api.cache import StatsTTLCache, deep_sizeof
+from hevy_api.client import HevyClient
+from hevy_api.mirror import LocalMirror
+from hevy_api.models.response import WorkoutCountResponse, WorkoutResponse
+
+
+@pytest.fixture
+def mock_workouts(mock_response, workout_data):
+    # Answers GET /v1/workouts/<id> with that workout
+    def respond(method, url, headers, json):
+        return mock_response(workout_data(url.rsplit("/", 1)[-1]))
+
+    return respond
+
+
+class TestStatsTTLCache:
+    def test_evictions_and_expirations(self, workout_data):
+        now = [0.0]
+        cache = StatsTTLCache(maxsize=2, ttl=10, timer=lambda: now[0])
+        count = WorkoutCountResponse(
+            data={"workout_count": 3}, status_code=200, headers={}
+        )
+        cache["w1"] = WorkoutResponse(
+            data=workout_data("w1"), status_code=200, headers={}
+        )
+        cache["count"] = count
+        cache["w2"] = WorkoutResponse(
+            data=workout_data("w2"), status_code=200, headers={}
+        )
+        now[0] = 11.0
+
+        stats = cache.stats()
+
+        assert stats.size == 0
+        assert stats.types["WorkoutResponse"].evictions == 1
+        assert stats.types["WorkoutResponse"].expirations == 1
+        assert stats.types["WorkoutCountResponse"].expirations == 1
+
+    def test_deep_sizeof_counts_shared_objects_once(self, make_workout):
+        payload = {"title": "x" * 1000}
+
+        assert deep_sizeof([payload, payload]) < 2 * deep_sizeof(payload)
+        assert deep_sizeof(make_workout("w1")) > deep_sizeof("w1")
+
+
+class TestCacheStats:
+    @patch("requests.Session.request")
+    def test_hits_and_misses_by_type(self, mock_request, mock_workouts):
+        mock_request.side_effect = mock_workouts
+        client = HevyClient(api_key="test_token")
+
+        client.get_workout("w1")
+        client.get_workout("w1")
+        client.get_workout("w1")
+        client.get_workout("w2")
+
+        stats = client.cache_stats()
+        workouts = stats.types["WorkoutResponse"]
+        assert (workouts.hits, workouts.misses, workouts.size) == (2, 2, 2)
+        assert workouts.hit_ratio == 0.5
+        assert workouts.bytes_per_entry > 0
+        assert stats.estimated_bytes == 2 * workouts.bytes_per_entry
+        assert (stats.maxsize, stats.ttl, stats.size) == (1000, 300, 2)
+
+    @patch("requests.Session.request")
+    def test_mirror_and_stale_hits(self, mock_request, make_workout):
+        mirror = LocalMirror()
+        mirror.add_workout(make_workout("w1"))
+        client = HevyClient(api_key="test_token", mirror=mirror, offline_fallback=True)
+        mock_request.side_effect = requests.ConnectionError("down")
+
+        client.get_workout("w1")
+        client.get_workouts()
+        client._cache.clear()
+        mirror.remove_workout("w1")
+        client.get_workout("w1")
+
+        stats = client.cache_stats()
+        assert stats.types["WorkoutResponse"].mirror_hits == 1
+        assert stats.types["WorkoutResponse"].stale_hits == 1
+        # Pages come from the mirror too, but only once the API failed
+        assert stats.types["WorkoutsResponse"].misses == 1
+        assert stats.types["WorkoutsResponse"].stale_hits == 1
+
+    @patch("requests.Session.request")
+    def test_without_sizes(self, mock_request, mock_workouts):
+        mock_request.side_effect = mock_workouts
+        client = HevyClient(api_key="test_token")
+        client.get_workout("w1")
+
+        with patch("hevy_api.cache.deep_sizeof") as sizeof:
+            stats = client.cache_stats(sizes=False)
+
+        sizeof.assert_not_called()
+        assert stats.types["WorkoutResponse"].size == 1
+        assert stats.types["WorkoutResponse"].bytes_per_entry == 0
+
+    def test_empty(self):
+        stats = HevyClient(api_key="test_token").cache_stats()
+
+        assert stats.types == {}
+        assert stats.hit_ratio == pytest.approx(0.0)
+
+
+class TestCompact:
+    def test_drops_data_and_most_headers(self, workout_data):
+        response = WorkoutResponse(
+            data=workout_data("w1"),
+            status_code=200,
+            headers={"Content-Type": "application/json", "X-Powered-By": "Express"},
+        )
+
+        response.compact()
+
+        assert response.data is None
+        assert response.headers == {"Content-Type": "application/json"}
+        assert response.workout.id == "w1"
+
+    def test_keeps_errors_and_parse_failures(self):
+        error = WorkoutResponse(
+            data={"error": "Not found"}, status_code=404, headers={}
+        )
+        invalid = WorkoutResponse(data={"id": "w1"}, status_code=200, headers={})
+
+        error.compact()
+        invalid.compact()
+
+        assert error.data == {"error": "Not found"}
+        assert invalid.parse_error is not None
+        assert invalid.data == {"id": "w1"}
+
+    @patch("requests.Session.request")
+    def test_client_option(self, mock_request, mock_workouts):
+        mock_request.side_effect = mock_workouts
+        client = HevyClient(api_key="test_token", keep_raw_data=False)
+
+        response = client.get_workout("w1")
+
+        assert response.data is None
+        assert client.get_workout("w1") is response
+        assert response.workout.title == "Push Day"
+        assert HevyClient(api_key="test_token").get_workout("w2").data is not None
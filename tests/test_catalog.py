@@ -0,0 +1,358 @@
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from hevy_api.catalog import (
+    SNAPSHOT_FIELDS,
+    SNAPSHOT_VERSION,
+    ExerciseTemplateCatalog,
+    normalize_title,
+)
+from hevy_api.client import HevyClient
+from hevy_api.models.base import HevyAPIError
+from hevy_api.models.model import ExerciseTemplate
+
+
+def make_template(template_id, title, muscle="chest", type="weight_reps", **kwargs):
+    return ExerciseTemplate(
+        id=template_id,
+        title=title,
+        type=type,
+        primary_muscle_group=muscle,
+        secondary_muscle_groups=kwargs.pop("secondary", []),
+        **kwargs,
+    )
+
+
+def paginate(templates, page_size):
+    payloads = [template.model_dump() for template in templates]
+    return [payloads[i : i + page_size] for i in range(0, len(payloads), page_size)]
+
+
+class TestExerciseTemplateCatalog:
+    @pytest.fixture
+    def client(self):
+        return HevyClient(api_key="test_token")
+
+    @pytest.fixture
+    def catalog(self):
+        return ExerciseTemplateCatalog(
+            [
+                make_template("bench", "Bench Press (Barbell)", secondary=["triceps"]),
+                make_template("incline", "Incline Bench Press (Dumbbell)"),
+                make_template("fly", "Chest Fly (Cable)", type="cable"),
+                make_template("dips", "Triceps Dip", muscle="triceps"),
+                make_template("custom", "My Press", is_custom=True),
+            ]
+        )
+
+    @patch("requests.Session.request")
+    def test_load_all_pages(self, mock_request, client, mock_pages):
+        templates = [make_template(f"t{i}", f"Exercise {i}") for i in range(250)]
+        mock_request.side_effect = mock_pages(
+            "exercise_templates", paginate(templates, 100)
+        )
+
+        catalog = ExerciseTemplateCatalog.load(client, max_workers=4)
+
+        assert len(catalog) == 250
+        assert catalog.get("t249").title == "Exercise 249"
+        assert mock_request.call_count == 3
+        urls = sorted(call[1]["url"] for call in mock_request.call_args_list)
+        assert urls[-1].endswith("page=3&pageSize=100")
+
+    @patch("requests.Session.request")
+    def test_load_bypasses_response_cache(self, mock_request, client, mock_pages):
+        mock_request.side_effect = mock_pages(
+            "exercise_templates", paginate([make_template("t", "T")], 100)
+        )
+
+        ExerciseTemplateCatalog.load(client)
+        ExerciseTemplateCatalog.load(client)
+
+        assert mock_request.call_count == 2
+        assert len(client._cache) == 0
+
+    @patch("requests.Session.request")
+    def test_load_error(self, mock_request, client, mock_response):
+        mock_request.return_value = mock_response({"error": "Unauthorized"}, 401)
+
+        with pytest.raises(HevyAPIError, match="401"):
+            ExerciseTemplateCatalog.load(client)
+
+    @patch("requests.Session.request")
+    def test_refresh_only_applies_changes(
+        self, mock_request, client, catalog, mock_pages
+    ):
+        templates = list(catalog)
+        templates.remove(catalog.get("dips"))
+        templates.append(make_template("new", "Cable Crossover", is_custom=True))
+        mock_request.side_effect = mock_pages(
+            "exercise_templates", paginate(templates, 2)
+        )
+
+        assert catalog.refresh(client) == 2
+        assert "dips" not in catalog
+        assert catalog.get("new").is_custom
+        assert [t.id for t in catalog.search("cable cross")] == ["new"]
+        assert catalog.by_muscle_group("triceps") == []
+
+    @patch("requests.Session.request")
+    def test_malformed_page_fails_loudly(
+        self, mock_request, client, catalog, mock_pages
+    ):
+        pages = paginate(list(catalog), 2)
+        pages[0][0]["title"] = "Renamed"
+        pages[1][0] = {"id": "broken"}
+        mock_request.side_effect = mock_pages("exercise_templates", pages)
+
+        with pytest.raises(HevyAPIError, match="could not be parsed"):
+            catalog.refresh(client)
+        assert len(catalog) == 5
+        assert catalog.search("renamed") == []
+        with pytest.raises(HevyAPIError, match="could not be parsed"):
+            ExerciseTemplateCatalog.load(client)
+
+    def test_indexes(self, catalog):
+        assert [t.id for t in catalog.by_muscle_group("chest")] == [
+            "bench",
+            "fly",
+            "incline",
+            "custom",
+        ]
+        assert [t.id for t in catalog.by_muscle_group("triceps", True)] == [
+            "bench",
+            "dips",
+        ]
+        assert [t.id for t in catalog.by_type("cable")] == ["fly"]
+        assert [t.id for t in catalog.custom()] == ["custom"]
+        assert catalog.by_type("missing") == []
+
+    def test_prefix_search(self, catalog):
+        assert [t.id for t in catalog.search("bench")] == ["bench", "incline"]
+        assert [t.id for t in catalog.search("pre", fuzzy=False)] == [
+            "custom",
+            "bench",
+            "incline",
+        ]
+        assert [t.id for t in catalog.search("inc be")] == ["incline"]
+        assert [t.id for t in catalog.search("BENCH press", limit=1)] == ["bench"]
+        assert catalog.search("  ") == []
+
+    def test_fuzzy_search(self, catalog):
+        assert catalog.search("bnech press", fuzzy=False) == []
+        assert catalog.search("bnech press")[0].id == "bench"
+        assert catalog.search("tricep dips")[0].id == "dips"
+
+    def test_replace_and_remove(self, catalog):
+        catalog.add(make_template("fly", "Pec Deck", type="machine"))
+
+        assert catalog.by_type("cable") == []
+        assert catalog.search("chest", fuzzy=False) == []
+        assert [t.id for t in catalog.search("pec")] == ["fly"]
+
+        assert catalog.remove("fly").title == "Pec Deck"
+        assert catalog.remove("fly") is None
+        assert catalog.search("pec", fuzzy=False) == []
+        assert len(catalog) == 4
+
+    def test_normalize_title(self):
+        assert normalize_title("Bench Press (Barbell)") == "bench press barbell"
+        assert normalize_title("21's - Bicep Curl") == "21 s bicep curl"
+
+
+class TestExerciseTemplateSnapshot:
+    @pytest.fixture
+    def client(self):
+        return HevyClient(api_key="test_token")
+
+    @pytest.fixture
+    def templates(self):
+        return [
+            make_template("bench", "Bench Press (Barbell)", secondary=["triceps"]),
+            make_template("dips", "Triceps Dip", muscle="triceps"),
+            make_template("custom", "My Press", is_custom=True),
+        ]
+
+    def test_round_trip_skips_custom_templates(self, tmp_path, templates):
+        path = tmp_path / "templates.json.gz"
+        ExerciseTemplateCatalog(templates).save_snapshot(path)
+
+        catalog = ExerciseTemplateCatalog.from_snapshot(path)
+
+        assert sorted(t.id for t in catalog) == ["bench", "dips"]
+        assert catalog.get("bench") == templates[0]
+        assert [t.id for t in catalog.search("trice")] == ["dips"]
+
+    def test_snapshot_is_deterministic(self, tmp_path, templates):
+        first, second = tmp_path / "first", tmp_path / "second"
+        ExerciseTemplateCatalog(templates).save_snapshot(first, include_custom=True)
+        ExerciseTemplateCatalog(reversed(templates)).save_snapshot(
+            second, include_custom=True
+        )
+
+        # Only the creation timestamp differs between the two files
+        first_payload = json.loads(gzip.decompress(first.read_bytes()))
+        second_payload = json.loads(gzip.decompress(second.read_bytes()))
+        assert len(first_payload["templates"]) == 3
+        assert first_payload["templates"] == second_payload["templates"]
+
+    def test_unusable_snapshots(self, tmp_path, templates):
+        assert ExerciseTemplateCatalog.from_snapshot(tmp_path / "missing") is None
+
+        corrupt = tmp_path / "corrupt"
+        corrupt.write_bytes(b"not gzip")
+        assert ExerciseTemplateCatalog.from_snapshot(corrupt) is None
+
+        headers = {"version": SNAPSHOT_VERSION, "fields": SNAPSHOT_FIELDS}
+        fresh = {**headers, "created_at": datetime.now(timezone.utc).isoformat()}
+        for payload in (
+            [],
+            headers,
+            {**headers, "created_at": "yesterday"},
+            {**headers, "created_at": "2024-01-15T10:00:00"},
+            fresh,
+            {**fresh, "templates": [["bench", "Bench Press"]]},
+            {**fresh, "templates": [None]},
+        ):
+            unusable = tmp_path / "unusable"
+            unusable.write_bytes(gzip.compress(json.dumps(payload).encode()))
+            assert ExerciseTemplateCatalog.from_snapshot(unusable) is None
+
+        outdated = tmp_path / "outdated"
+        ExerciseTemplateCatalog(templates).save_snapshot(outdated)
+        with patch("hevy_api.catalog.SNAPSHOT_VERSION", 2):
+            assert ExerciseTemplateCatalog.from_snapshot(outdated) is None
+
+        assert ExerciseTemplateCatalog.from_snapshot(outdated, timedelta(0)) is None
+        assert ExerciseTemplateCatalog.from_snapshot(outdated, timedelta(days=1))
+
+    @patch("requests.Session.request")
+    def test_load_prefers_snapshot(
+        self, mock_request, client, tmp_path, templates, mock_pages
+    ):
+        path = tmp_path / "templates.json.gz"
+        mock_request.side_effect = mock_pages(
+            "exercise_templates", paginate(templates, 100)
+        )
+
+        # The first boot hits the API and writes the snapshot
+        first = ExerciseTemplateCatalog.load(client, snapshot=path)
+        assert len(first) == 3
+        assert mock_request.call_count == 1
+
+        # Later boots only read the snapshot
+        second = ExerciseTemplateCatalog.load(client, snapshot=path)
+        assert len(second) == 2
+        assert mock_request.call_count == 1
+
+    @patch("requests.Session.request")
+    def test_fetch_missing(self, mock_request, client, templates, mock_response):
+        def respond(method, url, headers, json):
+            if url.endswith("/custom"):
+                return mock_response(templates[2].model_dump())
+            return mock_response({"error": "Not found"}, 404)
+
+        mock_request.side_effect = respond
+        catalog = ExerciseTemplateCatalog(templates[:2])
+
+        failed = catalog.fetch_missing(client, ["bench", "custom", "gone", "custom"])
+
+        assert failed == ["gone"]
+        assert catalog.get("custom").is_custom
+        assert mock_request.call_count == 2
+
+
+class TestResolveTemplates:
+    @pytest.fixture
+    def client(self):
+        return HevyClient(api_key="test_token")
+
+    @pytest.fixture
+    def workouts(self, make_workout, exercise_data):
+        def workout(workout_id, template_ids):
+            return make_workout(
+                workout_id,
+                exercises=[
+                    exercise_data(template_id, index=index)
+                    for index, template_id in enumerate(template_ids)
+                ],
+            )
+
+        return [
+            workout("workout-1", ["bench", "dips", "bench"]),
+            workout("workout-2", ["dips", "fly", "gone"]),
+        ]
+
+    @pytest.fixture
+    def respond(self, mock_response):
+        # Every template exists but "gone"
+        def respond(method, url, headers, json):
+            template_id = url.rsplit("/", 1)[1]
+            if template_id == "gone":
+                return mock_response({"error": "Not found"}, 404)
+            return mock_response(
+                make_template(template_id, template_id.title()).model_dump()
+            )
+
+        return respond
+
+    @patch("requests.Session.request")
+    def test_resolve_templates(self, mock_request, client, workouts, respond):
+        mock_request.side_effect = respond
+
+        templates = client.resolve_templates(workouts)
+
+        assert sorted(templates) == ["bench", "dips", "fly"]
+        assert templates["fly"].title == "Fly"
+        # Each distinct template is requested exactly once
+        urls = sorted(
+            call[1]["url"].rsplit("/", 1)[1] for call in mock_request.call_args_list
+        )
+        assert urls == ["bench", "dips", "fly", "gone"]
+
+    @patch("requests.Session.request")
+    def test_resolve_templates_uses_cache(
+        self, mock_request, client, workouts, respond
+    ):
+        mock_request.side_effect = respond
+        client.get_exercise_template("bench")
+        mock_request.reset_mock()
+
+        templates = client.resolve_templates(workouts)
+
+        assert "bench" in templates
+        assert mock_request.call_count == 3
+
+        # Everything but the failed lookup is cached now
+        mock_request.reset_mock()
+        client.resolve_templates(workouts)
+        assert mock_request.call_count == 1
+
+    @patch("requests.Session.request")
+    def test_resolve_templates_records_one_lookup_per_template(
+        self, mock_request, client, workouts, respond
+    ):
+        mock_request.side_effect = respond
+        client.get_exercise_template("bench")
+
+        client.resolve_templates(workouts)
+
+        stats = client.cache_stats().types["ExerciseTemplateResponse"]
+        # One miss for the warm-up call, then bench hits and the rest miss once
+        assert (stats.hits, stats.misses) == (1, 4)
+
+    @patch("requests.Session.request")
+    def test_catalog_resolve(self, mock_request, client, workouts, respond):
+        mock_request.side_effect = respond
+        catalog = ExerciseTemplateCatalog([make_template("bench", "Bench Press")])
+
+        templates = catalog.resolve(client, workouts)
+
+        assert sorted(templates) == ["bench", "dips", "fly"]
+        assert templates["bench"].title == "Bench Press"
+        assert "fly" in catalog
+        assert mock_request.call_count == 3
@@ -0,0 +1,144 @@
+import csv
+import sys
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+from hevy_api.client import HevyClient
+from hevy_api.columnar import COLUMNS, iter_set_rows, write_csv, write_npz
+from hevy_api.export import iter_workouts
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def superset_workout(make_workout, exercise_data):
+    # A bench press with a warmup set, then a timed plank in a superset
+    def build(workout_id, notes="Focus on form"):
+        return make_workout(
+            workout_id,
+            exercises=[
+                exercise_data(
+                    "bench",
+                    [
+                        {"type": "warmup", "weight_kg": 40.0, "reps": 10},
+                        {"weight_kg": 80.0, "reps": 5},
+                    ],
+                    title="Bench Press",
+                    notes=notes,
+                ),
+                exercise_data(
+                    "plank", [{"duration_seconds": 60}], index=1, supersets_id=2
+                ),
+            ],
+        )
+
+    return build
+
+
+def test_columns_follow_models():
+    assert list(COLUMNS)[:6] == [
+        "workout_id",
+        "workout_title",
+        "start_time",
+        "end_time",
+        "exercise_index",
+        "exercise_title",
+    ]
+    assert COLUMNS["set_type"] == "str"
+    assert COLUMNS["reps"] == "float"
+    assert COLUMNS["set_index"] == "int"
+    assert COLUMNS["start_time"] == "datetime"
+
+
+def test_one_row_per_set(superset_workout):
+    rows = [
+        dict(zip(COLUMNS, row, strict=True))
+        for row in iter_set_rows([superset_workout("w1")])
+    ]
+
+    assert len(rows) == 3
+    assert rows[1]["workout_id"] == "w1"
+    assert rows[1]["exercise_notes"] == "Focus on form"
+    assert (rows[1]["set_type"], rows[1]["weight_kg"], rows[1]["reps"]) == (
+        "normal",
+        80.0,
+        5,
+    )
+    assert rows[2]["duration_seconds"] == 60
+    assert rows[2]["weight_kg"] is None
+
+
+def test_csv(tmp_path, superset_workout):
+    path = tmp_path / "sets.csv"
+
+    assert write_csv([superset_workout("w1"), superset_workout("w2")], path) == 6
+
+    with open(path, newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert len(rows) == 6
+    assert rows[3]["workout_id"] == "w2"
+    assert rows[0]["start_time"] == "2024-01-15T10:00:00+00:00"
+    assert rows[2]["weight_kg"] == ""
+
+
+def test_npz(tmp_path, superset_workout):
+    path = tmp_path / "sets.npz"
+    workouts = [
+        superset_workout("w1", notes="line one\nline two"),
+        superset_workout("w2"),
+    ]
+
+    assert write_npz(workouts, path, chunk_size=4) == 6
+
+    with np.load(path) as arrays:
+        assert sorted(arrays.files) == sorted(COLUMNS)
+        assert arrays["workout_id"].tolist() == ["w1"] * 3 + ["w2"] * 3
+        assert arrays["exercise_notes"][0] == "line one\nline two"
+        assert arrays["exercise_notes"][2] == ""
+        assert arrays["reps"][1] == 5.0
+        assert np.isnan(arrays["reps"][2])
+        assert arrays["set_index"].dtype == np.int64
+        assert arrays["start_time"][0] == np.datetime64("2024-01-15T10:00:00")
+
+
+def test_npz_is_deterministic(tmp_path, superset_workout):
+    workouts = [superset_workout("w1")]
+    write_npz(workouts, tmp_path / "first.npz")
+    write_npz(workouts, tmp_path / "second.npz")
+
+    assert (tmp_path / "first.npz").read_bytes() == (
+        tmp_path / "second.npz"
+    ).read_bytes()
+
+
+def test_npz_memory_does_not_grow_with_history(tmp_path, superset_workout):
+    workout = superset_workout("w1")
+
+    def peak(count):
+        tracemalloc.start()
+        write_npz((workout for _ in range(count)), tmp_path / "sets.npz", 100)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    small, large = peak(300), peak(3_000)
+    assert large < small * 1.5
+
+
+@patch("requests.Session.request")
+def test_streams_from_client(mock_request, tmp_path, superset_workout, mock_pages):
+    mock_request.side_effect = mock_pages(
+        "workouts", [[superset_workout("w1").model_dump(mode="json")]]
+    )
+    client = HevyClient(api_key="test_token")
+
+    assert write_csv(iter_workouts(client), tmp_path / "sets.csv") == 3
+
+
+def test_npz_requires_numpy(monkeypatch, tmp_path, superset_workout):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+    with pytest.raises(ImportError, match="numpy"):
+        write_npz([superset_workout("w1")], tmp_path / "sets.npz")
@@ -0,0 +1,158 @@
+import gzip
+import json
+import lzma
+from unittest.mock import patch
+
+import pytest
+
+from hevy_api.client import HevyClient
+from hevy_api.export import export_users, export_workouts
+from hevy_api.models.base import HevyAPIError
+
+# Workout ids per page, newest first
+PAGES = [["w5", "w4"], ["w3", "w2"], ["w1"]]
+
+
+@pytest.fixture
+def workout_pages(mock_pages, workout_data):
+    def build(fail_on_page=None, malformed_page=None):
+        pages = [[workout_data(workout_id) for workout_id in page] for page in PAGES]
+        if malformed_page is not None:
+            pages[malformed_page - 1][0] = {"id": "broken"}
+        return mock_pages("workouts", pages, fail_on_page)
+
+    return build
+
+
+class TestExportWorkouts:
+    @pytest.fixture
+    def client(self):
+        return HevyClient(api_key="test_token")
+
+    @patch("requests.Session.request")
+    def test_ndjson(self, mock_request, client, tmp_path, workout_pages):
+        mock_request.side_effect = workout_pages()
+        path = tmp_path / "workouts.ndjson"
+
+        result = export_workouts(client, path, page_size=2)
+
+        assert (result.pages, result.workouts, result.resumed) == (3, 5, False)
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [
+            "w5",
+            "w4",
+            "w3",
+            "w2",
+            "w1",
+        ]
+        assert all("    " not in line for line in lines)
+        assert not (tmp_path / "workouts.ndjson.checkpoint").exists()
+
+    @pytest.mark.parametrize(
+        ("compression", "decompress"),
+        [("gzip", gzip.decompress), ("xz", lzma.decompress)],
+    )
+    @patch("requests.Session.request")
+    def test_compressed_is_deterministic(
+        self, mock_request, client, tmp_path, compression, decompress, workout_pages
+    ):
+        mock_request.side_effect = workout_pages()
+        plain = tmp_path / "workouts.ndjson"
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+
+        export_workouts(client, plain, page_size=2)
+        export_workouts(client, first, compression=compression, page_size=2)
+        export_workouts(client, second, compression=compression, page_size=2)
+
+        assert first.read_bytes() == second.read_bytes()
+        assert decompress(first.read_bytes()) == plain.read_bytes()
+
+    @patch("requests.Session.request")
+    def test_resumes_after_failure(self, mock_request, client, tmp_path, workout_pages):
+        path = tmp_path / "workouts.ndjson.gz"
+        mock_request.side_effect = workout_pages(fail_on_page=3)
+        with pytest.raises(HevyAPIError):
+            export_workouts(client, path, compression="gzip", page_size=2)
+        assert (tmp_path / "workouts.ndjson.gz.checkpoint").exists()
+        # Bytes from a page that never completed are discarded on resume
+        with open(path, "ab") as file:
+            file.write(b"torn")
+
+        mock_request.reset_mock()
+        mock_request.side_effect = workout_pages()
+        result = export_workouts(client, path, compression="gzip", page_size=2)
+
+        assert (result.pages, result.workouts, result.resumed) == (3, 5, True)
+        assert mock_request.call_count == 1
+        fresh = tmp_path / "fresh.ndjson.gz"
+        export_workouts(client, fresh, compression="gzip", page_size=2)
+        assert path.read_bytes() == fresh.read_bytes()
+
+    @patch("requests.Session.request")
+    def test_malformed_page_is_not_skipped(
+        self, mock_request, client, tmp_path, workout_pages
+    ):
+        path = tmp_path / "workouts.ndjson"
+        mock_request.side_effect = workout_pages(malformed_page=2)
+        with pytest.raises(HevyAPIError, match="could not be parsed"):
+            export_workouts(client, path, page_size=2)
+
+        mock_request.side_effect = workout_pages()
+        result = export_workouts(client, path, page_size=2)
+
+        assert (result.pages, result.workouts, result.resumed) == (3, 5, True)
+        assert len(path.read_text().splitlines()) == 5
+
+    @patch("requests.Session.request")
+    def test_resume_after_the_last_page(
+        self, mock_request, client, tmp_path, workout_pages
+    ):
+        path = tmp_path / "workouts.ndjson"
+        mock_request.side_effect = workout_pages()
+        # Killed after the last checkpoint was written, before it was removed
+        with (
+            patch("pathlib.Path.unlink", side_effect=KeyboardInterrupt),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            export_workouts(client, path, page_size=2)
+        exported = path.read_bytes()
+
+        mock_request.reset_mock()
+        result = export_workouts(client, path, page_size=2)
+
+        assert (result.pages, result.workouts, result.resumed) == (3, 5, True)
+        mock_request.assert_not_called()
+        assert path.read_bytes() == exported
+        assert not (tmp_path / "workouts.ndjson.checkpoint").exists()
+
+    @pytest.mark.parametrize("checkpoint", ["[]", "null", "not json"])
+    @patch("requests.Session.request")
+    def test_unreadable_checkpoint_starts_over(
+        self, mock_request, client, tmp_path, workout_pages, checkpoint
+    ):
+        path = tmp_path / "workouts.ndjson"
+        path.write_text("partial")
+        (tmp_path / "workouts.ndjson.checkpoint").write_text(checkpoint)
+        mock_request.side_effect = workout_pages()
+
+        result = export_workouts(client, path, page_size=2)
+
+        assert (result.pages, result.workouts, result.resumed) == (3, 5, False)
+        assert len(path.read_text().splitlines()) == 5
+
+    @patch("requests.Session.request")
+    def test_several_users(self, mock_request, tmp_path, workout_pages):
+        mock_request.side_effect = workout_pages()
+        clients = [HevyClient(api_key=f"key-{i}") for i in range(3)]
+
+        results = export_users(
+            [
+                (client, tmp_path / f"user-{i}.ndjson")
+                for i, client in enumerate(clients)
+            ],
+            page_size=2,
+        )
+
+        assert [result.workouts for result in results] == [5, 5, 5]
+        assert len({result.path.read_bytes() for result in results}) == 1
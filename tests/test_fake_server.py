@@ -0,0 +1,94 @@
+import json
+import urllib.request
+from datetime import datetime, timezone
+
+import pytest
+
+from hevy_api.client import HevyClient
+from hevy_api.export import iter_workouts
+from hevy_api.testing import (
+    FakeHevyServer,
+    exercise_template_payload,
+    routine_payload,
+    workout_payload,
+)
+
+
+@pytest.fixture
+def server():
+    with FakeHevyServer(
+        workouts=[workout_payload(i, exercises=2, sets=2) for i in range(23)],
+        routines=[routine_payload(i) for i in range(3)],
+        exercise_templates=[exercise_template_payload(i) for i in range(7)],
+    ) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    return HevyClient(api_key="test_token", base_url=server.url)
+
+
+class TestFakeHevyServer:
+    def test_reads(self, client):
+        assert client.get_workout_count().workout_count.workout_count == 23
+        workout = client.get_workout("workout-00000003").workout
+        assert workout.title == "Workout 3"
+        assert len(workout.exercises) == 2
+        assert client.get_routine("routine-00000001").routine.id == "routine-00000001"
+        template = client.get_exercise_template("00000004").exercise_template
+        assert template.title == "Exercise 4"
+        assert client.get_workout("missing").status_code == 404
+
+    def test_pagination(self, client):
+        page = client.get_workouts(page_number=3, page_size=10)
+        assert page.page_count == 3
+        # Newest first, like the API
+        assert [w.id for w in page.workouts] == [
+            "workout-00000002",
+            "workout-00000001",
+            "workout-00000000",
+        ]
+        assert len(list(iter_workouts(client, page_size=5))) == 23
+        assert len(client.get_exercise_templates(page_size=5).exercise_templates) == 5
+
+    def test_events_since(self, client):
+        since = datetime(2024, 1, 21, tzinfo=timezone.utc)
+        events = client.get_workout_events(since, page_size=10).events
+        assert [event.workout_id for event in events] == [
+            "workout-00000020",
+            "workout-00000021",
+            "workout-00000022",
+        ]
+
+    def test_connections_are_reused(self, server, client):
+        for i in range(5):
+            client.get_workout(f"workout-{i:08d}")
+
+        assert server.request_count == 5
+        # A single pooled connection served every request
+        pool = client.http_client.session.get_adapter(server.url).poolmanager
+        assert len(pool.pools) == 1
+
+    def test_writes(self, server, client):
+        assert client.get_workout("workout-00000001").workout.title == "Workout 1"
+
+        body = json.dumps({"title": "Renamed"}).encode()
+        request = urllib.request.Request(
+            f"{server.url}/v1/workouts/workout-00000001", data=body, method="PUT"
+        )
+        with urllib.request.urlopen(request) as response:
+            assert json.loads(response.read())["title"] == "Renamed"
+        assert server.workouts["workout-00000001"]["title"] == "Renamed"
+
+        # Cached encodings are dropped, reads see the write
+        with urllib.request.urlopen(
+            f"{server.url}/v1/workouts/workout-00000001"
+        ) as response:
+            assert json.loads(response.read())["title"] == "Renamed"
+
+    def test_latency(self, client, server):
+        server.latency = 0.05
+        client.get_workout("workout-00000001")
+        stats = client.metrics.get("GET", "/v1/workouts/{workoutId}")
+        assert stats.latency.sum >= 0.05
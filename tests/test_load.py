@@ -0,0 +1,123 @@
+from unittest.mock import patch
+
+import pytest
+
+from hevy_api.client import HevyClient
+from hevy_api.models.model import Workout
+from hevy_api.testing import FakeHevyServer, SyntheticData
+from hevy_api.testing.load import LoadReport, LoadTest, ScenarioStats
+from hevy_api.testing.server import Faults
+
+
+def fetch(server, api_key="test_token", **options):
+    client = HevyClient(api_key=api_key, base_url=server.url, **options)
+    return client, client.get_workouts()
+
+
+class TestFaults:
+    def test_rate_limited_requests_are_retried(self):
+        faults = Faults(rate_limited=1.0, retry_after=0)
+        with FakeHevyServer.synthetic(workouts=5, faults=faults) as server:
+            client, response = fetch(server, max_retries=2)
+
+        assert response.status_code == 429
+        assert client.metrics.get("GET", "/v1/workouts").retries == 2
+        assert server.fault_counts["rate_limited"] == 3
+
+    def test_server_errors(self):
+        with FakeHevyServer.synthetic(
+            workouts=5, faults=Faults(server_error=1.0)
+        ) as server:
+            _, response = fetch(server)
+
+        assert response.status_code == 503
+        assert response.is_unavailable
+
+    def test_connection_resets(self):
+        with FakeHevyServer.synthetic(workouts=5, faults=Faults(reset=1.0)) as server:
+            _, response = fetch(server)
+
+        assert response.status_code == 0
+
+    @patch("hevy_api.testing.server.time.time", return_value=1_000.5)
+    def test_rate_limit_per_api_key(self, mock_time):
+        server = FakeHevyServer(rate_limit=2)
+        try:
+            assert [server.fault("a") for _ in range(3)] == [None, None, "rate_limited"]
+            assert server.fault("b") is None
+
+            mock_time.return_value = 1_001.0
+            assert server.fault("a") is None
+        finally:
+            server.stop()
+
+
+class TestLoadTest:
+    def test_run(self):
+        with FakeHevyServer.synthetic(workouts=50) as server:
+            report = LoadTest(
+                server.url,
+                users=3,
+                duration=0.3,
+                mix={"browse": 1, "sync": 1, "write": 1},
+                sample_interval=0.05,
+            ).run()
+            created = len(server.workouts) - 50
+
+        assert report.runs > 0
+        assert report.errors == 0
+        assert set(report.scenarios) == {"browse", "sync", "write"}
+        assert set(report.statuses) == {200}
+        assert report.requests == sum(report.statuses.values())
+        # One keep-alive connection per user, plus the stats request
+        assert report.connections <= 3 + 1
+        assert report.scenarios["write"].runs == created
+        assert len(report.rss) >= 2
+        assert "browse" in report.format()
+
+    def test_errors_are_counted(self):
+        faults = Faults(server_error=1.0)
+        with FakeHevyServer.synthetic(workouts=5, faults=faults) as server:
+            report = LoadTest(
+                server.url, users=2, duration=0.1, mix={"browse": 1}
+            ).run()
+
+        assert report.error_rate == 1.0
+        assert set(report.statuses) == {503}
+
+    def test_unknown_scenario(self):
+        with pytest.raises(ValueError):
+            LoadTest("http://127.0.0.1:1", mix={"dance": 1})
+
+
+class TestLoadReport:
+    def test_rates(self):
+        report = LoadReport(
+            users=2,
+            duration_seconds=2.0,
+            runs=10,
+            errors=1,
+            scenarios={"browse": ScenarioStats(runs=10, errors=1)},
+            requests=40,
+            statuses={200: 39, 503: 1},
+            retries=0,
+        )
+
+        assert report.error_rate == 0.1
+        assert report.runs_per_second == 5.0
+        assert report.requests_per_second == 20.0
+
+
+class TestWrites:
+    def test_create_and_update_over_http(self):
+        workout = Workout(**SyntheticData(seed=1).workout(3))
+        with FakeHevyServer.synthetic(workouts=5) as server:
+            client = HevyClient(api_key="test_token", base_url=server.url)
+            created = client.create_workout(workout)
+            updated = client.update_workout(
+                created.workout.id, workout.model_copy(update={"title": "Edited"})
+            )
+
+            assert created.status_code == 200
+            assert updated.workout.title == "Edited"
+            assert server.workouts[created.workout.id]["title"] == "Edited"
@@ -0,0 +1,50 @@
+import pytest
+
+from hevy_api.testing.memory import allocated_per_item, footprints
+
+# Bytes per item, about 20% above what was measured when they were set.
+# Raise one only for a change that is worth the memory.
+THRESHOLDS = {
+    "set": 1_400,
+    "workout": 34_000,
+    "workout_payload": 16_000,
+    "workout_response": 50_000,
+    "cached_workout": 51_000,
+    "cached_workout_compact": 38_000,
+    "workouts_response_per_workout": 49_000,
+    "routine_response": 50_000,
+    "exercise_template_response": 3_500,
+}
+
+
+@pytest.fixture(scope="module")
+def measured():
+    return footprints(count=100, seed=0)
+
+
+class TestMemoryFootprint:
+    @pytest.mark.parametrize("name", sorted(THRESHOLDS))
+    def test_within_threshold(self, measured, name):
+        assert measured[name] <= THRESHOLDS[name], (
+            f"{name} takes {measured[name]:.0f} bytes per item,"
+            f" over the {THRESHOLDS[name]} byte budget"
+        )
+
+    def test_every_footprint_is_gated(self, measured):
+        assert set(measured) == set(THRESHOLDS)
+
+    def test_responses_keep_the_raw_payload(self, measured):
+        # A response holds both the decoded JSON and the models built from it
+        assert measured["workout_response"] == pytest.approx(
+            measured["workout"] + measured["workout_payload"], rel=0.1
+        )
+
+    def test_compact_cache_drops_the_raw_payload(self, measured):
+        saved = measured["cached_workout"] - measured["cached_workout_compact"]
+        assert saved == pytest.approx(measured["workout_payload"], rel=0.3)
+
+    def test_allocated_per_item(self):
+        assert allocated_per_item(lambda i: bytes(1_000), 50) == pytest.approx(
+            1_000, rel=0.1
+        )
+        assert allocated_per_item(lambda i: None, 50) < 50
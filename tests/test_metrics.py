@@ -0,0 +1,145 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from hevy_api.client import HevyClient
+from hevy_api.metrics import Histogram, RequestMetrics
+
+
+@pytest.fixture
+def api_response(mock_response):
+    # Sizes are counted from the raw bodies, 12 bytes in and 17 out
+    def build(status_code=200, headers=None):
+        response = mock_response({"id": "w1"}, status_code, headers)
+        response.request.body = b'{"title": "Push"}'
+        return response
+
+    return build
+
+
+class TestHistogram:
+    def test_quantiles(self):
+        histogram = Histogram(buckets=(0.1, 0.2, 0.5))
+        for value in [0.05] * 50 + [0.15] * 40 + [0.4] * 9 + [3.0]:
+            histogram.observe(value)
+
+        assert histogram.count == 100
+        assert histogram.counts == [50, 40, 9, 1]
+        assert histogram.quantile(0.5) == pytest.approx(0.1)
+        assert 0.1 < histogram.quantile(0.9) <= 0.2
+        assert histogram.quantile(1.0) == 0.5
+        assert Histogram().quantile(0.5) == 0.0
+
+
+class TestRequestMetrics:
+    @pytest.fixture
+    def client(self):
+        return HevyClient(api_key="test_token")
+
+    @patch("requests.Session.request")
+    def test_grouped_by_route(self, mock_request, client, api_response):
+        mock_request.return_value = api_response()
+
+        client.get_workout("w1")
+        client.get_workout("w2")
+        client.get_workouts(page_number=2)
+
+        snapshot = client.metrics.snapshot()
+        assert list(snapshot) == ["GET /v1/workouts", "GET /v1/workouts/{workoutId}"]
+        stats = snapshot["GET /v1/workouts/{workoutId}"]
+        assert stats["requests"] == 2
+        assert stats["statuses"] == {200: 2}
+        assert stats["bytes_received"] == 24
+        assert stats["bytes_sent"] == 34
+        assert stats["latency_sum"] > 0
+
+    @patch("requests.Session.request")
+    def test_errors_and_retries(self, mock_request, client, api_response):
+        mock_request.side_effect = [
+            api_response(429, headers={"Retry-After": "0"}),
+            api_response(404),
+            requests.ConnectionError("down"),
+        ]
+
+        client.get_routine("r1")
+        client.get_routine("r2")
+
+        stats = client.metrics.get("GET", "/v1/routines/{routineId}")
+        assert stats.statuses == {429: 1, 404: 1, 0: 1}
+        assert stats.errors == 3
+        assert stats.retries == 1
+
+    def test_reset(self):
+        metrics = RequestMetrics()
+        metrics.observe("GET", "/v1/workouts", 0.1, 200)
+        metrics.reset()
+
+        assert metrics.snapshot() == {}
+
+
+class TestHooks:
+    @pytest.fixture
+    def client(self):
+        return HevyClient(api_key="test_token")
+
+    @patch("requests.Session.request")
+    def test_lifecycle(self, mock_request, client, api_response):
+        mock_request.side_effect = [
+            api_response(429, headers={"Retry-After": "0"}),
+            api_response(200),
+            requests.ConnectionError("down"),
+        ]
+        events = []
+        for name in ("before_request", "after_response", "on_error", "on_retry"):
+            client.http_client.add_hook(
+                name,
+                lambda event, name=name: events.append(
+                    (name, event.route, event.attempt)
+                ),
+            )
+
+        client.get_workout("w1")
+        client.get_workout("w2")
+
+        route = "/v1/workouts/{workoutId}"
+        assert events == [
+            ("before_request", route, 0),
+            ("after_response", route, 0),
+            ("on_retry", route, 0),
+            ("before_request", route, 1),
+            ("after_response", route, 1),
+            ("before_request", route, 0),
+            ("on_error", route, 0),
+        ]
+
+    @patch("requests.Session.request")
+    def test_event_details(self, mock_request, client, api_response):
+        mock_request.return_value = api_response(200)
+        events = []
+        client.http_client.add_hook("after_response", events.append)
+
+        client.get_workout_count()
+
+        (event,) = events
+        assert event.method == "GET"
+        assert event.response.status_code == 200
+        assert event.elapsed >= 0
+        assert event.error is None
+
+    @patch("requests.Session.request")
+    def test_failing_hook_does_not_break_requests(
+        self, mock_request, client, api_response
+    ):
+        mock_request.return_value = api_response(200)
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        client.http_client.add_hook("before_request", broken)
+
+        assert client.get_workout_count().is_success
+
+    def test_unknown_hook(self, client):
+        with pytest.raises(ValueError, match="Unknown hook"):
+            client.http_client.add_hook("on_success", print)
@@ -0,0 +1,258 @@
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from hevy_api.client import HevyClient
+from hevy_api.mirror import LocalMirror
+from hevy_api.models.model import ExerciseTemplate, Routine
+
+
+@pytest.fixture
+def lifting_workout(make_workout, exercise_data):
+    # One exercise per template, each a warmup and a working set
+    def build(workout_id, day, template_ids=("bench",)):
+        sets = [
+            {"type": "warmup", "weight_kg": 40.0, "reps": 10},
+            {"weight_kg": 80.0, "reps": 5},
+        ]
+        return make_workout(
+            workout_id,
+            day,
+            [
+                exercise_data(
+                    template_id,
+                    sets,
+                    index=index,
+                    notes="Focus on form" if index == 0 else None,
+                )
+                for index, template_id in enumerate(template_ids)
+            ],
+        )
+
+    return build
+
+
+class TestLocalMirror:
+    @pytest.fixture
+    def mirror(self):
+        mirror = LocalMirror()
+        yield mirror
+        mirror.close()
+
+    def test_workout_round_trip(self, mirror, lifting_workout):
+        workout = lifting_workout("w1", 15, ["bench", "dips"])
+        mirror.add_workout(workout)
+
+        assert mirror.get_workout("w1") == workout
+        assert mirror.get_workout("missing") is None
+        assert mirror.workout_count() == 1
+
+    def test_update_replaces_exercises(self, mirror, lifting_workout):
+        mirror.add_workout(lifting_workout("w1", 15, ["bench", "dips"]))
+        updated = lifting_workout("w1", 15, ["squat"])
+        mirror.add_workout(updated)
+
+        assert mirror.get_workout("w1") == updated
+        assert mirror.workouts_with_exercise("bench") == []
+
+    def test_date_range_queries(self, mirror, lifting_workout):
+        mirror.add_workouts(lifting_workout(f"w{day}", day) for day in range(1, 11))
+
+        workouts = mirror.workouts(
+            start=datetime(2024, 1, 3, tzinfo=timezone.utc),
+            end=datetime(2024, 1, 6, tzinfo=timezone.utc),
+        )
+        assert [w.id for w in workouts] == ["w5", "w4", "w3"]
+        assert [w.id for w in mirror.workouts(limit=2)] == ["w10", "w9"]
+
+    def test_per_exercise_queries(self, mirror, lifting_workout):
+        mirror.add_workouts(
+            [
+                lifting_workout("w1", 1, ["bench"]),
+                lifting_workout("w2", 2, ["squat"]),
+                lifting_workout("w3", 3, ["squat", "bench"]),
+            ]
+        )
+
+        assert [w.id for w in mirror.workouts_with_exercise("bench")] == ["w3", "w1"]
+        assert [
+            w.id
+            for w in mirror.workouts_with_exercise(
+                "squat", start=datetime(2024, 1, 3, tzinfo=timezone.utc)
+            )
+        ] == ["w3"]
+
+    def test_remove_workout(self, mirror, lifting_workout):
+        mirror.add_workout(lifting_workout("w1", 1))
+        mirror.remove_workout("w1")
+
+        assert mirror.get_workout("w1") is None
+        assert mirror.workouts_with_exercise("bench") == []
+
+    def test_routines_and_templates(self, mirror, lifting_workout):
+        workout = lifting_workout("w1", 1)
+        routine = Routine(
+            id="r1",
+            title="Push",
+            folder_id=3,
+            updated_at=workout.updated_at,
+            created_at=workout.created_at,
+            exercises=workout.exercises,
+        )
+        template = ExerciseTemplate(
+            id="bench",
+            title="Bench Press",
+            type="weight_reps",
+            primary_muscle_group="chest",
+            secondary_muscle_groups=["triceps"],
+        )
+        mirror.add_workout(workout)
+        mirror.add_routine(routine)
+        mirror.add_exercise_templates([template])
+
+        assert mirror.get_routine("r1") == routine
+        assert mirror.routines() == [routine]
+        assert mirror.get_exercise_template("bench") == template
+        assert mirror.exercise_templates() == [template]
+        # Routine exercises do not show up in workout queries
+        mirror.remove_workout("w1")
+        assert mirror.workouts_with_exercise("bench") == []
+        mirror.remove_routine("r1")
+        assert mirror.get_routine("r1") is None
+
+    def test_persisted_to_disk(self, tmp_path, lifting_workout):
+        path = tmp_path / "mirror.sqlite"
+        mirror = LocalMirror(path)
+        mirror.add_workout(lifting_workout("w1", 1))
+        mirror.close()
+
+        reopened = LocalMirror(path)
+        assert reopened.get_workout("w1") == lifting_workout("w1", 1)
+        reopened.close()
+
+
+class TestHevyClientWithMirror:
+    @pytest.fixture
+    def mirror(self):
+        return LocalMirror()
+
+    @pytest.fixture
+    def client(self, mirror):
+        return HevyClient(api_key="test_token", mirror=mirror)
+
+    @patch("requests.Session.request")
+    def test_reads_through_mirror(self, mock_request, client, mirror, lifting_workout):
+        mirror.add_workout(lifting_workout("w1", 1))
+
+        result = client.get_workout("w1")
+
+        assert result.is_success
+        assert result.workout == lifting_workout("w1", 1)
+        mock_request.assert_not_called()
+
+    @patch("requests.Session.request")
+    def test_old_copies_are_refetched(
+        self, mock_request, client, mirror, lifting_workout, mock_response
+    ):
+        mirror.add_workout(lifting_workout("w1", 1))
+        edited = lifting_workout("w1", 1).model_copy(update={"title": "Edited"})
+        mock_request.return_value = mock_response(edited.model_dump(mode="json"))
+
+        with patch("hevy_api.mirror.time.time", return_value=time.time() + 301):
+            result = client.get_workout("w1")
+
+        assert result.workout.title == "Edited"
+        assert mirror.get_workout("w1").title == "Edited"
+        mock_request.assert_called_once()
+
+    @patch("requests.Session.request")
+    def test_responses_are_mirrored(
+        self, mock_request, client, mirror, lifting_workout, mock_pages
+    ):
+        mock_request.side_effect = mock_pages(
+            "workouts", [[lifting_workout("w1", 1).model_dump(mode="json")]]
+        )
+
+        client.get_workouts()
+
+        assert mirror.get_workout("w1") == lifting_workout("w1", 1)
+        # A later lookup by ID never reaches the API
+        assert client.get_workout("w1").workout.id == "w1"
+        mock_request.assert_called_once()
+
+    @patch("requests.Session.request")
+    def test_errors_are_not_mirrored(self, mock_request, client, mirror, mock_response):
+        mock_request.return_value = mock_response({"error": "Not found"}, 404)
+
+        assert client.get_workout("w1").is_error
+        assert mirror.workout_count() == 0
+
+
+class TestOfflineFallback:
+    @pytest.fixture
+    def mirror(self):
+        return LocalMirror()
+
+    @pytest.fixture
+    def client(self, mirror):
+        return HevyClient(api_key="test_token", mirror=mirror, offline_fallback=True)
+
+    @patch("requests.Session.request")
+    def test_serves_last_good_response(
+        self, mock_request, lifting_workout, mock_response
+    ):
+        client = HevyClient(api_key="test_token", offline_fallback=True)
+        mock_request.return_value = mock_response(
+            lifting_workout("w1", 1).model_dump(mode="json")
+        )
+        fresh = client.get_workout("w1")
+        assert not fresh.is_stale
+
+        client._cache.clear()
+        mock_request.side_effect = requests.ConnectionError("Hevy is down")
+        result = client.get_workout("w1")
+
+        assert result.is_success
+        assert result.is_stale
+        assert result.age >= timedelta(0)
+        assert result.workout == lifting_workout("w1", 1)
+        # Stale copies are never cached, the next call retries the API
+        assert "w1" not in client._cache
+        assert fresh.age is None
+
+    @patch("requests.Session.request")
+    def test_serves_mirrored_pages(
+        self, mock_request, client, mirror, lifting_workout, mock_response
+    ):
+        mirror.add_workouts(lifting_workout(f"w{day}", day) for day in range(1, 8))
+        mock_request.return_value = mock_response({"error": "Bad gateway"}, 502)
+
+        result = client.get_workouts(page_number=2, page_size=5)
+
+        assert result.is_stale
+        assert result.page == 2
+        assert result.page_count == 2
+        assert [w.id for w in result.workouts] == ["w2", "w1"]
+        assert client.get_workout_count().workout_count.workout_count == 7
+
+    @patch("requests.Session.request")
+    def test_nothing_to_fall_back_on(self, mock_request, client):
+        mock_request.side_effect = requests.ConnectionError("Hevy is down")
+
+        result = client.get_routine("r1")
+
+        assert result.status_code == 0
+        assert not result.is_stale
+
+    @patch("requests.Session.request")
+    def test_client_errors_are_not_masked(
+        self, mock_request, client, mirror, lifting_workout, mock_response
+    ):
+        mirror.add_workout(lifting_workout("w1", 1))
+        client.mirror = None
+        mock_request.return_value = mock_response({"error": "Unauthorized"}, 401)
+
+        assert client.get_workout("w1").status_code == 401
@@ -0,0 +1,205 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from hevy_api.client import HevyClient
+from hevy_api.models.model import Routine
+from hevy_api.outbox import FAILED, PENDING, SENT, Outbox
+
+
+def make_routine(title):
+    return Routine(
+        id="r1",
+        title=title,
+        updated_at="2024-01-15T11:00:00Z",
+        created_at="2024-01-15T10:00:00Z",
+        exercises=[],
+    )
+
+
+@pytest.fixture
+def mock_api(mock_response):
+    # Answers with the queued status codes first, then with successes
+    def build(statuses=()):
+        statuses = list(statuses)
+
+        def respond(method, url, headers, json):
+            status_code = statuses.pop(0) if statuses else 200
+            if status_code >= 400:
+                return mock_response({"error": "Failed"}, status_code)
+            if "/routines" in url:
+                return mock_response({"routine": json}, status_code)
+            return mock_response({**json, "id": "w1"}, status_code)
+
+        return respond
+
+    return build
+
+
+class TestOutbox:
+    @pytest.fixture
+    def client(self):
+        return HevyClient(api_key="test_token", max_retries=0)
+
+    @pytest.fixture
+    def outbox(self, client):
+        outbox = Outbox(client, retry_delay=0)
+        yield outbox
+        outbox.close()
+
+    @patch("requests.Session.request")
+    def test_writes_are_queued_until_flushed(
+        self, mock_request, outbox, make_workout, mock_api
+    ):
+        mock_request.side_effect = mock_api()
+
+        key = outbox.create_workout(make_workout(title="Push"))
+
+        mock_request.assert_not_called()
+        assert outbox.get(key).status == PENDING
+        assert outbox.flush() == 1
+        assert outbox.get(key).status == SENT
+        assert mock_request.call_args[1]["json"]["title"] == "Push"
+
+    @patch("requests.Session.request")
+    def test_survives_restarts(self, mock_request, client, tmp_path, mock_api):
+        mock_request.side_effect = mock_api()
+        path = tmp_path / "outbox.sqlite"
+        Outbox(client, path).update_routine("r1", make_routine("Push"))
+
+        reopened = Outbox(client, path)
+        assert reopened.pending_count() == 1
+        assert reopened.flush() == 1
+        assert mock_request.call_args[1]["url"].endswith("/v1/routines/r1")
+        reopened.close()
+
+    @patch("requests.Session.request")
+    def test_retries_when_the_api_is_down(
+        self, mock_request, outbox, make_workout, mock_api
+    ):
+        mock_request.side_effect = mock_api([503, 502])
+        key = outbox.create_workout(make_workout(title="Push"))
+
+        # Without a retry delay every retry is due straight away
+        assert outbox.flush() == 1
+        assert outbox.get(key).status == SENT
+        assert mock_request.call_count == 3
+
+    @patch("requests.Session.request")
+    def test_backs_off_between_attempts(
+        self, mock_request, client, make_workout, mock_api
+    ):
+        mock_request.side_effect = mock_api([503])
+        outbox = Outbox(client, retry_delay=60)
+        key = outbox.create_workout(make_workout(title="Push"))
+
+        assert outbox.flush() == 0
+        assert outbox.get(key).attempts == 1
+        assert outbox.get(key).last_error.startswith("503")
+        assert outbox.flush() == 0
+        assert mock_request.call_count == 1
+        outbox.close()
+
+    @patch("requests.Session.request")
+    def test_rejected_writes_are_kept(
+        self, mock_request, outbox, make_workout, mock_api
+    ):
+        mock_request.side_effect = mock_api([400])
+        key = outbox.create_workout(make_workout(title="Push"))
+
+        assert outbox.flush() == 0
+        assert [entry.key for entry in outbox.failed()] == [key]
+        assert outbox.get(key).status == FAILED
+        assert outbox.pending_count() == 0
+
+        assert outbox.retry_failed() == 1
+        assert outbox.flush() == 1
+
+    @patch("requests.Session.request")
+    def test_same_key_is_queued_once(
+        self, mock_request, outbox, make_workout, mock_api
+    ):
+        mock_request.side_effect = mock_api()
+
+        outbox.create_workout(make_workout(title="Push"), key="import-1")
+        outbox.create_workout(make_workout(title="Push"), key="import-1")
+
+        assert outbox.flush() == 1
+        assert mock_request.call_count == 1
+
+    @patch("requests.Session.request")
+    def test_sent_key_is_not_sent_again(self, mock_request, outbox, mock_api):
+        mock_request.side_effect = mock_api()
+
+        outbox.create_routine(make_routine("Push"), key="k1")
+        assert outbox.flush() == 1
+        outbox.create_routine(make_routine("Push"), key="k1")
+
+        assert outbox.flush() == 0
+        assert mock_request.call_count == 1
+
+    @patch("requests.Session.request")
+    def test_sent_keys_are_pruned(self, mock_request, client, mock_api):
+        mock_request.side_effect = mock_api()
+        outbox = Outbox(client, sent_retention=0)
+        key = outbox.create_routine(make_routine("Push"))
+        assert outbox.flush() == 1
+
+        time.sleep(0.01)
+        outbox.flush()
+        assert outbox.get(key) is None
+        outbox.close()
+
+    @patch("requests.Session.request")
+    def test_queued_updates_are_coalesced(self, mock_request, outbox, mock_api):
+        mock_request.side_effect = mock_api()
+
+        first = outbox.update_routine("r1", make_routine("Push"))
+        second = outbox.update_routine("r1", make_routine("Push v2"))
+
+        assert first == second
+        assert outbox.flush() == 1
+        assert mock_request.call_args[1]["json"]["title"] == "Push v2"
+
+    @patch("requests.Session.request")
+    def test_updates_with_their_own_key_are_not_coalesced(
+        self, mock_request, outbox, mock_api
+    ):
+        mock_request.side_effect = mock_api()
+
+        outbox.update_routine("r1", make_routine("Push"), key="u1")
+        assert outbox.update_routine("r1", make_routine("Push v2"), key="u2") == "u2"
+        assert outbox.get("u2").status == PENDING
+
+        assert outbox.flush() == 2
+        assert outbox.get("u2").status == SENT
+        assert mock_request.call_args[1]["json"]["title"] == "Push v2"
+
+    @patch("requests.Session.request")
+    def test_updates_to_an_entity_stay_in_order(self, mock_request, client, mock_api):
+        mock_request.side_effect = mock_api([503])
+        outbox = Outbox(client, retry_delay=60)
+        outbox.update_routine("r1", make_routine("Push"))
+        assert outbox.flush() == 0
+
+        # The retry is not due yet, and the newer update has to wait for it
+        outbox.update_routine("r1", make_routine("Push v2"))
+        outbox.update_routine("r2", make_routine("Pull"))
+        assert outbox.flush() == 1
+        assert mock_request.call_args[1]["url"].endswith("/v1/routines/r2")
+        assert outbox.pending_count() == 2
+        outbox.close()
+
+    @patch("requests.Session.request")
+    def test_background_flusher(self, mock_request, client, make_workout, mock_api):
+        mock_request.side_effect = mock_api()
+
+        with Outbox(client) as outbox:
+            outbox.create_workout(make_workout(title="Push"))
+            deadline = time.monotonic() + 5
+            while outbox.pending_count() and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert outbox.pending_count() == 0
+        assert mock_request.call_count == 1
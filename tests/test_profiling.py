@@ -0,0 +1,116 @@
+import time
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+from hevy_api.client import HevyClient
+from hevy_api.profiling import PhaseStats, Profiler, ProfileReport
+from hevy_api.tracing import InMemoryExporter, Tracer
+
+
+class TestProfiler:
+    @patch("requests.Session.request")
+    def test_phases_per_route(self, mock_request, mock_response, workout_data):
+        mock_request.return_value = mock_response(workout_data("w1"))
+        client = HevyClient(api_key="test_token", profile=True)
+        try:
+            client.get_workout("w1")
+            client.get_workout("w1")
+            client.get_workouts()
+        finally:
+            client.profiler.stop()
+
+        report = client.profiler.report()
+        workout = report.routes["GET /v1/workouts/{workoutId}"]
+        assert set(workout) == {"cache", "client", "io", "parse", "validate"}
+        # The second call was a cache hit, only the first reached the API
+        assert workout["cache"].calls == 2
+        assert workout["io"].calls == workout["validate"].calls == 1
+        assert "GET /v1/workouts" in report.routes
+        assert report.totals()["cache"].calls == 3
+
+    @patch("requests.Session.request")
+    def test_network_wait_is_io_only(self, mock_request, mock_response, workout_data):
+        def slow_request(*args, **kwargs):
+            time.sleep(0.05)
+            return mock_response(workout_data("w1"))
+
+        mock_request.side_effect = slow_request
+        client = HevyClient(api_key="test_token")
+        with client.profile(trace_memory=False) as profiler:
+            client.get_workout("w1")
+
+        phases = profiler.report().routes["GET /v1/workouts/{workoutId}"]
+        assert phases["io"].wall_seconds >= 0.05
+        # Sleeping is waiting, not CPU work
+        assert phases["io"].cpu_seconds < 0.04
+        # Enclosing spans only count their own time
+        assert phases["cache"].wall_seconds < 0.05
+        assert phases["client"].wall_seconds < 0.05
+
+    @patch("requests.Session.request")
+    def test_allocations_are_attributed(
+        self, mock_request, mock_response, workout_data
+    ):
+        data = {
+            "page": 1,
+            "page_count": 1,
+            "workouts": [workout_data(f"w{i}") for i in range(200)],
+        }
+        mock_request.return_value = mock_response(data)
+        client = HevyClient(api_key="test_token")
+
+        with client.profile() as profiler:
+            assert tracemalloc.is_tracing()
+            response = client.get_workouts(page_size=200)
+        assert not tracemalloc.is_tracing()
+
+        phases = profiler.report().routes["GET /v1/workouts"]
+        # The validated models are still referenced by the cached response
+        assert len(response.workouts) == 200
+        assert phases["validate"].allocated_bytes > 10_000
+
+    @patch("requests.Session.request")
+    def test_profile_restores_tracer_and_keeps_exporting(
+        self, mock_request, mock_response, workout_data
+    ):
+        mock_request.return_value = mock_response(workout_data("w1"))
+        exporter = InMemoryExporter()
+        tracer = Tracer(exporter)
+        client = HevyClient(api_key="test_token", tracer=tracer)
+
+        with client.profile(trace_memory=False):
+            assert client.http_client.tracer is not tracer
+            client.get_workout("w1")
+
+        assert client.tracer is tracer
+        assert client.http_client.tracer is tracer
+        assert "hevy.get" in {span.name for span in exporter.spans}
+
+    def test_user_spans_are_not_reported(self):
+        profiler = Profiler(trace_memory=False)
+        with profiler.span("import"):
+            pass
+        assert profiler.report().routes == {}
+
+
+class TestProfileReport:
+    def test_format(self):
+        report = ProfileReport(
+            routes={
+                "GET /v1/workouts": {
+                    "io": PhaseStats(calls=2, wall_seconds=0.3, cpu_seconds=0.01),
+                    "validate": PhaseStats(
+                        calls=2, wall_seconds=0.1, cpu_seconds=0.1, allocated_bytes=2048
+                    ),
+                }
+            }
+        )
+
+        lines = report.format().splitlines()
+        assert lines[0].split()[:3] == ["route", "phase", "calls"]
+        assert lines[1].split()[2] == "io"
+        assert "75.0%" in lines[1]
+        assert lines[2].split()[-1] == "2.0"
+        assert report.totals()["io"].wall_seconds == pytest.approx(0.3)
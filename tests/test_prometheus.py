@@ -0,0 +1,97 @@
+import urllib.error
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+
+from hevy_api.client import HevyClient
+from hevy_api.prometheus import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    @pytest.fixture
+    def client(self):
+        return HevyClient(api_key="test_token", rate_limit=1000)
+
+    @pytest.fixture
+    def registry(self, client):
+        registry = MetricsRegistry()
+        registry.register(client, account="main")
+        return registry
+
+    @patch("requests.Session.request")
+    def test_render(self, mock_request, client, registry, mock_response):
+        mock_request.side_effect = [
+            mock_response({"error": "Too many requests"}, 429, {"Retry-After": "0"}),
+            mock_response({"workout_count": 3}),
+        ]
+        client.get_workout_count()
+        client.get_workout_count()
+
+        with patch("hevy_api.cache.deep_sizeof") as sizeof:
+            lines = registry.render().splitlines()
+
+        # Scrapes must not walk the cached entries
+        sizeof.assert_not_called()
+
+        labels = 'account="main",method="GET",route="/v1/workouts/count"'
+        assert "# TYPE hevy_client_request_duration_seconds histogram" in lines
+        assert (
+            f'hevy_client_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2'
+            in (lines)
+        )
+        assert f"hevy_client_request_duration_seconds_count{{{labels}}} 2" in lines
+        assert f'hevy_client_requests_total{{{labels},status="429"}} 1' in lines
+        assert f'hevy_client_requests_total{{{labels},status="200"}} 1' in lines
+        assert f"hevy_client_retries_total{{{labels}}} 1" in lines
+        assert f"hevy_client_rate_limited_total{{{labels}}} 1" in lines
+        assert f"hevy_client_response_bytes_total{{{labels}}} 50" in lines
+        cache_labels = 'account="main",type="WorkoutCountResponse"'
+        assert (
+            f'hevy_client_cache_events_total{{{cache_labels},event="hits"}} 1' in lines
+        )
+        assert f"hevy_client_cache_entries{{{cache_labels}}} 1" in lines
+        assert f"hevy_client_cache_hit_ratio{{{cache_labels}}} 0.5" in lines
+        assert 'hevy_client_rate_limiter_acquisitions_total{account="main"} 2' in lines
+        assert 'hevy_client_skipped_writes_total{account="main"} 0' in lines
+
+    def test_histogram_buckets_are_cumulative(self, client, registry):
+        client.metrics.observe("GET", "/v1/workouts", 0.003, 200)
+        client.metrics.observe("GET", "/v1/workouts", 0.2, 200)
+
+        buckets = [
+            line
+            for line in registry.render().splitlines()
+            if line.startswith("hevy_client_request_duration_seconds_bucket")
+        ]
+        assert buckets[0].endswith('le="0.005"} 1')
+        assert buckets[5].endswith('le="0.25"} 2')
+        assert buckets[-1].endswith('le="+Inf"} 2')
+
+    def test_label_values_are_escaped(self, client):
+        registry = MetricsRegistry()
+        registry.register(client, account='a "quoted"\\name')
+
+        assert 'account="a \\"quoted\\"\\\\name"' in registry.render()
+
+    def test_empty_registry(self):
+        assert MetricsRegistry().render() == ""
+
+    def test_dump(self, registry, tmp_path):
+        path = tmp_path / "hevy.prom"
+        registry.dump(path)
+
+        assert "hevy_client_skipped_writes_total" in path.read_text()
+
+    def test_serve(self, registry):
+        server = registry.serve(port=0)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            with urllib.request.urlopen(f"{base_url}/metrics") as response:
+                assert response.headers["Content-Type"].startswith("text/plain")
+                assert b"hevy_client_skipped_writes_total" in response.read()
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"{base_url}/other")
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,118 @@
+import pytest
+
+from hevy_api.records import PersonalRecords, estimate_one_rep_max
+
+
+@pytest.fixture
+def lift(make_workout, exercise_data):
+    # A workout with a single exercise made of the given sets
+    def build(workout_id, sets, day=1, template_id="template-123"):
+        return make_workout(workout_id, day, [exercise_data(template_id, sets)])
+
+    return build
+
+
+class TestPersonalRecords:
+    def test_estimate_one_rep_max(self):
+        assert estimate_one_rep_max(100.0, 1) == 100.0
+        assert estimate_one_rep_max(90.0, 10) == pytest.approx(120.0)
+
+    def test_add_workout_tracks_bests(self, lift):
+        records = PersonalRecords()
+        improved = records.add_workout(
+            lift(
+                "workout-1",
+                [
+                    {"weight_kg": 80.0, "reps": 10},
+                    {"weight_kg": 100.0, "reps": 3},
+                    {"weight_kg": 80.0, "reps": 8},
+                ],
+            )
+        )
+
+        bench = records.get("template-123")
+        assert bench.best_weight_kg.value == 100.0
+        assert bench.best_weight_kg.workout_id == "workout-1"
+        assert bench.best_one_rep_max_kg.value == pytest.approx(110.0)
+        assert bench.best_reps_by_weight[80.0].value == 10
+        assert bench.best_reps_by_weight[100.0].value == 3
+        assert "best_weight_kg" in improved["template-123"]
+
+    def test_distance_and_duration(self, lift):
+        records = PersonalRecords()
+        records.add_workout(
+            lift(
+                "workout-1",
+                [
+                    {"distance_meters": 5000.0, "duration_seconds": 1500},
+                    {"distance_meters": 3000.0, "duration_seconds": 1800},
+                ],
+                template_id="running",
+            )
+        )
+
+        running = records.get("running")
+        assert running.longest_distance_meters.value == 5000.0
+        assert running.longest_duration_seconds.value == 1800
+        assert running.best_weight_kg is None
+
+    def test_warmup_sets_are_ignored(self, lift):
+        records = PersonalRecords()
+        workout = lift("workout-1", [{"weight_kg": 60.0, "reps": 5}])
+        workout.exercises[0].sets[0].type = "warmup"
+
+        assert records.add_workout(workout) == {}
+        assert records.get("template-123") is None
+
+    def test_only_improvements_are_reported(self, lift):
+        records = PersonalRecords()
+        records.add_workout(lift("workout-1", [{"weight_kg": 100.0, "reps": 5}]))
+
+        improved = records.add_workout(
+            lift("workout-2", [{"weight_kg": 90.0, "reps": 5}], day=2)
+        )
+
+        assert improved == {"template-123": ["best_reps_at_90kg"]}
+        assert records.get("template-123").best_weight_kg.workout_id == "workout-1"
+
+    def test_updating_a_workout_retracts_its_records(self, lift):
+        records = PersonalRecords()
+        records.add_workout(lift("workout-1", [{"weight_kg": 100.0, "reps": 5}]))
+        records.add_workout(lift("workout-2", [{"weight_kg": 120.0, "reps": 1}], day=2))
+
+        # The 120kg single was a typo, fixed to 102kg
+        records.add_workout(lift("workout-2", [{"weight_kg": 102.0, "reps": 1}], day=2))
+
+        bench = records.get("template-123")
+        assert bench.best_weight_kg.value == 102.0
+        assert 120.0 not in bench.best_reps_by_weight
+        assert bench.best_one_rep_max_kg.workout_id == "workout-1"
+
+    def test_remove_workout(self, lift):
+        records = PersonalRecords()
+        records.add_workout(lift("workout-1", [{"weight_kg": 100.0, "reps": 5}]))
+        records.add_workout(lift("workout-2", [{"weight_kg": 80.0, "reps": 5}], day=2))
+
+        records.remove_workout("workout-1")
+        assert records.get("template-123").best_weight_kg.value == 80.0
+
+        records.remove_workout("workout-2")
+        assert records.get("template-123") is None
+        assert records.workouts == {}
+
+    def test_save_and_load_round_trip(self, tmp_path, lift):
+        path = tmp_path / "records.json"
+        records = PersonalRecords()
+        records.add_workout(lift("workout-1", [{"weight_kg": 82.5, "reps": 5}]))
+        records.save(path)
+
+        loaded = PersonalRecords.load(path)
+        assert loaded == records
+        assert loaded.get("template-123").best_reps_by_weight[82.5].value == 5
+
+        # Loaded records keep updating incrementally
+        loaded.remove_workout("workout-1")
+        assert loaded.get("template-123") is None
+
+    def test_load_missing_file(self, tmp_path):
+        assert PersonalRecords.load(tmp_path / "missing.json") == PersonalRecords()
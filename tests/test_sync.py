@@ -0,0 +1,318 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from hevy_api.client import HevyClient
+from hevy_api.models.base import HevyAPIError
+from hevy_api.models.model import Workout
+from hevy_api.models.response import WorkoutResponse
+from hevy_api.records import PersonalRecords
+from hevy_api.sync import (
+    EPOCH,
+    Watermarks,
+    WorkoutEventSync,
+    sync_routines_since,
+    sync_workouts_since,
+)
+
+
+@pytest.fixture
+def bench_workout(workout_data, exercise_data):
+    # A workout of one bench press set, last changed at updated_at
+    def build(workout_id, updated_at, weight_kg=80.0):
+        return workout_data(
+            workout_id,
+            exercises=[exercise_data("bench", [{"weight_kg": weight_kg, "reps": 5}])],
+            updated_at=updated_at,
+        )
+
+    return build
+
+
+class TestWatermarks:
+    def test_persisted(self, tmp_path):
+        path = tmp_path / "watermarks.json"
+        watermarks = Watermarks(path)
+        assert watermarks.get("workouts") is None
+
+        mark = datetime(2024, 1, 15, 11, 0, tzinfo=timezone.utc)
+        watermarks.set("workouts", mark)
+
+        assert Watermarks(path).get("workouts") == mark
+
+
+class TestWorkoutEventSync:
+    @pytest.fixture
+    def client(self):
+        return HevyClient(api_key="test_token")
+
+    @pytest.fixture
+    def watermarks(self, tmp_path):
+        return Watermarks(tmp_path / "watermarks.json")
+
+    @patch("requests.Session.request")
+    def test_first_sync_replays_everything(
+        self, mock_request, client, watermarks, bench_workout, mock_pages
+    ):
+        mock_request.side_effect = mock_pages(
+            "events",
+            [
+                [
+                    {
+                        "type": "updated",
+                        "workout": bench_workout("w1", "2024-01-15T11:00:00Z"),
+                    },
+                    {
+                        "type": "updated",
+                        "workout": bench_workout("w2", "2024-01-16T11:00:00Z"),
+                    },
+                ],
+                [
+                    {
+                        "type": "deleted",
+                        "id": "w3",
+                        "deleted_at": "2024-01-17T09:00:00Z",
+                    }
+                ],
+            ],
+        )
+        records = PersonalRecords()
+
+        result = WorkoutEventSync(client, watermarks, sinks=[records]).sync()
+
+        assert [w.id for w in result.updated] == ["w1", "w2"]
+        assert result.deleted == ["w3"]
+        assert result.watermark == datetime(2024, 1, 17, 9, tzinfo=timezone.utc)
+        assert watermarks.get("workout_events") == result.watermark
+        assert records.get("bench").best_weight_kg.value == 80.0
+
+        urls = [call[1]["url"] for call in mock_request.call_args_list]
+        assert urls[0] == (
+            "https://api.hevyapp.com/v1/workouts/events"
+            "?page=1&pageSize=10&since=1970-01-01T00%3A00%3A00%2B00%3A00"
+        )
+        assert len(urls) == 2
+
+    @patch("requests.Session.request")
+    def test_applies_latest_event_per_workout(
+        self, mock_request, client, watermarks, bench_workout, mock_pages
+    ):
+        watermarks.set("workout_events", datetime(2024, 1, 1, tzinfo=timezone.utc))
+        mock_request.side_effect = mock_pages(
+            "events",
+            [
+                [
+                    {
+                        "type": "updated",
+                        "workout": bench_workout("w1", "2024-01-16T11:00:00Z", 90.0),
+                    },
+                    {
+                        "type": "updated",
+                        "workout": bench_workout("w1", "2024-01-15T11:00:00Z", 80.0),
+                    },
+                    {
+                        "type": "deleted",
+                        "id": "w2",
+                        "deleted_at": "2024-01-15T09:00:00Z",
+                    },
+                ]
+            ],
+        )
+        records = PersonalRecords()
+        records.add_workout(
+            Workout(**bench_workout("w2", "2024-01-10T11:00:00Z", 200.0))
+        )
+
+        result = WorkoutEventSync(client, watermarks, sinks=[records]).sync()
+
+        assert [w.id for w in result.updated] == ["w1"]
+        assert result.deleted == ["w2"]
+        assert records.get("bench").best_weight_kg.value == 90.0
+        url = mock_request.call_args[1]["url"]
+        assert "since=2024-01-01T00%3A00%3A00%2B00%3A00" in url
+
+    @patch("requests.Session.request")
+    def test_updates_client_cache(
+        self, mock_request, client, watermarks, bench_workout, mock_pages
+    ):
+        mock_request.side_effect = mock_pages(
+            "events",
+            [
+                [
+                    {
+                        "type": "updated",
+                        "workout": bench_workout("w1", "2024-01-16T11:00:00Z"),
+                    },
+                    {
+                        "type": "deleted",
+                        "id": "w2",
+                        "deleted_at": "2024-01-16T12:00:00Z",
+                    },
+                ]
+            ],
+        )
+        stale = WorkoutResponse(
+            data=bench_workout("w2", "2024-01-10T11:00:00Z"),
+            status_code=200,
+            headers={},
+        )
+        client._cache["w2"] = stale
+        client._cache["WorkoutsResponse:1:5"] = stale
+        client._cache["WorkoutCountResponse"] = stale
+
+        WorkoutEventSync(client, watermarks).sync()
+
+        assert client._cache["w1"].workout.updated_at == datetime(
+            2024, 1, 16, 11, tzinfo=timezone.utc
+        )
+        assert "w2" not in client._cache
+        assert "WorkoutsResponse:1:5" not in client._cache
+        assert "WorkoutCountResponse" not in client._cache
+
+    @patch("requests.Session.request")
+    def test_no_changes_keeps_watermark(
+        self, mock_request, client, watermarks, mock_pages
+    ):
+        mock_request.side_effect = mock_pages("events", [[]])
+
+        result = WorkoutEventSync(client, watermarks).sync()
+
+        assert result.updated == []
+        assert result.watermark == EPOCH
+        assert watermarks.get("workout_events") is None
+
+    @patch("requests.Session.request")
+    def test_malformed_page_does_not_move_watermark(
+        self, mock_request, client, watermarks, bench_workout, mock_pages
+    ):
+        mock_request.side_effect = mock_pages(
+            "events",
+            [
+                [{"type": "deleted", "id": "w1", "deleted_at": "2024-01-15T09:00:00Z"}],
+                [{"type": "updated", "workout": {"id": "w2"}}],
+                [
+                    {
+                        "type": "updated",
+                        "workout": bench_workout("w3", "2024-01-17T11:00:00Z"),
+                    }
+                ],
+            ],
+        )
+
+        # Skipping page 2 would move the mark past w2 for good
+        with pytest.raises(HevyAPIError, match="could not be parsed"):
+            WorkoutEventSync(client, watermarks).sync()
+        assert watermarks.get("workout_events") is None
+        assert mock_request.call_count == 2
+
+    @patch("requests.Session.request")
+    def test_error_does_not_move_watermark(
+        self, mock_request, client, watermarks, mock_response
+    ):
+        mock_request.return_value = mock_response({"error": "Server error"}, 500)
+
+        with pytest.raises(HevyAPIError):
+            WorkoutEventSync(client, watermarks).sync()
+        assert watermarks.get("workout_events") is None
+
+
+def routine_data(routine_id, updated_at):
+    return {
+        "id": routine_id,
+        "title": "Push Day",
+        "folder_id": None,
+        "updated_at": updated_at,
+        "created_at": "2024-01-01T10:00:00Z",
+        "exercises": [],
+    }
+
+
+class TestDeltaSync:
+    @pytest.fixture
+    def client(self):
+        return HevyClient(api_key="test_token")
+
+    @patch("requests.Session.request")
+    def test_stops_at_first_unchanged_page(
+        self, mock_request, client, bench_workout, mock_pages
+    ):
+        mock_request.side_effect = mock_pages(
+            "workouts",
+            [
+                [
+                    bench_workout("w5", "2024-01-20T11:00:00Z"),
+                    bench_workout("w4", "2024-01-19T11:00:00Z"),
+                ],
+                [
+                    bench_workout("w3", "2024-01-18T11:00:00Z"),
+                    bench_workout("w2", "2024-01-10T11:00:00Z"),
+                ],
+                [bench_workout("w1", "2024-01-09T11:00:00Z")],
+                [bench_workout("w0", "2024-01-08T11:00:00Z")],
+            ],
+        )
+        since = datetime(2024, 1, 15, tzinfo=timezone.utc)
+
+        result = sync_workouts_since(client, since, page_size=2)
+
+        assert [w.id for w in result.updated] == ["w5", "w4", "w3"]
+        assert result.watermark == datetime(2024, 1, 20, 11, tzinfo=timezone.utc)
+        # Page 3 holds nothing new, so page 4 is never requested
+        assert mock_request.call_count == 3
+        assert client._cache["w5"].workout.id == "w5"
+
+    @patch("requests.Session.request")
+    def test_first_sync_reads_everything(
+        self, mock_request, client, bench_workout, mock_pages
+    ):
+        mock_request.side_effect = mock_pages(
+            "workouts",
+            [
+                [bench_workout("w2", "2024-01-10T11:00:00Z")],
+                [bench_workout("w1", "2024-01-09T11:00:00Z")],
+            ],
+        )
+
+        result = sync_workouts_since(client, None)
+
+        assert [w.id for w in result.updated] == ["w2", "w1"]
+        assert mock_request.call_count == 2
+
+    @patch("requests.Session.request")
+    def test_nothing_changed(self, mock_request, client, bench_workout, mock_pages):
+        mock_request.side_effect = mock_pages(
+            "workouts", [[bench_workout("w1", "2024-01-09T11:00:00Z")], []]
+        )
+        since = datetime(2024, 1, 15, tzinfo=timezone.utc)
+
+        result = sync_workouts_since(client, since)
+
+        assert result.updated == []
+        assert result.watermark == since
+        assert mock_request.call_count == 1
+
+    @patch("requests.Session.request")
+    def test_routines(self, mock_request, client, tmp_path, mock_pages):
+        mock_request.side_effect = mock_pages(
+            "routines",
+            [
+                [
+                    routine_data("r2", "2024-01-20T11:00:00Z"),
+                    routine_data("r1", "2024-01-01T11:00:00Z"),
+                ],
+                [routine_data("r0", "2023-12-01T11:00:00Z")],
+            ],
+        )
+        watermarks = Watermarks(tmp_path / "watermarks.json")
+        watermarks.set("routines", datetime(2024, 1, 15, tzinfo=timezone.utc))
+
+        result = sync_routines_since(client, watermarks.get("routines"))
+        watermarks.set("routines", result.watermark)
+
+        assert [r.id for r in result.updated] == ["r2"]
+        assert client._cache["r2"].routine.id == "r2"
+        assert Watermarks(tmp_path / "watermarks.json").get("routines") == (
+            datetime(2024, 1, 20, 11, tzinfo=timezone.utc)
+        )
+        assert mock_request.call_count == 2
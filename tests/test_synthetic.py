@@ -0,0 +1,88 @@
+import json
+
+from hevy_api.client import HevyClient
+from hevy_api.models.model import ExerciseTemplate, Routine, Workout
+from hevy_api.testing import FakeHevyServer, SyntheticConfig, SyntheticData
+
+
+class TestSyntheticData:
+    def test_payloads_are_valid(self):
+        data = SyntheticData(seed=1)
+
+        workouts = [Workout(**payload) for payload in data.workouts(200)]
+        routines = [Routine(**payload) for payload in data.routines(20)]
+        templates = [ExerciseTemplate(**p) for p in data.exercise_templates()]
+
+        assert len({workout.id for workout in workouts}) == 200
+        assert all(w.start_time < w.end_time <= w.updated_at for w in workouts)
+        # Newest first, like the API
+        assert [w.updated_at for w in workouts] == sorted(
+            (w.updated_at for w in workouts), reverse=True
+        )
+        assert len(routines) == 20
+        assert any(template.is_custom for template in templates)
+        template_ids = {template.id for template in templates}
+        assert all(
+            exercise.exercise_template_id in template_ids
+            for workout in workouts
+            for exercise in workout.exercises
+        )
+
+    def test_seeded_and_random_access(self):
+        first = list(SyntheticData(seed=7).workouts(50))
+
+        assert list(SyntheticData(seed=7).workouts(50)) == first
+        assert SyntheticData(seed=7).workout(42) == first[42]
+        assert list(SyntheticData(seed=7).workouts(10, offset=40)) == first[40:]
+        assert SyntheticData(seed=8).workout(0) != first[0]
+
+    def test_distributions_are_tunable(self):
+        config = SyntheticConfig(
+            exercises_per_workout=(2, 2),
+            sets_per_exercise=(4, 4),
+            notes_probability=1.0,
+            rpe_probability=0.0,
+            custom_metric_probability=0.0,
+        )
+        workouts = list(SyntheticData(config=config).workouts(20))
+
+        exercises = [exercise for w in workouts for exercise in w["exercises"]]
+        sets = [s for exercise in exercises for s in exercise["sets"]]
+        assert len(exercises) == 40
+        assert len(sets) == 160
+        assert all(exercise["notes"] for exercise in exercises)
+        assert all(s["rpe"] is None and s["custom_metric"] is None for s in sets)
+
+    def test_optional_set_fields_are_sparse(self):
+        sets = [
+            s
+            for workout in SyntheticData(seed=3).workouts(300)
+            for exercise in workout["exercises"]
+            for s in exercise["sets"]
+        ]
+
+        weighted = sum(s["weight_kg"] is not None for s in sets)
+        assert 0.5 < weighted / len(sets) < 0.9
+        assert any(s["duration_seconds"] is not None for s in sets)
+        assert any(s["distance_meters"] is not None for s in sets)
+        assert {s["type"] for s in sets} >= {"normal", "warmup"}
+
+    def test_json_bytes(self):
+        data = SyntheticData(seed=2)
+
+        (encoded,) = data.workouts_json(1, offset=5)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == data.workout(5)
+        assert Workout.model_validate_json(encoded).id == data.workout(5)["id"]
+
+
+class TestSyntheticServer:
+    def test_serves_generated_data(self):
+        with FakeHevyServer.synthetic(workouts=30, routines=3, seed=4) as server:
+            client = HevyClient(api_key="test_token", base_url=server.url)
+            page = client.get_workouts(page_number=1, page_size=10)
+
+            assert page.page_count == 3
+            assert page.workouts[0].id == SyntheticData(seed=4).workout(0)["id"]
+            assert client.get_routines(page_size=10).page_count == 1
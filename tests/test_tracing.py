@@ -0,0 +1,192 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from hevy_api.catalog import ExerciseTemplateCatalog
+from hevy_api.client import HevyClient
+from hevy_api.export import export_workouts
+from hevy_api.sync import sync_workouts_since
+from hevy_api.tracing import InMemoryExporter, JsonLinesExporter, Tracer
+
+
+def tree(spans):
+    # Nested (name, children) tuples, children in the order they started
+    children = {}
+    for span in sorted(spans, key=lambda s: s.start_time):
+        children.setdefault(span.parent_id, []).append(span)
+
+    def build(span):
+        return (span.name, [build(child) for child in children.get(span.span_id, [])])
+
+    return [build(root) for root in children[None]]
+
+
+class TestTracing:
+    @pytest.fixture
+    def exporter(self):
+        return InMemoryExporter()
+
+    @pytest.fixture
+    def client(self, exporter):
+        return HevyClient(api_key="test_token", tracer=Tracer(exporter))
+
+    @patch("requests.Session.request")
+    def test_spans_for_a_retried_call(
+        self, mock_request, client, exporter, mock_response, workout_data
+    ):
+        mock_request.side_effect = [
+            mock_response({"error": "Too many requests"}, 429, {"Retry-After": "0"}),
+            mock_response(workout_data("w1")),
+        ]
+
+        client.get_workout("w1")
+
+        assert tree(exporter.spans) == [
+            (
+                "hevy.get",
+                [
+                    (
+                        "hevy.execute",
+                        [
+                            ("http.attempt", [("json.decode", [])]),
+                            ("http.attempt", [("json.decode", [])]),
+                            ("validate", []),
+                        ],
+                    )
+                ],
+            )
+        ]
+        by_name = {span.name: span for span in exporter.spans}
+        assert by_name["hevy.get"].attributes["source"] == "api"
+        assert by_name["hevy.execute"].attributes == {
+            "method": "GET",
+            "route": "/v1/workouts/{workoutId}",
+            "status_code": 200,
+        }
+        assert by_name["validate"].attributes["response_type"] == "WorkoutResponse"
+        assert len({span.trace_id for span in exporter.spans}) == 1
+        attempts = [s for s in exporter.spans if s.name == "http.attempt"]
+        assert [s.attributes["status_code"] for s in attempts] == [429, 200]
+
+    @patch("requests.Session.request")
+    def test_cache_hits_have_no_children(
+        self, mock_request, client, exporter, mock_response, workout_data
+    ):
+        mock_request.return_value = mock_response(workout_data("w1"))
+        client.get_workout("w1")
+        exporter.spans.clear()
+
+        client.get_workout("w1")
+
+        (span,) = exporter.spans
+        assert span.attributes["source"] == "cache"
+
+    @patch("requests.Session.request")
+    def test_batch_spans_nest_under_caller(
+        self, mock_request, client, exporter, mock_response, workout_data, make_workout
+    ):
+        mock_request.return_value = mock_response(workout_data("w1"))
+        workout = make_workout("w1")
+
+        with client.tracer.span("import") as parent:
+            client.create_workouts([workout, workout.model_copy(update={"title": "B"})])
+
+        executes = [s for s in exporter.spans if s.name == "hevy.execute"]
+        assert len(executes) == 2
+        assert {s.parent_id for s in executes} == {parent.span_id}
+        assert {s.trace_id for s in exporter.spans} == {parent.trace_id}
+
+    @patch("requests.Session.request")
+    def test_paged_operations_group_their_pages(
+        self, mock_request, client, exporter, tmp_path, mock_pages, workout_data
+    ):
+        pages = [[workout_data("w1", day=2)], [workout_data("w2", day=1)]]
+        mock_request.side_effect = mock_pages("workouts", pages)
+
+        sync_workouts_since(client, None, page_size=1)
+        export_workouts(client, tmp_path / "workouts.ndjson", page_size=1)
+
+        for name in ("hevy.sync_workouts", "hevy.export_workouts"):
+            (operation,) = [s for s in exporter.spans if s.name == name]
+            executes = [
+                s
+                for s in exporter.spans
+                if s.name == "hevy.execute" and s.parent_id == operation.span_id
+            ]
+            assert [s.attributes["page"] for s in executes] == [1, 2]
+
+    @patch("requests.Session.request")
+    def test_pool_spans_join_the_callers_trace(
+        self, mock_request, client, exporter, mock_pages, mock_response
+    ):
+        templates = [
+            {
+                "id": template_id,
+                "title": template_id.title(),
+                "type": "weight_reps",
+                "primary_muscle_group": "chest",
+                "secondary_muscle_groups": [],
+            }
+            for template_id in ("bench", "dips", "fly")
+        ]
+        template_pages = mock_pages("exercise_templates", [[t] for t in templates])
+
+        def respond(method, url, headers, json):
+            if "?" in url:
+                return template_pages(method, url, headers, json)
+            template_id = url.rsplit("/", 1)[1]
+            return mock_response(next(t for t in templates if t["id"] == template_id))
+
+        mock_request.side_effect = respond
+
+        with client.tracer.span("startup") as parent:
+            ExerciseTemplateCatalog().refresh(client, max_workers=2)
+            client.resolve_template_ids(["bench", "dips"])
+
+        (fetch,) = [
+            s for s in exporter.spans if s.name == "hevy.fetch_exercise_templates"
+        ]
+        pages = [s for s in exporter.spans if s.attributes.get("page") is not None]
+        assert sorted(s.attributes["page"] for s in pages) == [1, 2, 3]
+        assert {s.parent_id for s in pages} == {fetch.span_id}
+        gets = [s for s in exporter.spans if s.name == "hevy.get"]
+        assert len(gets) == 2
+        assert {s.parent_id for s in gets} == {parent.span_id}
+        assert {s.trace_id for s in exporter.spans} == {parent.trace_id}
+
+    def test_errors_are_recorded(self, exporter):
+        tracer = Tracer(exporter)
+        with pytest.raises(RuntimeError), tracer.span("outer"):
+            raise RuntimeError("boom")
+
+        (span,) = exporter.spans
+        assert span.status == "error"
+        assert "boom" in span.attributes["error"]
+
+    @patch("requests.Session.request")
+    def test_json_lines_exporter(
+        self, mock_request, tmp_path, mock_response, workout_data
+    ):
+        mock_request.return_value = mock_response(workout_data("w1"))
+        exporter = JsonLinesExporter(tmp_path / "spans.jsonl")
+        client = HevyClient(api_key="test_token", tracer=Tracer(exporter))
+
+        client.get_workout("w1")
+        exporter.close()
+
+        spans = [
+            json.loads(line)
+            for line in (tmp_path / "spans.jsonl").read_text().splitlines()
+        ]
+        assert [span["name"] for span in spans][-1] == "hevy.get"
+        assert all(span["duration"] >= 0 for span in spans)
+        assert spans[0]["parent_id"] is not None
+
+    @patch("requests.Session.request")
+    def test_disabled_by_default(self, mock_request, mock_response, workout_data):
+        mock_request.return_value = mock_response(workout_data("w1"))
+        client = HevyClient(api_key="test_token")
+
+        assert client.tracer is None
+        assert client.get_workout("w1").is_success